@@ -1,8 +1,10 @@
 from .builder import Builder, Model
 
 # Must be imported in order to register the build functions
+from .assoc_mem import build_associative_memory
 from .connection import build_connection
 from .ensemble import build_ensemble
+from .ensemblearray import build_ensemblearray
 from .learning_rules import build_bcm, build_oja, build_pes
 from .network import build_network
 from .neurons import build_lif, build_lifrate, build_alif, build_alifrate
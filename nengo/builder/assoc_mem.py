@@ -0,0 +1,30 @@
+import collections
+
+from nengo.builder.builder import Builder
+from nengo.builder.network import build_network, build_shared_network
+from nengo.networks.assoc_mem import AssociativeMemory
+
+
+@Builder.register(AssociativeMemory)
+def build_associative_memory(model, am):
+    """Builds an AssociativeMemory, sharing parameters if requested.
+
+    If ``am.share_params`` is set, the ensembles with the same threshold,
+    and their connections to ``elem_output``, are given the same seed.
+    These ensembles are then identical, so their decoders are solved for
+    once and reused.
+    """
+    if not am.share_params:
+        build_network(model, am)
+        return
+
+    thresholds = dict(zip(am.am_ensembles, am.threshold))
+    groups = collections.OrderedDict()
+    for ens in am.am_ensembles:
+        groups.setdefault(thresholds[ens], ([], []))[0].append(ens)
+    for conn in am.connections:
+        if conn.pre_obj in thresholds and conn.post_obj is am.elem_output:
+            groups[thresholds[conn.pre_obj]][1].append(conn)
+
+    build_shared_network(model, am, [
+        group for ens_conns in groups.values() for group in ens_conns])
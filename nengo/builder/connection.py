@@ -1,23 +1,30 @@
 import collections
+import warnings
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
 import nengo.utils.numpy as npext
 from nengo.builder.builder import Builder
 from nengo.builder.ensemble import gen_eval_points, get_activities
+from nengo.builder.neurons import build_spike_indices
 from nengo.builder.node import SimPyFunc
 from nengo.builder.operator import (
-    DotInc, ElementwiseInc, PreserveValue, Reset, SlicedCopy)
+    DotInc, ElementwiseInc, PreserveValue, Reset, SlicedCopy, SparseDotInc,
+    SpikeDotInc)
 from nengo.builder.signal import Signal
 from nengo.connection import Connection
 from nengo.ensemble import Ensemble, Neurons
 from nengo.neurons import Direct
 from nengo.node import Node
+from nengo.rc import rc
 from nengo.utils.compat import is_iterable, itervalues
+from nengo.utils.connection import TargetFunction
+from nengo.utils.rng import make_rng
 
 
 BuiltConnection = collections.namedtuple(
-    'BuiltConnection', ['eval_points', 'solver_info', 'weights'])
+    'BuiltConnection', ['eval_points', 'solver_info', 'weights', 'factors'])
 
 
 class ZeroActivityError(RuntimeError):
@@ -35,12 +42,64 @@ def get_eval_points(model, conn, rng):
 
 def get_targets(model, conn, eval_points):
     if conn.function is None:
-        targets = eval_points[:, conn.pre_slice]
-    else:
+        return eval_points[:, conn.pre_slice]
+
+    eval_points = eval_points[:, conn.pre_slice]
+    if (isinstance(conn.function, TargetFunction)
+            and np.array_equal(eval_points, conn.function.eval_points)):
+        return conn.function.targets
+
+    targets = None
+    if conn.vectorized or conn.vectorized is None:
+        targets = call_vectorized(conn.function, eval_points, conn.size_mid,
+                                  check=conn.vectorized is None)
+    if targets is None:
         targets = np.zeros((len(eval_points), conn.size_mid))
-        for i, ep in enumerate(eval_points[:, conn.pre_slice]):
-            targets[i] = conn.function(ep)
+        n_threads = rc.getint('builder', 'threads')
+        if n_threads > 1 and len(eval_points) > 1:
+            pool = ThreadPool(n_threads)
+            try:
+                results = pool.map(conn.function, eval_points)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = (conn.function(ep) for ep in eval_points)
+        for i, target in enumerate(results):
+            targets[i] = target
+
+    return targets
 
+
+def call_vectorized(function, eval_points, size_out, check=True):
+    """Evaluate ``function`` on all ``eval_points`` with a single call.
+
+    If ``check`` is True, this is a trial call: it returns None if
+    ``function`` fails on the whole array, returns the wrong shape, or
+    disagrees with per-point calls on a few of the evaluation points.
+    """
+    n = len(eval_points)
+    if not check:
+        targets = np.asarray(function(eval_points), dtype=np.float64)
+        return targets.reshape(n, size_out)
+
+    try:
+        with warnings.catch_warnings(), np.errstate(all='ignore'):
+            warnings.simplefilter('ignore')
+            targets = np.asarray(function(eval_points), dtype=np.float64)
+    except Exception:
+        return None
+
+    if targets.shape != (n, size_out) and not (
+            size_out == 1 and targets.shape == (n,)):
+        return None
+    targets = targets.reshape(n, size_out)
+
+    for i in sorted(set([0, n // 2, n - 1])):
+        target = np.asarray(function(eval_points[i]), dtype=np.float64)
+        if target.size != size_out or not np.allclose(
+                targets[i], target.ravel()):
+            return None
     return targets
 
 
@@ -57,6 +116,18 @@ def build_linear_system(model, conn, rng):
     return eval_points, activities, targets
 
 
+def is_factored(conn):
+    """Whether the weights of ``conn`` are kept as encoders and decoders.
+
+    Learning rules need the full weight matrix, so learned connections
+    are never factored.
+    """
+    return (isinstance(conn.pre_obj, Ensemble)
+            and not isinstance(conn.pre_obj.neuron_type, Direct)
+            and conn.solver.weights and conn.solver.factored
+            and conn.solver.compositional and conn.learning_rule is None)
+
+
 def build_decoders(model, conn, rng):
     encoders = model.params[conn.pre_obj].encoders
     gain = model.params[conn.pre_obj].gain
@@ -71,6 +142,10 @@ def build_decoders(model, conn, rng):
         E = model.params[conn.post_obj].scaled_encoders.T[conn.post_slice]
         # include transform in solved weights
         targets = multiply(targets, conn.transform.T)
+        if is_factored(conn):
+            # solve for decoders into the post space; the encoders are
+            # applied separately in the simulation
+            E = np.eye(E.shape[0])
 
     try:
         wrapped_solver = model.decoder_cache.wrap_solver(solve_for_decoders)
@@ -101,7 +176,9 @@ def solve_for_decoders(
 
 
 def multiply(x, y):
-    if x.ndim <= 2 and y.ndim < 2:
+    if npext.is_sparse(x) or npext.is_sparse(y):
+        return multiply_sparse(x, y)
+    elif x.ndim <= 2 and y.ndim < 2:
         return x * y
     elif x.ndim < 2 and y.ndim == 2:
         return x.reshape(-1, 1) * y
@@ -112,6 +189,36 @@ def multiply(x, y):
                          % (x.ndim, y.ndim))
 
 
+def multiply_sparse(x, y):
+    """Like ``multiply``, where either ``x`` or ``y`` is a sparse matrix.
+
+    Products with dense matrices are returned as dense arrays, while
+    elementwise scalings of a sparse matrix stay sparse.
+    """
+    if npext.is_sparse(x) and npext.is_sparse(y):
+        return x.dot(y).tocsr()
+    elif npext.is_sparse(x):
+        y = np.asarray(y)
+        return x.dot(y) if y.ndim == 2 else x.multiply(y).tocsr()
+    else:
+        x = np.asarray(x)
+        if x.ndim == 2:
+            return y.T.dot(x.T).T
+        return y.multiply(x.reshape(-1, 1) if x.ndim == 1 else x).tocsr()
+
+
+def sparsify(weights):
+    """Returns ``weights`` as a sparse matrix.
+
+    Weights are left as dense arrays if SciPy is not installed.
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        return weights
+    return scipy.sparse.csr_matrix(weights)
+
+
 def slice_signal(model, signal, sl):
     assert signal.ndim == 1
     if isinstance(sl, slice) and (sl.step is None or sl.step == 1):
@@ -123,10 +230,39 @@ def slice_signal(model, signal, sl):
         return sliced_signal
 
 
+def get_spike_signals(model, conn):
+    """Returns the spike index signals of ``conn.pre``, if it has them.
+
+    These are only available when the pre object is a spiking population
+    and the connection reads all of its neurons. They are created by the
+    first connection that uses them (see ``build_spike_indices``).
+    """
+    if isinstance(conn.pre_obj, Ensemble):
+        neurons = conn.pre_obj.neurons
+    elif (isinstance(conn.pre_obj, Neurons)
+          and isinstance(conn.pre_slice, slice)
+          and conn.pre_slice == slice(None)):
+        neurons = conn.pre_obj
+    else:
+        return None
+
+    return build_spike_indices(model, neurons)
+
+
+def materialize_weights(model, conn):
+    """Forms the full weight matrix signal of a factored connection."""
+    if 'weights' not in model.sig[conn]:
+        encoders, decoders = model.params[conn].factors
+        model.sig[conn]['weights'] = Signal(
+            np.dot(encoders, decoders), name="%s.weights" % conn)
+        model.add_op(PreserveValue(model.sig[conn]['weights']))
+    return model.sig[conn]['weights']
+
+
 @Builder.register(Connection)  # noqa: C901
 def build_connection(model, conn):
     # Create random number generator
-    rng = np.random.RandomState(model.seeds[conn])
+    rng = make_rng(model.seeds[conn])
 
     # Get input and output connections from pre and post
     def get_prepost_signal(is_pre):
@@ -148,6 +284,7 @@ def build_connection(model, conn):
     model.sig[conn]['out'] = get_prepost_signal(is_pre=False)
 
     weights = None
+    factors = None
     eval_points = None
     solver_info = None
     signal_size = conn.size_out
@@ -176,7 +313,26 @@ def build_connection(model, conn):
             model.sig[conn]['out'] = model.sig[conn.post_obj.neurons]['in']
             signal_size = conn.post_obj.neurons.size_in
             post_slice = Ellipsis  # don't apply slice later
-            weights = decoders.T
+            if is_factored(conn):
+                # decode into the (sliced) post space, then encode
+                encoders = model.params[conn.post_obj].scaled_encoders[
+                    :, conn.post_slice]
+                factors = (encoders, decoders.T)
+                model.sig[conn]['decoders'] = Signal(
+                    decoders.T, name="%s.decoders" % conn)
+                decoded = Signal(
+                    np.zeros(decoders.shape[1]), name="%s.decoded" % conn)
+                model.add_op(Reset(decoded))
+                model.add_op(DotInc(model.sig[conn]['decoders'],
+                                    in_signal,
+                                    decoded,
+                                    tag="%s.decoders_dotinc" % conn))
+                in_signal = decoded
+                weights = encoders
+            elif conn.solver.sparse:
+                weights = sparsify(decoders.T)
+            else:
+                weights = decoders.T
         else:
             weights = multiply(conn.transform, decoders.T)
     else:
@@ -184,7 +340,8 @@ def build_connection(model, conn):
 
     # Add operator for applying weights
     if weights is None:
-        weights = np.array(conn.transform)
+        weights = (conn.transform.copy() if npext.is_sparse(conn.transform)
+                   else np.array(conn.transform))
 
     if isinstance(conn.post_obj, Neurons):
         gain = model.params[conn.post_obj.ensemble].gain[post_slice]
@@ -193,14 +350,47 @@ def build_connection(model, conn):
     if conn.learning_rule is not None and weights.ndim < 2:
         raise ValueError("Learning connection must have full transform matrix")
 
-    model.sig[conn]['weights'] = Signal(weights, name="%s.weights" % conn)
+    if factors is not None:
+        # the full weights are only formed if probed (see materialize_weights)
+        weights_sig = model.sig[conn]['encoders'] = Signal(
+            weights, name="%s.encoders" % conn)
+    elif npext.is_sparse(weights):
+        # only the nonzero weights are stored in the signal
+        weights_sig = model.sig[conn]['weights'] = Signal(
+            weights.data, name="%s.weights" % conn)
+    else:
+        weights_sig = model.sig[conn]['weights'] = Signal(
+            weights, name="%s.weights" % conn)
     signal = Signal(np.zeros(signal_size), name="%s.weighted" % conn)
     model.add_op(Reset(signal))
-    op = ElementwiseInc if weights.ndim < 2 else DotInc
-    model.add_op(op(model.sig[conn]['weights'],
-                    in_signal,
-                    signal,
-                    tag="%s.weights_elementwiseinc" % conn))
+    spike_signals = (
+        get_spike_signals(model, conn) if factors is None
+        and not npext.is_sparse(weights) and weights.ndim == 2 else None)
+    if npext.is_sparse(weights):
+        model.add_op(SparseDotInc(weights_sig,
+                                  in_signal,
+                                  signal,
+                                  weights.indices,
+                                  weights.indptr,
+                                  tag="%s.weights_sparsedotinc" % conn))
+    elif weights.ndim < 2:
+        model.add_op(ElementwiseInc(weights_sig,
+                                    in_signal,
+                                    signal,
+                                    tag="%s.weights_elementwiseinc" % conn))
+    elif spike_signals is not None:
+        n_spikes, spike_indices = spike_signals
+        model.add_op(SpikeDotInc(weights_sig,
+                                 model.sig[conn.pre_obj]['out'],
+                                 signal,
+                                 n_spikes,
+                                 spike_indices,
+                                 tag="%s.weights_spikedotinc" % conn))
+    else:
+        model.add_op(DotInc(weights_sig,
+                            in_signal,
+                            signal,
+                            tag="%s.weights_elementwiseinc" % conn))
 
     # Add operator for filtering
     if conn.synapse is not None:
@@ -211,6 +401,12 @@ def build_connection(model, conn):
         signal, model.sig[conn]['out'], b_slice=post_slice,
         inc=True, tag="%s.gain" % conn))
 
+    model.params[conn] = BuiltConnection(
+        eval_points=eval_points,
+        solver_info=solver_info,
+        weights=weights if factors is None else None,
+        factors=factors)
+
     # Build learning rules
     if conn.learning_rule is not None:
         model.add_op(PreserveValue(model.sig[conn]['weights']))
@@ -221,7 +417,3 @@ def build_connection(model, conn):
                 model.build(r)
         elif rule is not None:
             model.build(rule)
-
-    model.params[conn] = BuiltConnection(eval_points=eval_points,
-                                         solver_info=solver_info,
-                                         weights=weights)
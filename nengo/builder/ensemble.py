@@ -11,6 +11,7 @@ from nengo.dists import Distribution
 from nengo.ensemble import Ensemble
 from nengo.neurons import Direct
 from nengo.utils.builder import default_n_eval_points
+from nengo.utils.rng import make_rng
 
 
 BuiltEnsemble = collections.namedtuple(
@@ -51,7 +52,7 @@ def get_activities(model, ens, eval_points):
 @Builder.register(Ensemble)  # noqa: C901
 def build_ensemble(model, ens):
     # Create random number generator
-    rng = np.random.RandomState(model.seeds[ens])
+    rng = make_rng(model.seeds[ens])
 
     eval_points = gen_eval_points(ens, ens.eval_points, rng=rng)
 
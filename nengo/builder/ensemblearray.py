@@ -0,0 +1,119 @@
+import collections
+
+from nengo.builder.builder import Builder
+from nengo.builder.network import build_network, build_shared_network
+from nengo.builder.operator import (
+    BlockInc, DotInc, ElementwiseInc, Reset, SlicedCopy, SpikeDotInc)
+from nengo.networks.ensemblearray import EnsembleArray
+from nengo.node import Node
+
+
+def full_signal(sig):
+    """Returns the base of ``sig`` if ``sig`` views all of it."""
+    base = sig.base
+    if (sig.offset == 0 and sig.shape == base.shape
+            and sig.elemstrides == base.elemstrides):
+        return base
+    return sig
+
+
+def find_connection_ops(model, conn, users):
+    """Finds the operators applying the weights of ``conn``.
+
+    For a connection without a synapse or learning rule, these are a Reset
+    of the weighted signal, the weight multiplication, and the copy into
+    the post signal. Returns the weights, input, and output signals and
+    the three operators, or None if the connection was built differently.
+    """
+    if conn.synapse is not None or conn.learning_rule is not None:
+        return None
+    weights = model.sig[conn].get('weights', None)
+    if weights is None or len(users[weights]) != 1:
+        return None
+
+    inc = users[weights][0]
+    if type(inc) not in (ElementwiseInc, DotInc, SpikeDotInc):
+        return None
+    ops = [op for op in users[inc.Y] if op is not inc]
+    if len(ops) != 2:
+        return None
+    reset, copy = sorted(ops, key=lambda op: not isinstance(op, Reset))
+    if (not isinstance(reset, Reset) or reset.value != 0
+            or not isinstance(copy, SlicedCopy) or not copy.inc
+            or copy.a is not inc.Y or copy.a_slice is not Ellipsis):
+        return None
+
+    out = copy.b
+    if isinstance(copy.b_slice, slice) and copy.b_slice.step in (None, 1):
+        out = out[copy.b_slice]
+    elif copy.b_slice is not Ellipsis:
+        return None
+    return weights, full_signal(inc.X), full_signal(out), [reset, inc, copy]
+
+
+def is_block(sigs):
+    """Whether ``sigs`` can be laid out back to back in one array."""
+    if all(sig.base is sig for sig in sigs):
+        return len(set(sigs)) == len(sigs)
+    base = sigs[0].base
+    return all(sig.base is base and sig.elemstrides == (1,)
+               for sig in sigs) and all(
+                   a.offset + a.size == b.offset
+                   for a, b in zip(sigs[:-1], sigs[1:]))
+
+
+@Builder.register(EnsembleArray)
+def build_ensemblearray(model, ea):
+    """Builds an EnsembleArray with one operator per set of connections.
+
+    The array is built like any other network, so the sub-ensembles and
+    their connections are still available in ``model.params``. Then the
+    operators of the connections between each node of the array (e.g.,
+    ``input`` or an output added with ``add_output``) and the sub-ensembles
+    are replaced by a single `BlockInc`, which applies all of their
+    (block-diagonal) weights at once.
+
+    If ``ea.share_params`` is set, all sub-ensembles are given the same
+    seed, as are the connections of each node, so that each output's
+    decoders are solved for once and reused by every sub-ensemble.
+    """
+    groups = collections.OrderedDict()
+    for conn in ea.connections:
+        node = conn.pre_obj if isinstance(conn.pre_obj, Node) else (
+            conn.post_obj)
+        if isinstance(node, Node) and node in ea.nodes:
+            groups.setdefault(node, []).append(conn)
+
+    start = len(model.operators)
+    if ea.share_params:
+        build_shared_network(
+            model, ea, [ea.ea_ensembles] + list(groups.values()))
+    else:
+        build_network(model, ea)
+    ops = model.operators[start:]
+
+    users = collections.defaultdict(list)
+    for op in ops:
+        for sig in op.all_signals:
+            users[sig].append(op)
+
+    removed = set()
+    blocks = []
+    for node, conns in groups.items():
+        found = [find_connection_ops(model, conn, users) for conn in conns]
+        found = [f for f in found if f is not None]
+        if len(found) < 2:
+            continue
+
+        A, X, Y, conn_ops = zip(*found)
+        if (any(a.shape != A[0].shape for a in A)
+                or any(x.shape != X[0].shape or x.ndim != 1 for x in X)
+                or any(y.shape != Y[0].shape or y.ndim != 1 for y in Y)
+                or not is_block(X) or not is_block(Y)):
+            continue
+
+        blocks.append(BlockInc(A, X, Y, tag="%s.%s" % (ea, node.label)))
+        removed.update(op for op_list in conn_ops for op in op_list)
+
+    model.operators[start:] = [
+        op for op in ops if op not in removed] + blocks
@@ -1,5 +1,6 @@
 import numpy as np
 
+import nengo.utils.numpy as npext
 from nengo.builder.builder import Builder
 from nengo.builder.operator import DotInc, ElementwiseInc, Operator, Reset
 from nengo.builder.signal import Signal
@@ -11,14 +12,19 @@ from nengo.synapses import Lowpass
 
 
 class SimBCM(Operator):
-    """Calculate delta omega according to the BCM rule."""
+    """Calculate delta omega according to the BCM rule.
+
+    If ``nonzero`` is given, it is a tuple of (post, pre) index arrays,
+    and ``delta`` only contains these elements of the weight matrix.
+    """
     def __init__(self, pre_filtered, post_filtered, theta, delta,
-                 learning_rate, tag=None):
+                 learning_rate, nonzero=None, tag=None):
         self.post_filtered = post_filtered
         self.pre_filtered = pre_filtered
         self.theta = theta
         self.delta = delta
         self.learning_rate = learning_rate
+        self.nonzero = nonzero
         self.tag = tag
 
         self.sets = []
@@ -37,6 +43,14 @@ class SimBCM(Operator):
         delta = signals[self.delta]
         alpha = self.learning_rate * dt
 
+        if self.nonzero is not None:
+            post_inds, pre_inds = self.nonzero
+
+            def step_simbcm_sparse():
+                post = alpha * post_filtered * (post_filtered - theta)
+                delta[...] = post[post_inds] * pre_filtered[pre_inds]
+            return step_simbcm_sparse
+
         def step_simbcm():
             delta[...] = np.outer(
                 alpha * post_filtered * (post_filtered - theta), pre_filtered)
@@ -44,15 +58,20 @@ class SimBCM(Operator):
 
 
 class SimOja(Operator):
-    """Calculate delta omega according to the Oja rule."""
+    """Calculate delta omega according to the Oja rule.
+
+    If ``nonzero`` is given, it is a tuple of (post, pre) index arrays,
+    and ``weights`` and ``delta`` only contain these elements.
+    """
     def __init__(self, pre_filtered, post_filtered, weights, delta,
-                 learning_rate, beta, tag=None):
+                 learning_rate, beta, nonzero=None, tag=None):
         self.post_filtered = post_filtered
         self.pre_filtered = pre_filtered
         self.weights = weights
         self.delta = delta
         self.learning_rate = learning_rate
         self.beta = beta
+        self.nonzero = nonzero
         self.tag = tag
 
         self.sets = []
@@ -72,6 +91,16 @@ class SimOja(Operator):
         alpha = self.learning_rate * dt
         beta = self.beta
 
+        if self.nonzero is not None:
+            post_inds, pre_inds = self.nonzero
+
+            def step_simoja_sparse():
+                post_squared = alpha * post_filtered * post_filtered
+                delta[...] = -beta * weights * post_squared[post_inds]
+                delta[...] += (alpha * post_filtered[post_inds]
+                               * pre_filtered[pre_inds])
+            return step_simoja_sparse
+
         def step_simoja():
             # perform forgetting
             post_squared = alpha * post_filtered * post_filtered
@@ -83,6 +112,51 @@ class SimOja(Operator):
         return step_simoja
 
 
+class SimSparseOuterInc(Operator):
+    """Increment Y by the outer product of `post` and `pre` at nonzero weights.
+
+    ``nonzero`` is a tuple of (post, pre) index arrays, so that
+    ``Y[k] += post[nonzero[0][k]] * pre[nonzero[1][k]]``.
+    """
+    def __init__(self, post, pre, Y, nonzero, tag=None):
+        self.post = post
+        self.pre = pre
+        self.Y = Y
+        self.nonzero = nonzero
+        self.tag = tag
+
+        self.sets = []
+        self.incs = [Y]
+        self.reads = [post, pre]
+        self.updates = []
+
+    def __str__(self):
+        return 'SimSparseOuterInc(%s, %s -> %s%s)' % (
+            self.post, self.pre, self.Y, self._tagstr)
+
+    def make_step(self, signals, dt, rng):
+        post = signals[self.post]
+        pre = signals[self.pre]
+        Y = signals[self.Y]
+        post_inds, pre_inds = self.nonzero
+
+        def step_simsparseouterinc():
+            Y[...] += post[post_inds] * pre[pre_inds]
+        return step_simsparseouterinc
+
+
+def get_nonzero(model, conn):
+    """Returns the (post, pre) indices of sparse connection weights.
+
+    If the connection weights are dense, returns None.
+    """
+    weights = model.params[conn].weights
+    if not npext.is_sparse(weights):
+        return None
+    post_inds = np.repeat(np.arange(weights.shape[0]), np.diff(weights.indptr))
+    return post_inds, weights.indices
+
+
 def get_pre_ens(conn):
     return (conn.pre_obj if isinstance(conn.pre_obj, Ensemble)
             else conn.pre_obj.ensemble)
@@ -101,7 +175,11 @@ def build_learning_rule(model, rule):
     post = get_post_ens(conn)
 
     # --- Set up delta signal and += transform / decoders
-    if conn.solver.weights or (
+    if get_nonzero(model, conn) is not None:
+        delta = Signal(np.zeros(model.sig[conn]['weights'].shape),
+                       name='Delta')
+        tag = "omega += delta"
+    elif conn.solver.weights or (
             isinstance(conn.pre_obj, Neurons) and
             isinstance(conn.post_obj, Neurons)):
         delta = Signal(np.zeros((post.n_neurons, pre.n_neurons)), name='Delta')
@@ -134,7 +212,8 @@ def build_bcm(model, bcm, rule):
                         post_filtered,
                         theta,
                         model.sig[rule]['delta'],
-                        learning_rate=bcm.learning_rate))
+                        learning_rate=bcm.learning_rate,
+                        nonzero=get_nonzero(model, conn)))
 
     # expose these for probes
     model.sig[rule]['theta'] = theta
@@ -157,7 +236,8 @@ def build_oja(model, oja, rule):
                         model.sig[conn]['weights'],
                         model.sig[rule]['delta'],
                         learning_rate=oja.learning_rate,
-                        beta=oja.beta))
+                        beta=oja.beta,
+                        nonzero=get_nonzero(model, conn)))
 
     # expose these for probes
     model.sig[rule]['pre_filtered'] = pre_filtered
@@ -180,7 +260,7 @@ def build_pes(model, pes, rule):
 
     # Compute the correction, i.e. the scaled negative error
     correction = Signal(np.zeros(error.shape), name="PES:correction")
-    local_error = correction.reshape((error.size, 1))
+    local_error = correction
     model.add_op(Reset(correction))
 
     # correction = -learning_rate * (dt / n_neurons) * error
@@ -194,22 +274,28 @@ def build_pes(model, pes, rule):
             isinstance(conn.pre_obj, Neurons) and
             isinstance(conn.post_obj, Neurons)):
         post = get_post_ens(conn)
-        weights = model.sig[conn]['weights']
         encoders = model.sig[post]['encoders']
 
         # encoded = dot(encoders, correction)
-        encoded = Signal(np.zeros(weights.shape[0]), name="PES:encoded")
+        encoded = Signal(np.zeros(post.n_neurons), name="PES:encoded")
         model.add_op(Reset(encoded))
         model.add_op(DotInc(encoders, correction, encoded, tag="PES:encode"))
-        local_error = encoded.reshape((encoded.size, 1))
+        local_error = encoded
     elif not isinstance(conn.pre_obj, (Ensemble, Neurons)):
         raise ValueError("'pre' object '%s' not suitable for PES learning"
                          % (conn.pre_obj))
 
     # delta = local_error * activities
     model.add_op(Reset(model.sig[rule]['delta']))
-    model.add_op(ElementwiseInc(
-        local_error, acts_view, model.sig[rule]['delta'], tag="PES:Inc Delta"))
+    nonzero = get_nonzero(model, conn)
+    if nonzero is None:
+        model.add_op(ElementwiseInc(
+            local_error.reshape((local_error.size, 1)), acts_view,
+            model.sig[rule]['delta'], tag="PES:Inc Delta"))
+    else:
+        model.add_op(SimSparseOuterInc(
+            local_error, acts, model.sig[rule]['delta'], nonzero,
+            tag="PES:Inc Delta"))
 
     # expose these for probes
     model.sig[rule]['error'] = error
@@ -5,12 +5,39 @@ import numpy as np
 import nengo.utils.numpy as npext
 from nengo.builder.builder import Builder
 from nengo.builder.signal import Signal
+from nengo.cache import MemoryDecoderCache
 from nengo.network import Network
+from nengo.utils.rng import make_rng
 
 logger = logging.getLogger(__name__)
 
 
-@Builder.register(Network)  # noqa: C901
+def get_seed(obj, rng):
+    # Generate a seed no matter what, so that setting a seed or not on
+    # one object doesn't affect the seeds of other objects.
+    seed = rng.randint(npext.maxint)
+    return (seed if not hasattr(obj, 'seed') or obj.seed is None
+            else obj.seed)
+
+
+def seed_network(model, network):
+    """Assigns seeds to ``network`` and its children in ``model.seeds``.
+
+    Seeds already in ``model.seeds`` are kept, so the seeds of some objects
+    can be overridden before the network is built.
+    """
+    if network not in model.seeds:
+        model.seeds[network] = get_seed(network, np.random)
+
+    rng = make_rng(model.seeds[network])
+    sorted_types = sorted(network.objects, key=lambda t: t.__name__)
+    for obj_type in sorted_types:
+        for obj in network.objects[obj_type]:
+            seed = get_seed(obj, rng)
+            model.seeds.setdefault(obj, seed)
+
+
+@Builder.register(Network)
 def build_network(model, network):
     """Takes a Network object and returns a Model.
 
@@ -25,31 +52,19 @@ def build_network(model, network):
     4) Learning Rules
     5) Probes
     """
-    def get_seed(obj, rng):
-        # Generate a seed no matter what, so that setting a seed or not on
-        # one object doesn't affect the seeds of other objects.
-        seed = rng.randint(npext.maxint)
-        return (seed if not hasattr(obj, 'seed') or obj.seed is None
-                else obj.seed)
-
     if model.toplevel is None:
         model.toplevel = network
         model.sig['common'][0] = Signal(
             npext.array(0.0, readonly=True), name='Common: Zero')
         model.sig['common'][1] = Signal(
             npext.array(1.0, readonly=True), name='Common: One')
-        model.seeds[network] = get_seed(network, np.random)
 
     # Set config
     old_config = model.config
     model.config = network.config
 
     # assign seeds to children
-    rng = np.random.RandomState(model.seeds[network])
-    sorted_types = sorted(network.objects, key=lambda t: t.__name__)
-    for obj_type in sorted_types:
-        for obj in network.objects[obj_type]:
-            model.seeds[obj] = get_seed(obj, rng)
+    seed_network(model, network)
 
     logger.debug("Network step 1: Building ensembles and nodes")
     for obj in network.ensembles + network.nodes:
@@ -78,3 +93,30 @@ def build_network(model, network):
     # Unset config
     model.config = old_config
     model.params[network] = None
+
+
+def build_shared_network(model, network, shared_seeds):
+    """Builds a network whose objects in ``shared_seeds`` are identical.
+
+    Objects in each group are given the seed of the first object in the
+    group, unless they have a seed of their own. Decoders are kept in memory
+    while building, so the decoders of identical connections are only solved
+    for once.
+    """
+    seed_network(model, network)
+    share_seeds(model, shared_seeds)
+
+    decoder_cache = model.decoder_cache
+    model.decoder_cache = MemoryDecoderCache(decoder_cache)
+    try:
+        build_network(model, network)
+    finally:
+        model.decoder_cache = decoder_cache
+
+
+def share_seeds(model, groups):
+    """Gives the objects in each group the seed of the first object."""
+    for group in groups:
+        for obj in group[1:]:
+            if obj.seed is None:
+                model.seeds[obj] = model.seeds[group[0]]
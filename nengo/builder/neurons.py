@@ -36,6 +36,65 @@ class SimNeurons(Operator):
         return step_simneurons
 
 
+class SpikeIndices(Operator):
+    """Set ``n_spikes`` and ``spike_indices`` to the nonzero spikes.
+
+    ``n_spikes`` is set to the number of nonzero elements of ``spikes``,
+    and the first ``n_spikes`` elements of ``spike_indices`` to their
+    indices, so that downstream operators (see ``SpikeDotInc``) can skip
+    silent neurons.
+    """
+
+    def __init__(self, spikes, n_spikes, spike_indices, tag=None):
+        self.spikes = spikes
+        self.n_spikes = n_spikes
+        self.spike_indices = spike_indices
+        self.tag = tag
+
+        self.sets = [n_spikes, spike_indices]
+        self.incs = []
+        self.reads = [spikes]
+        self.updates = []
+
+    def __str__(self):
+        return "SpikeIndices(%s -> %s%s)" % (
+            self.spikes, self.spike_indices, self._tagstr)
+
+    def make_step(self, signals, dt, rng):
+        spikes = signals[self.spikes]
+        n_spikes = signals[self.n_spikes]
+        spike_indices = signals[self.spike_indices]
+
+        def step_spikeindices():
+            idx = np.flatnonzero(spikes)
+            n_spikes[...] = idx.size
+            spike_indices[:idx.size] = idx
+        return step_spikeindices
+
+
+def build_spike_indices(model, neurons):
+    """Returns signals listing which of ``neurons`` spiked on each step.
+
+    The signals, and the operator that fills them, are created the first
+    time they are requested, so populations without a connection that uses
+    them don't search for their spikes. Returns None if ``neurons`` are
+    not spiking.
+    """
+    sig = model.sig[neurons]
+    if 'spike_indices' not in sig:
+        if 'spikes' not in neurons.ensemble.neuron_type.probeable:
+            return None
+        sig['n_spikes'] = Signal(
+            0, name="%s.n_spikes" % neurons, dtype=np.intp)
+        sig['spike_indices'] = Signal(
+            np.zeros(neurons.size_in), name="%s.spike_indices" % neurons,
+            dtype=np.intp)
+        model.add_op(SpikeIndices(sig['out'], sig['n_spikes'],
+                                  sig['spike_indices'],
+                                  tag="%s.spike_indices" % neurons))
+    return sig['n_spikes'], sig['spike_indices']
+
+
 @Builder.register(RectifiedLinear)
 def build_rectifiedlinear(model, reclinear, neurons):
     model.add_op(SimNeurons(neurons=reclinear,
@@ -2,7 +2,7 @@ import numpy as np
 
 from nengo.builder.builder import Builder
 from nengo.builder.signal import Signal
-from nengo.builder.operator import Reset, SimPyFunc
+from nengo.builder.operator import Reset, SimPyFunc, SimVectorizedPyFunc
 from nengo.node import Node
 from nengo.processes import Process
 from nengo.utils.compat import is_array_like
@@ -26,8 +26,11 @@ def build_node(model, node):
     elif callable(node.output):
         sig_out = (Signal(np.zeros(node.size_out), name="%s.out" % node)
                    if node.size_out > 0 else None)
-        model.add_op(SimPyFunc(
-            output=sig_out, fn=node.output, t_in=True, x=sig_in))
+        if node.vectorized:
+            model.add_op(SimVectorizedPyFunc(output=sig_out, fn=node.output))
+        else:
+            model.add_op(SimPyFunc(
+                output=sig_out, fn=node.output, t_in=True, x=sig_in))
     elif is_array_like(node.output):
         sig_out = Signal(node.output, name="%s.out" % node)
     else:
@@ -354,6 +354,236 @@ class DotInc(Operator):
         return step_dotinc
 
 
+class SpikeDotInc(DotInc):
+    """Increment signal Y by dot(A, X), where X is a spike vector.
+
+    On each step, ``n_spikes`` gives the number of nonzero elements of X,
+    and the first ``n_spikes`` elements of ``spike_indices`` give their
+    indices (as written by ``SpikeIndices``). When the fraction of nonzero
+    elements is below ``max_fraction``, only the corresponding columns of A
+    are accumulated; otherwise, this falls back on the dense product.
+    """
+
+    def __init__(self, A, X, Y, n_spikes, spike_indices,
+                 max_fraction=0.1, tag=None):
+        if A.ndim != 2:
+            raise ValueError("A must be a matrix")
+        super(SpikeDotInc, self).__init__(A, X, Y, tag=tag)
+        self.n_spikes = n_spikes
+        self.spike_indices = spike_indices
+        self.max_fraction = max_fraction
+
+        self.reads = [A, X, n_spikes, spike_indices]
+
+    def __str__(self):
+        return 'SpikeDotInc(%s, %s -> %s%s)' % (
+            self.A, self.X, self.Y, self._tagstr)
+
+    def make_step(self, signals, dt, rng):
+        X = signals[self.X]
+        A = signals[self.A]
+        Y = signals[self.Y]
+        n_spikes = signals[self.n_spikes]
+        spike_indices = signals[self.spike_indices]
+        reshape_dot(A, X, Y, self.tag)
+        max_spikes = self.max_fraction * X.size
+
+        def step_spikedotinc():
+            n = int(n_spikes)
+            if n == 0:
+                return
+            elif n < max_spikes:
+                idx = spike_indices[:n]
+                Y[...] += np.dot(A[:, idx], X[idx])
+            else:
+                Y[...] += np.dot(A, X)
+        return step_spikedotinc
+
+
+class SparseDotInc(Operator):
+    """Increment signal Y by dot(A, X), where A is a sparse matrix.
+
+    The signal A holds the nonzero values of the matrix in compressed sparse
+    row (CSR) order, and ``indices`` and ``indptr`` give the structure of the
+    matrix (see ``scipy.sparse.csr_matrix``). Only A can change during the
+    simulation (e.g., through learning); the structure is fixed.
+    """
+
+    def __init__(self, A, X, Y, indices, indptr, tag=None):
+        if A.ndim != 1:
+            raise ValueError("A must be a vector of nonzero values")
+        if X.ndim >= 2 and any(d > 1 for d in X.shape[1:]):
+            raise ValueError("X must be a column vector")
+        if Y.ndim >= 2 and any(d > 1 for d in Y.shape[1:]):
+            raise ValueError("Y must be a column vector")
+        if len(indptr) != Y.size + 1 or len(indices) != A.size:
+            raise ValueError("shape mismatch in %s: %s nonzeros (in %s rows)"
+                             " -> %s" % (tag, len(indices), len(indptr) - 1,
+                                         Y.shape))
+
+        self.A = A
+        self.X = X
+        self.Y = Y
+        self.indices = np.asarray(indices)
+        self.indptr = np.asarray(indptr)
+        self.tag = tag
+
+        self.sets = []
+        self.incs = [Y]
+        self.reads = [A, X]
+        self.updates = []
+
+    def __str__(self):
+        return 'SparseDotInc(%s, %s -> %s%s)' % (
+            self.A, self.X, self.Y, self._tagstr)
+
+    def make_step(self, signals, dt, rng):
+        X = signals[self.X]
+        A = signals[self.A]
+        Y = signals[self.Y]
+        indices = self.indices
+        indptr = self.indptr
+
+        try:
+            import scipy.sparse
+        except ImportError:
+            rows = np.repeat(np.arange(Y.size), np.diff(indptr))
+
+            def step_sparsedotinc():
+                inc = np.bincount(
+                    rows, weights=A * X[indices].ravel(), minlength=Y.size)
+                Y[...] += inc.reshape(Y.shape)
+            return step_sparsedotinc
+
+        matrix = scipy.sparse.csr_matrix(
+            (A, indices, indptr), shape=(Y.size, X.size))
+        matrix.data = A  # share memory, so that changes to A are seen here
+
+        def step_sparsedotinc():
+            Y[...] += matrix.dot(X).reshape(Y.shape)
+        return step_sparsedotinc
+
+
+def signal_block(signals, sigs):
+    """Returns one flat array spanning ``sigs``, if they are back to back.
+
+    This is the case if ``sigs`` are consecutive views of one signal, or if
+    their arrays are consecutive slices of one array. Otherwise, returns None.
+    """
+    base = sigs[0].base
+    if all(sig.base is base and sig.ndim == 1 and sig.elemstrides == (1,)
+           for sig in sigs):
+        offsets = [sig.offset for sig in sigs]
+        ends = [sig.offset + sig.size for sig in sigs]
+        if offsets[1:] == ends[:-1]:
+            return signals[base].reshape(-1)[offsets[0]:ends[-1]]
+
+    arrays = [signals[sig] for sig in sigs]
+    block = arrays[0].base
+    if (not isinstance(block, np.ndarray) or block.ndim != 1
+            or not block.flags.c_contiguous):
+        return None
+    itemsize = block.itemsize
+    start = block.__array_interface__['data'][0]
+    ptr = arrays[0].__array_interface__['data'][0]
+    for array in arrays:
+        if (array.base is not block or array.ndim != 1
+                or not array.flags.c_contiguous
+                or array.__array_interface__['data'][0] != ptr):
+            return None
+        ptr += array.nbytes
+    i = (arrays[0].__array_interface__['data'][0] - start) // itemsize
+    return block[i:i + sum(array.size for array in arrays)]
+
+
+class BlockInc(Operator):
+    """Increment each signal in Y by the product of A and X, as one block.
+
+    Each block computes ``Y[i] += dot(A[i], X[i])`` if the ``A`` signals are
+    matrices, and ``Y[i] += A[i] * X[i]`` otherwise. All blocks must have the
+    same shapes. When the signals are initialized, the ``X`` and ``Y``
+    signals are placed in contiguous arrays (unless they already are), so
+    that all blocks are computed with one call to numpy. ``A`` is assumed to
+    be constant, and is read once when the step function is made.
+    """
+
+    def __init__(self, A, X, Y, tag=None):
+        self.A = list(A)
+        self.X = list(X)
+        self.Y = list(Y)
+        self.tag = tag
+
+        if not len(self.A) == len(self.X) == len(self.Y) > 0:
+            raise ValueError("Must have the same number of A, X, and Y")
+        a, x, y = self.A[0], self.X[0], self.Y[0]
+        if x.ndim != 1 or y.ndim != 1 or any(
+                sig.shape != s.shape for sigs, s in zip(
+                    (self.A, self.X, self.Y), (a, x, y)) for sig in sigs):
+            raise ValueError("All blocks must have the same shapes")
+        if a.ndim == 2:
+            badshape = a.shape != y.shape + x.shape
+        else:
+            badshape = a.shape not in [(), x.shape] or x.shape != y.shape
+        if badshape:
+            raise ValueError('shape mismatch in %s: %s x %s -> %s' % (
+                tag, a.shape, x.shape, y.shape))
+
+        self.sets = []
+        self.incs = []  # the bases of Y, since views must be set to be incs
+        for y in self.Y:
+            if not any(y.base is base for base in self.incs):
+                self.incs.append(y.base)
+        self.reads = self.A + self.X
+        self.updates = []
+
+    def __str__(self):
+        return 'BlockInc(%d blocks, %s, %s -> %s%s)' % (
+            len(self.A), self.A[0], self.X[0], self.Y[0], self._tagstr)
+
+    def init_signals(self, signals):
+        super(BlockInc, self).init_signals(signals)
+
+        for sigs in (self.X, self.Y):
+            if (signal_block(signals, sigs) is not None
+                    or any(sig.base is not sig for sig in sigs)):
+                continue
+            block = np.concatenate([signals[sig] for sig in sigs])
+            i = 0
+            for sig in sigs:
+                # make the signal a view of the block
+                dict.__setitem__(signals, sig, block[i:i+sig.size])
+                i += sig.size
+
+    def make_step(self, signals, dt, rng):
+        dot = self.A[0].ndim == 2
+        if dot:
+            A = np.array([signals[a] for a in self.A])
+        else:
+            A = np.array([signals[a] * np.ones(self.X[0].size)
+                          for a in self.A])
+        X = signal_block(signals, self.X)
+        Y = signal_block(signals, self.Y)
+
+        if X is None or Y is None:
+            Xs = [signals[x] for x in self.X]
+            Ys = [signals[y] for y in self.Y]
+
+            def step_blockinc():
+                for a, x, y in zip(A, Xs, Ys):
+                    y[...] += np.dot(a, x) if dot else a * x
+            return step_blockinc
+
+        X = X.reshape(len(self.X), -1)
+        Y = Y.reshape(len(self.Y), -1)
+        if dot:
+            def step_blockinc():
+                Y[...] += np.einsum('kmn,kn->km', A, X)
+        else:
+            def step_blockinc():
+                Y[...] += A * X
+        return step_blockinc
+
+
 class SimPyFunc(Operator):
     """Set signal `output` by some Python function of x, possibly t."""
 
@@ -389,3 +619,53 @@ class SimPyFunc(Operator):
                 output[...] = y
 
         return step_simpyfunc
+
+
+class SimVectorizedPyFunc(Operator):
+    """Set signal `output` by a Python function of an array of times.
+
+    The function is called once for every ``block_size`` steps, with the
+    times of those steps, and its output is read from a buffer in between.
+    """
+
+    block_size = 100
+
+    def __init__(self, output, fn, tag=None):
+        self.output = output
+        self.fn = fn
+        self.tag = tag
+
+        self.sets = [] if output is None else [output]
+        self.incs = []
+        self.reads = []
+        self.updates = []
+
+    def __str__(self):
+        return "SimVectorizedPyFunc(%s, fn='%s'%s)" % (
+            self.output, self.fn.__name__, self._tagstr)
+
+    def make_step(self, signals, dt, rng):
+        output = signals[self.output] if self.output is not None else None
+        fn = self.fn
+        t_sig = signals['__time__']
+        n = self.block_size
+        size_out = output.size if output is not None else 0
+        block = np.zeros((n, size_out))
+        i = np.array(n)  # index of the next row in block
+
+        def step_simvectorizedpyfunc():
+            if i == n:
+                # same arithmetic as the simulator, to get identical times
+                t = dt * (np.round(t_sig.item() / dt) + np.arange(n))
+                y = fn(t)
+                if output is not None:
+                    if y is None:
+                        raise ValueError("Function '%s' returned invalid "
+                                         "value" % fn.__name__)
+                    block[...] = np.reshape(y, block.shape)
+                i[...] = 0
+            if output is not None:
+                output[...] = block[i]
+            i[...] += 1
+
+        return step_simvectorizedpyfunc
@@ -1,6 +1,7 @@
 import numpy as np
 
 from nengo.builder.builder import Builder
+from nengo.builder.connection import materialize_weights
 from nengo.builder.operator import Reset
 from nengo.builder.signal import Signal
 from nengo.connection import Connection, LearningRule
@@ -26,6 +27,10 @@ def conn_probe(model, probe):
 
 
 def synapse_probe(model, key, probe):
+    if (isinstance(probe.obj, Connection) and key == 'weights'
+            and model.params[probe.obj].factors is not None):
+        materialize_weights(model, probe.obj)
+
     try:
         sig = model.sig[probe.obj][key]
     except IndexError:
@@ -1,10 +1,20 @@
+import numpy as np
+
 from nengo.builder.builder import Builder
 from nengo.builder.operator import Operator
 from nengo.processes import Process
 
 
 class SimProcess(Operator):
-    """Simulate a Process object."""
+    """Simulate a Process object.
+
+    Processes without input that support blocks (see
+    `Process.make_block_step`) compute ``block_size`` timesteps at a time
+    into a buffer, which is then read one row per step.
+    """
+
+    block_size = 100
+
     def __init__(self, process, input, output, inc=False, tag=None):
         self.process = process
         self.input = input
@@ -31,9 +41,15 @@ class SimProcess(Operator):
         output = signals[self.output] if self.output is not None else None
         size_in = input.size if input is not None else 0
         size_out = output.size if output is not None else 0
-        step_f = self.process.make_step(size_in, size_out, dt, rng)
         inc = self.inc
 
+        block_step = (self.process._make_block_step(0, size_out, dt, rng)
+                      if input is None and output is not None else None)
+        if block_step is not None:
+            return self._make_block_step(block_step, t, output, inc)
+
+        step_f = self.process.make_step(size_in, size_out, dt, rng)
+
         def step_simprocess():
             result = (step_f(t.item(), input) if input is not None else
                       step_f(t.item()))
@@ -45,6 +61,23 @@ class SimProcess(Operator):
 
         return step_simprocess
 
+    def _make_block_step(self, block_step, t, output, inc):
+        n = self.block_size
+        block = np.zeros((n, output.size))
+        i = np.array(n)  # index of the next row in block
+
+        def step_simprocess():
+            if i == n:
+                block[...] = block_step(t.item(), n).reshape(block.shape)
+                i[...] = 0
+            if inc:
+                output[...] += block[i].reshape(output.shape)
+            else:
+                output[...] = block[i].reshape(output.shape)
+            i[...] += 1
+
+        return step_simprocess
+
 
 @Builder.register(Process)
 def build_process(model, process, sig_in=None, sig_out=None, inc=False):
@@ -301,9 +301,9 @@ class Signal(SignalView):
     # up in a model.
     assert_named_signals = False
 
-    def __init__(self, value, name=None):
+    def __init__(self, value, name=None, dtype=np.float64):
         # Make sure we use a C-contiguous array
-        self._value = np.array(value, copy=False, order='C', dtype=np.float64)
+        self._value = np.array(value, copy=False, order='C', dtype=dtype)
         if name is not None:
             self._name = name
         if Signal.assert_named_signals:
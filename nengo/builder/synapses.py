@@ -1,9 +1,11 @@
+import collections
+
 import numpy as np
 
 from nengo.builder.builder import Builder
 from nengo.builder.signal import Signal
 from nengo.builder.operator import Operator
-from nengo.synapses import Synapse
+from nengo.synapses import LinearFilter, Synapse
 
 
 class SimSynapse(Operator):
@@ -34,6 +36,79 @@ class SimSynapse(Operator):
         return step_simsynapse
 
 
+class SimSynapses(Operator):
+    """Simulate several synapses with the same filter as one block.
+
+    The outputs are placed in one contiguous array when the signals are
+    initialized, so a single filter step updates all of them.
+    """
+    def __init__(self, input_sigs, output_sigs, synapse, tag=None):
+        self.inputs = list(input_sigs)
+        self.outputs = list(output_sigs)
+        self.synapse = synapse
+        self.tag = tag
+
+        self.sets = []
+        self.incs = []
+        self.reads = list(self.inputs)
+        self.updates = list(self.outputs)
+
+    def __str__(self):
+        return "SimSynapses(%s, %d synapses%s)" % (
+            self.synapse, len(self.outputs), self._tagstr)
+
+    def init_signals(self, signals):
+        super(SimSynapses, self).init_signals(signals)
+
+        block = np.zeros(sum(sig.size for sig in self.outputs))
+        i = 0
+        for sig in self.outputs:
+            block[i:i+sig.size] = signals[sig]
+            # make the output a view of the block
+            dict.__setitem__(signals, sig, block[i:i+sig.size])
+            i += sig.size
+
+    def make_step(self, signals, dt, rng):
+        inputs = [signals[sig] for sig in self.inputs]
+        block = signals[self.outputs[0]].base
+        step_f = self.synapse.make_step(dt, block)
+
+        def step_simsynapses():
+            step_f(np.concatenate(inputs))
+
+        return step_simsynapses
+
+
+def merge_synapses(operators, dt):
+    """Merges ``SimSynapse`` operators that apply the same filter.
+
+    Linear filters with identical coefficients after discretization are
+    combined into a single ``SimSynapses`` operator. Only synapses with
+    vector inputs and outputs, where the output is not a view of another
+    signal, are merged. Returns the new list of operators.
+    """
+    groups = collections.OrderedDict()
+    for op in operators:
+        if (isinstance(op, SimSynapse)
+                and isinstance(op.synapse, LinearFilter)
+                and op.input.ndim == 1 and op.output.ndim == 1
+                and op.output.base is op.output):
+            step = op.synapse.make_step(dt, np.zeros(1))
+            key = (type(step), tuple(step.num), tuple(step.den))
+            groups.setdefault(key, []).append(op)
+
+    merged = set()
+    new_ops = []
+    for ops in groups.values():
+        if len(ops) > 1:
+            merged.update(ops)
+            new_ops.append(SimSynapses([op.input for op in ops],
+                                       [op.output for op in ops],
+                                       ops[0].synapse))
+
+    return [op for op in operators if op not in merged] + new_ops
+
+
 @Builder.register(Synapse)
 def build_synapse(model, synapse, input_sig, output=None):
     if output is None:
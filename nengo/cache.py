@@ -261,7 +261,8 @@ class DecoderCache(object):
             return decoders, solver_info
         return cached_solver
 
-    def _get_cache_key(self, solver_fn, solver, neuron_type, gain, bias,
+    @staticmethod
+    def _get_cache_key(solver_fn, solver, neuron_type, gain, bias,
                        x, targets, rng, E):
         h = hashlib.sha1()
 
@@ -320,6 +321,63 @@ class NoDecoderCache(object):
         pass
 
 
+class MemoryDecoderCache(object):
+    """Reuses decoders for solves with identical arguments in memory.
+
+    This is used when building networks of identical sub-ensembles, so that
+    their decoders are only solved for once. Solves that are not in memory
+    are passed on to ``decoder_cache``.
+
+    Parameters
+    ----------
+    decoder_cache : DecoderCache or NoDecoderCache
+        The cache used for solves that are not in memory.
+    """
+
+    def __init__(self, decoder_cache):
+        self.decoder_cache = decoder_cache
+        self.decoders = {}
+
+    def wrap_solver(self, solver_fn):
+        wrapped_solver = self.decoder_cache.wrap_solver(solver_fn)
+
+        def shared_solver(solver, neuron_type, gain, bias, x, targets,
+                          rng=None, E=None):
+            try:
+                key = DecoderCache._get_cache_key(
+                    solver_fn, solver, neuron_type, gain, bias, x, targets,
+                    rng, E)
+            except (AttributeError, ValueError):
+                # no rng given, or the solver cannot be fingerprinted
+                key = None
+
+            if key not in self.decoders:
+                result = wrapped_solver(
+                    solver, neuron_type, gain, bias, x, targets, rng=rng, E=E)
+                if key is None:
+                    return result
+                self.decoders[key] = result
+            else:
+                logger.debug("Shared decoders [{0}].".format(key))
+
+            decoders, solver_info = self.decoders[key]
+            return decoders.copy(), solver_info
+        return shared_solver
+
+    def get_size_in_bytes(self):
+        return self.decoder_cache.get_size_in_bytes()
+
+    def get_size(self):
+        return self.decoder_cache.get_size()
+
+    def shrink(self, limit=None):
+        self.decoder_cache.shrink(limit)
+
+    def invalidate(self):
+        self.decoders.clear()
+        self.decoder_cache.invalidate()
+
+
 def get_default_decoder_cache():
     if rc.getboolean('decoder_cache', 'enabled'):
         decoder_cache = DecoderCache(
@@ -3,6 +3,7 @@ import weakref
 
 import numpy as np
 
+import nengo.utils.numpy as npext
 from nengo.base import NengoObject, NengoObjectParam, ObjView
 from nengo.dists import DistOrArrayParam
 from nengo.ensemble import Ensemble, Neurons
@@ -126,6 +127,9 @@ class TransformParam(NdarrayParam):
         super(TransformParam, self).__init__(default, (), optional, readonly)
 
     def validate(self, conn, transform):
+        if npext.is_sparse(transform):
+            return self.validate_sparse(conn, transform)
+
         transform = np.asarray(transform, dtype=np.float64)
 
         if transform.ndim == 0:
@@ -142,18 +146,30 @@ class TransformParam(NdarrayParam):
         super(TransformParam, self).validate(conn, transform)
 
         if transform.ndim == 2:
-            # check for repeated dimensions in lists, as these don't work
-            # for two-dimensional transforms
-            repeated_inds = lambda x: (
-                not isinstance(x, slice) and np.unique(x).size != len(x))
-            if repeated_inds(conn.pre_slice):
-                raise ValueError("Input object selection has repeated indices")
-            if repeated_inds(conn.post_slice):
-                raise ValueError(
-                    "Output object selection has repeated indices")
+            self.validate_slices(conn)
 
         return transform
 
+    def validate_sparse(self, conn, transform):
+        """Sparse transforms are stored in compressed sparse row format."""
+        import scipy.sparse
+
+        if transform.shape[0] != conn.size_out:
+            raise ValueError("shape[0] should be %d (got %d)"
+                             % (conn.size_out, transform.shape[0]))
+        self.validate_slices(conn)
+        return scipy.sparse.csr_matrix(transform, dtype=np.float64)
+
+    def validate_slices(self, conn):
+        # check for repeated dimensions in lists, as these don't work
+        # for two-dimensional transforms
+        repeated_inds = lambda x: (
+            not isinstance(x, slice) and np.unique(x).size != len(x))
+        if repeated_inds(conn.pre_slice):
+            raise ValueError("Input object selection has repeated indices")
+        if repeated_inds(conn.post_slice):
+            raise ValueError("Output object selection has repeated indices")
+
 
 class Connection(NengoObject):
     """Connects two objects together.
@@ -193,7 +209,9 @@ class Connection(NengoObject):
         Linear transform mapping the pre output to the post input.
         This transform is in terms of the sliced size; if either pre
         or post is a slice, the transform must be of shape
-        (len(pre_slice), len(post_slice)).
+        (len(pre_slice), len(post_slice)). A SciPy sparse matrix can be
+        given for large, sparse transforms (e.g., between neurons);
+        these are never converted to dense matrices by the builder.
     solver : Solver
         Instance of a Solver class to compute decoders or weights
         (see `nengo.solvers`). If solver.weights is True, a full
@@ -208,6 +226,12 @@ class Connection(NengoObject):
         the pre Ensemble. Defaults to True.
     learning_rule_type : instance or list or dict of LearningRuleType, optional
         Methods of modifying the connection weights during simulation.
+    vectorized : bool, optional
+        Whether `function` accepts a (n_eval_points, pre_size) array and
+        returns a (n_eval_points, dimensions) array, so that all targets can
+        be computed with a single call. If None (default), the builder
+        detects this with a trial call and falls back to calling `function`
+        once per evaluation point.
 
     Attributes
     ----------
@@ -248,6 +272,7 @@ class Connection(NengoObject):
         default=None, optional=True, sample_shape=('*', 'size_in'))
     scale_eval_points = BoolParam(default=True)
     seed = IntParam(default=None, optional=True)
+    vectorized = BoolParam(default=None, optional=True)
     modulatory = ObsoleteParam("Modulatory connections have been removed. "
                                "Connect to a learning rule instead.",
                                "https://github.com/nengo/nengo/issues/632"
@@ -256,7 +281,7 @@ class Connection(NengoObject):
     def __init__(self, pre, post, synapse=Default, transform=Default,
                  solver=Default, learning_rule_type=Default, function=Default,
                  eval_points=Default, scale_eval_points=Default, seed=Default,
-                 modulatory=Unconfigurable):
+                 vectorized=Default, modulatory=Unconfigurable):
         self.pre = pre
         self.post = post
 
@@ -268,6 +293,7 @@ class Connection(NengoObject):
         self.eval_points = eval_points  # Must be set before function
         self.function_info = function  # Must be set after transform
         self.seed = seed
+        self.vectorized = vectorized
         self.modulatory = modulatory
 
     @property
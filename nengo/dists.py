@@ -181,6 +181,108 @@ class UniformHypersphere(Distribution):
         return samples
 
 
+def _primes(n):
+    """Return the first ``n`` prime numbers."""
+    primes = []
+    candidate = 2
+    while len(primes) < n:
+        if all(candidate % p != 0 for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+class QuasirandomSequence(Distribution):
+    """Low-discrepancy (quasi-random) points in the unit hypercube.
+
+    Points come from a Halton sequence, which covers the space much more
+    evenly than pseudo-random points, so fewer points are needed to get the
+    same accuracy when they are used to solve for decoders. The digits of
+    each dimension are randomly permuted (scrambled) and the points are
+    randomly shifted, so ``rng`` determines the particular set of points.
+
+    Parameters
+    ----------
+    scramble : bool
+        Whether to scramble the digits of each dimension. Scrambling removes
+        the correlations between dimensions of the plain Halton sequence
+        when there are many dimensions.
+        Default: True
+    """
+
+    def __init__(self, scramble=True):
+        self.scramble = scramble
+
+    def __repr__(self):
+        return "QuasirandomSequence(%s)" % (
+            "" if self.scramble else "scramble=False")
+
+    def sample(self, n, d=None, rng=np.random):
+        shape = (n,) if d is None else (n, d)
+        d = 1 if d is None else d
+
+        samples = np.zeros((n, d))
+        for j, base in enumerate(_primes(d)):
+            perm = np.arange(base)
+            if self.scramble:
+                perm[1:] = 1 + np.argsort(rng.rand(base - 1))
+            i = np.arange(1, n + 1)
+            scale = 1. / base
+            while np.any(i > 0):
+                samples[:, j] += perm[i % base] * scale
+                i //= base
+                scale /= base
+
+        samples += rng.rand(1, d)
+        return (samples % 1.).reshape(shape)
+
+
+class ScatteredHypersphere(UniformHypersphere):
+    """Quasi-random distributions over an n-dimensional unit hypersphere.
+
+    Like `UniformHypersphere`, but maps the low-discrepancy points of
+    `QuasirandomSequence` onto the hypersphere, so that the points cover
+    it more evenly.
+
+    Parameters
+    ----------
+    surface : bool
+        Whether sample points should be distributed uniformly
+        over the surface of the hyperphere (True),
+        or within the hypersphere (False).
+        Default: False
+    """
+
+    def __init__(self, surface=False):
+        super(ScatteredHypersphere, self).__init__(surface)
+        self.base = QuasirandomSequence()
+
+    def __repr__(self):
+        return "ScatteredHypersphere(%s)" % (
+            "surface=True" if self.surface else "")
+
+    def sample(self, n, d, rng=np.random):
+        if d is None or d < 1:  # check this, since other dists allow d = None
+            raise ValueError("Dimensions must be a positive integer")
+
+        # Box-Muller transform pairs of dimensions into normal variates,
+        # whose directions are uniform over the surface.
+        n_pairs = (d + 1) // 2
+        u = self.base.sample(
+            n, 2 * n_pairs + (0 if self.surface else 1), rng=rng)
+        r = np.sqrt(-2 * np.log1p(-u[:, :n_pairs]))
+        theta = 2 * np.pi * u[:, n_pairs:2 * n_pairs]
+        samples = np.hstack([r * np.cos(theta), r * np.sin(theta)])[:, :d]
+        samples /= npext.norm(samples, axis=1, keepdims=True)
+
+        if self.surface:
+            return samples
+
+        # use the last dimension for the magnitude, as in UniformHypersphere
+        samples *= u[:, -1:] ** (1.0 / d)
+        return samples
+
+
 class Choice(Distribution):
     """Discrete distribution across a set of possible values.
 
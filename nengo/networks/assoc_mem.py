@@ -51,13 +51,19 @@ class AssociativeMemory(nengo.Network):
     threshold_output: boolean, optional
         Flag to indicate if the output vector should be thresholded
 
+    share_params: boolean, optional
+        Flag to indicate if ensembles with the same threshold should be built
+        with the same seed. They then have identical neuron parameters, and
+        their decoders are only solved for once, which makes building large
+        associative memories much faster.
+
     """
     def __init__(self, input_vectors, output_vectors=None,  # noqa: C901
                  default_output_vector=None, threshold=0.3, input_scale=1.0,
                  inhibitable=False, inhibit_scale=1.5, wta_output=False,
                  wta_inhibit_scale=3.0, wta_synapse=0.005,
                  threshold_output=False, label=None, seed=None,
-                 add_to_container=None, **ens_args):
+                 add_to_container=None, share_params=False, **ens_args):
         super(AssociativeMemory, self).__init__(label, seed, add_to_container)
 
         label_prefix = "" if label is None else label + "_"
@@ -108,6 +114,8 @@ class AssociativeMemory(nengo.Network):
         # Input and output nodes
         N = input_vectors.shape[0]
         self.num_items = N
+        self.threshold = threshold
+        self.share_params = share_params
 
         with self:
             bias_node = nengo.Node(output=1)
@@ -214,6 +222,7 @@ class AssociativeMemory(nengo.Network):
                 ens_params['encoders'] = Choice([[1]])
                 ens_params['eval_points'] = Uniform(0.5, 1.1)
                 ens_params['n_eval_points'] = n_eval_points
+                ens_params['share_params'] = share_params
 
                 self.thresh_ens = EnsembleArray(**ens_params)
                 self.thresholded_utilities = self.thresh_ens.output
@@ -2,7 +2,6 @@ import numpy as np
 
 import nengo
 from nengo.networks.product import Product
-from nengo.utils.compat import range
 from nengo.utils.magic import memoize
 
 
@@ -36,55 +35,53 @@ def transform_in(dims, align, invert):
     if align not in ('A', 'B'):
         raise ValueError("'align' must be either 'A' or 'B'")
 
-    dims2 = 4 * (dims // 2 + 1)
-    tr = np.zeros((dims2, dims))
-    dft = dft_half(dims)
+    dft = dft_half(dims) if not invert else dft_half(dims).conj()
+    if align == 'A':
+        rows = [dft.real, dft.imag, dft.real, dft.imag]
+    else:  # align == 'B'
+        rows = [dft.real, dft.imag, dft.imag, dft.real]
 
-    for i in range(dims2):
-        row = dft[i // 4] if not invert else dft[i // 4].conj()
-        if align == 'A':
-            tr[i] = row.real if i % 2 == 0 else row.imag
-        else:  # align == 'B'
-            tr[i] = row.real if i % 4 == 0 or i % 4 == 3 else row.imag
-
-    remove_imag_rows(tr)
-    return tr.reshape((-1, dims))
+    tr = np.array(rows).transpose(1, 0, 2).reshape(-1, dims)
+    return remove_imag_rows(tr)
 
 
+@memoize
 def transform_out(dims):
-    dims2 = (dims // 2 + 1)
-    tr = np.zeros((dims2, 4, dims))
     idft = dft_half(dims).conj()
-
-    for i in range(dims2):
-        row = idft[i] if i == 0 or 2*i == dims else 2*idft[i]
-        tr[i, 0] = row.real
-        tr[i, 1] = -row.real
-        tr[i, 2] = -row.imag
-        tr[i, 3] = -row.imag
-
-    tr = tr.reshape(4*dims2, dims)
-    remove_imag_rows(tr)
+    # the negative frequencies are the conjugates of the positive ones,
+    # except for the DC component and (for even dims) the Nyquist frequency
+    scale = 2 * np.ones(dims // 2 + 1)
+    scale[0] = 1
+    if dims % 2 == 0:
+        scale[-1] = 1
+    idft = idft * scale[:, None]
+
+    rows = [idft.real, -idft.real, -idft.imag, -idft.imag]
+    tr = np.array(rows).transpose(1, 0, 2).reshape(-1, dims)
     # IDFT has a 1/D scaling factor
-    tr /= dims
-
-    return tr.T
+    return remove_imag_rows(tr).T / dims
 
 
 def remove_imag_rows(tr):
-    """Throw away imaginary row we don't need (since they're zero)"""
+    """Throw away imaginary rows we don't need (since they're zero).
+
+    These are the products involving the imaginary parts of the DC
+    component and (for even dims) the Nyquist frequency.
+    """
     i = np.arange(tr.shape[0])
     if tr.shape[1] % 2 == 0:
-        tr = tr[(i == 0) | (i > 3) & (i < len(i) - 3)]
+        return tr[(i == 0) | (i > 3) & (i < len(i) - 3)]
     else:
-        tr = tr[(i == 0) | (i > 3)]
+        return tr[(i == 0) | (i > 3)]
 
 
 @memoize
 def dft_half(n):
     x = np.arange(n)
     w = np.arange(n // 2 + 1)
-    return np.exp((-2.j * np.pi / n) * (w[:, None] * x[None, :]))
+    # look up the n roots of unity rather than exponentiating every entry
+    roots = np.exp((-2.j * np.pi / n) * x)
+    return roots[np.outer(w, x) % n]
 
 
 def CircularConvolution(n_neurons, dimensions, invert_a=False, invert_b=False,
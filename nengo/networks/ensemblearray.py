@@ -38,6 +38,12 @@ class EnsembleArray(nengo.Network):
         Random number seed that will be used in the build step.
     add_to_container : bool, optional
         Whether this network will be added to the current context.
+    share_params : bool, optional
+        Whether to build all sub-ensembles with the same seed, so that they
+        have identical neuron parameters and the decoders of each output are
+        only solved for once. This makes building large arrays much faster,
+        but the errors of all sub-ensembles are then identical, rather than
+        independent. Default: False.
 
     Additional parameters for each sub-ensemble can be passed through
     ``**ens_kwargs``.
@@ -45,7 +51,7 @@ class EnsembleArray(nengo.Network):
 
     def __init__(self, n_neurons, n_ensembles, ens_dimensions=1,
                  neuron_nodes=False, label=None, seed=None,
-                 add_to_container=None, **ens_kwargs):
+                 add_to_container=None, share_params=False, **ens_kwargs):
         if "dimensions" in ens_kwargs:
             raise TypeError(
                 "'dimensions' is not a valid argument to EnsembleArray. "
@@ -61,6 +67,7 @@ class EnsembleArray(nengo.Network):
         self.n_neurons = n_neurons
         self.n_ensembles = n_ensembles
         self.dimensions_per_ensemble = ens_dimensions
+        self.share_params = share_params
 
         # These may be set in add_neuron_input and add_neuron_output
         self.neuron_input, self.neuron_output = None, None
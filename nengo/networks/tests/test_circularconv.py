@@ -25,6 +25,25 @@ def test_circularconv_transforms(invert_a, invert_b, rng):
     assert np.allclose(z0, z1)
 
 
+@pytest.mark.parametrize('dims', [16, 17])
+def test_circularconv_zero_rows(dims, rng):
+    """The rows for the imaginary parts of real frequencies are dropped"""
+    n_products = 4 * (dims // 2 + 1) - (6 if dims % 2 == 0 else 3)
+    tr_a = transform_in(dims, 'A', False)
+    tr_b = transform_in(dims, 'B', False)
+    tr_out = transform_out(dims)
+    assert tr_a.shape == tr_b.shape == (n_products, dims)
+    assert tr_out.shape == (dims, n_products)
+
+    x = rng.randn(dims)
+    y = rng.randn(dims)
+    assert np.all(np.abs(np.dot(tr_a, x) * np.dot(tr_b, y)) > 1e-12)
+
+    with nengo.Network():
+        cconv = nengo.networks.CircularConvolution(10, dims)
+    assert cconv.product.A.size_in == n_products
+
+
 def test_input_magnitude(Simulator, seed, rng, dims=16, magnitude=10):
     """Test to make sure the magnitude scaling works.
 
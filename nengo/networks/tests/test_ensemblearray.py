@@ -237,3 +237,77 @@ def test_neuronoutput(Simulator, seed):
     s = Simulator(net)
     s.run(0.01)
     assert np.all(s.data[p] < 1e-2)
+
+
+def test_block_connections(Simulator, seed):
+    from nengo.builder.operator import BlockInc
+
+    with nengo.Network(seed=seed) as net:
+        inp = nengo.Node(lambda t: np.sin(10 * t + np.arange(3)))
+        ea = nengo.networks.EnsembleArray(20, 3, ens_dimensions=2)
+        ea.add_neuron_output()
+        ea.add_output('filtered', function=None, synapse=0.005)
+        nengo.Connection(inp, ea.input[::2])
+        p_out = nengo.Probe(ea.output)
+        p_neurons = nengo.Probe(ea.neuron_output)
+        p_filtered = nengo.Probe(ea.filtered)
+
+    sim = Simulator(net)
+    sim.run(0.1)
+
+    # input, output, and neuron_output each have one operator,
+    # while the filtered connections are built separately
+    blocks = [op for op in sim.model.operators if isinstance(op, BlockInc)]
+    assert len(blocks) == 3
+    assert all(len(op.A) == 3 for op in blocks)
+
+    # sub-ensemble connections are still available
+    conns = [c for c in ea.connections if c.post_obj is ea.output]
+    assert len(conns) == 3
+    spikes = sim.data[p_neurons].reshape(-1, 3, 20)
+    out = np.hstack([np.dot(spikes[:, i], sim.data[c].weights.T)
+                     for i, c in enumerate(conns)])
+    assert np.allclose(sim.data[p_out], out)
+
+    filtered = nengo.synapses.filt(sim.data[p_out], nengo.Lowpass(0.005),
+                                   sim.dt)
+    assert np.allclose(sim.data[p_filtered][1:], filtered[:-1])
+
+
+def test_share_params(Simulator, seed):
+    with nengo.Network(seed=seed) as net:
+        inp = nengo.Node(lambda t: np.sin(10 * t + np.arange(4)))
+        ea = nengo.networks.EnsembleArray(30, 4, share_params=True)
+        ea.add_output('square', function=np.square)
+        nengo.Connection(inp, ea.input, synapse=None)
+        p_out = nengo.Probe(ea.output, synapse=0.01)
+        p_square = nengo.Probe(ea.square, synapse=0.01)
+
+    sim = Simulator(net)
+    sim.run(0.2)
+
+    for node in (ea.output, ea.square):
+        conns = [c for c in ea.connections if c.post_obj is node]
+        assert all(np.all(sim.data[c].weights == sim.data[conns[0]].weights)
+                   for c in conns[1:])
+    assert all(np.all(sim.data[e].gain == sim.data[ea.ea_ensembles[0]].gain)
+               for e in ea.ea_ensembles[1:])
+
+    t = sim.trange()
+    target = nengo.synapses.filt(
+        np.sin(10 * t[:, None] + np.arange(4)), nengo.Lowpass(0.01), sim.dt)
+    assert np.allclose(sim.data[p_out][t > 0.05], target[t > 0.05],
+                       atol=0.15)
+    assert np.allclose(sim.data[p_square][t > 0.05], target[t > 0.05] ** 2,
+                       atol=0.15)
+
+
+def test_share_params_explicit_seed(Simulator, seed):
+    ea = nengo.networks.EnsembleArray(10, 3, share_params=True, seed=seed)
+    ea.ea_ensembles[1].seed = seed + 1
+
+    sim = Simulator(ea)
+    gains = [sim.data[e].gain for e in ea.ea_ensembles]
+    assert np.all(gains[2] == gains[0])
+    assert not np.all(gains[1] == gains[0])
+    assert sim.model.seeds[ea.ea_ensembles[1]] == seed + 1
@@ -4,7 +4,8 @@ import numpy as np
 
 import nengo.utils.numpy as npext
 from nengo.base import NengoObject, ObjView
-from nengo.params import Default, IntParam, Parameter, StringParam
+from nengo.params import (
+    BoolParam, Default, IntParam, Parameter, StringParam)
 from nengo.processes import Process
 from nengo.utils.stdlib import checked_call
 
@@ -27,6 +28,8 @@ class OutputParam(Parameter):
             if node.size_out is None:
                 node.size_out = output.default_size_out
         elif callable(output):
+            if node.vectorized and node.size_in > 0:
+                raise ValueError("Vectorized nodes cannot have input")
             # We trust user's size_out if set, because calling output
             # may have unintended consequences (e.g., network communication)
             if node.size_out is None:
@@ -44,6 +47,8 @@ class OutputParam(Parameter):
 
     def validate_callable(self, node, output):
         t, x = 0.0, np.zeros(node.size_in)
+        if node.vectorized:
+            t = np.zeros(1)
         args = (t, x) if node.size_in > 0 else (t,)
         result, invoked = checked_call(output, *args)
         if not invoked:
@@ -55,6 +60,8 @@ class OutputParam(Parameter):
 
         if result is not None:
             result = np.asarray(result)
+            if node.vectorized:
+                result = result[0]  # output for the first (only) time
             if len(result.shape) > 1:
                 raise ValueError("Node output must be a vector (got shape %s)"
                                  % (result.shape,))
@@ -99,6 +106,12 @@ class Node(NengoObject):
         the values of ``output`` and ``size_in``.
     label : str, optional
         A name for the node. Used for debugging and visualization.
+    vectorized : bool, optional
+        Whether ``output`` is a function of an array of times. If True,
+        ``output`` is called with an array of ``n`` times and must return
+        an ``(n, size_out)`` array. The simulator then computes the output
+        of many timesteps in one call. Only nodes without input can be
+        vectorized. Default: False.
 
     Attributes
     ----------
@@ -110,18 +123,22 @@ class Node(NengoObject):
         The number of dimensions of the input data parameter.
     size_out : int
         The number of output dimensions.
+    vectorized : bool
+        Whether ``output`` is a function of an array of times.
     """
 
     output = OutputParam(default=None)
     size_in = IntParam(default=0, low=0)
     size_out = IntParam(default=None, low=0, optional=True)
     label = StringParam(default=None, optional=True)
+    vectorized = BoolParam(default=False)
 
-    def __init__(self, output=Default,
-                 size_in=Default, size_out=Default, label=Default):
+    def __init__(self, output=Default, size_in=Default, size_out=Default,
+                 label=Default, vectorized=Default):
         self.size_in = size_in
         self.size_out = size_out
         self.label = label
+        self.vectorized = vectorized
         self.output = output  # Must be set after size_out; may modify size_out
 
     def __getitem__(self, key):
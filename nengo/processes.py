@@ -1,12 +1,15 @@
 from __future__ import absolute_import
 
+import collections
+
 import numpy as np
 
 import nengo.utils.numpy as npext
-from nengo.dists import DistributionParam, Gaussian
+from nengo.dists import DistributionParam, Gaussian, Uniform
 from nengo.params import BoolParam, IntParam, NumberParam, Parameter
 from nengo.synapses import LinearFilter, LinearFilterParam, Lowpass
 from nengo.utils.compat import range
+from nengo.utils.rng import make_rng, rng_kind, spawn_rng
 
 
 class Process(object):
@@ -31,10 +34,42 @@ class Process(object):
     def make_step(self, size_in, size_out, dt, rng):
         raise NotImplementedError("Process must implement `make_step` method.")
 
+    def make_block_step(self, size_in, size_out, dt, rng):
+        """Create a function that computes many timesteps at once (optional).
+
+        Processes without input can implement this to generate their output
+        in blocks. The returned function ``block_step(t, n)`` returns the
+        output for the ``n`` timesteps starting at time ``t`` as an
+        ``(n, size_out)`` array. Given the same ``rng``, consecutive blocks
+        must give the same output as the function from `make_step`.
+
+        The block step is only used if it is defined by the same class as
+        `make_step`, or by a subclass of it. A subclass that only overrides
+        `make_step` is therefore still run one step at a time.
+
+        Returns None if the process does not support blocks (the default).
+        """
+        return None
+
+    def _make_block_step(self, size_in, size_out, dt, rng):
+        """Returns `make_block_step`, unless `make_step` overrides it."""
+        def defined_by(name):
+            return next(cls for cls in type(self).__mro__
+                        if name in cls.__dict__)
+
+        if not issubclass(defined_by('make_block_step'),
+                          defined_by('make_step')):
+            return None
+        return self.make_block_step(size_in, size_out, dt, rng)
+
     def run_steps(self, n_steps, d=None, dt=None, rng=np.random):
         # TODO: allow running with input
         d = self.default_size_out if d is None else d
         dt = self.default_dt if dt is None else dt
+        block_step = self._make_block_step(0, d, dt, rng)
+        if block_step is not None:
+            return block_step(0., n_steps)
+
         step = self.make_step(0, d, dt, rng)
         output = np.zeros((n_steps, d))
         for i in range(n_steps):
@@ -86,6 +121,14 @@ class WhiteNoise(Process):
         self.scale = scale
 
     def make_step(self, size_in, size_out, dt, rng):
+        block_step = self.make_block_step(size_in, size_out, dt, rng)
+
+        def step(t):
+            return block_step(t, 1)[0]
+
+        return step
+
+    def make_block_step(self, size_in, size_out, dt, rng):
         assert size_in == 0
 
         dist = self.dist
@@ -95,13 +138,13 @@ class WhiteNoise(Process):
         #   since dt / sqrt(dt) = sqrt(dt).
 
         # separate RNG for simulation for step order independence
-        sim_rng = np.random.RandomState(rng.randint(npext.maxint))
+        sim_rng = spawn_rng(rng)
 
-        def step(t):
-            x = dist.sample(n=1, d=size_out, rng=sim_rng)[0]
+        def block_step(t, n):
+            x = sample_steps(dist, n, size_out, sim_rng)
             return alpha * x if scale else x
 
-        return step
+        return block_step
 
 
 class FilteredNoise(Process):
@@ -135,6 +178,14 @@ class FilteredNoise(Process):
         self.scale = scale
 
     def make_step(self, size_in, size_out, dt, rng):
+        block_step = self.make_block_step(size_in, size_out, dt, rng)
+
+        def step(t):
+            return block_step(t, 1)[0]
+
+        return step
+
+    def make_block_step(self, size_in, size_out, dt, rng):
         assert size_in == 0
 
         dist = self.dist
@@ -144,16 +195,18 @@ class FilteredNoise(Process):
         filter_step = self.synapse.make_step(dt, output, **self.synapse_kwargs)
 
         # separate RNG for simulation for step order independence
-        sim_rng = np.random.RandomState(rng.randint(npext.maxint))
+        sim_rng = spawn_rng(rng)
 
-        def step(t):
-            x = dist.sample(n=1, d=size_out, rng=sim_rng)[0]
+        def block_step(t, n):
+            x = sample_steps(dist, n, size_out, sim_rng)
             if scale:
                 x *= alpha
-            filter_step(x)
-            return output
+            for xi in x:
+                filter_step(xi)
+                xi[...] = output
+            return x
 
-        return step
+        return block_step
 
 
 class BrownNoise(FilteredNoise):
@@ -184,32 +237,65 @@ class WhiteSignal(Process):
     The signal is naturally periodic, so it can be used beyond its period
     while still being continuous with continuous derivatives.
 
+    By default, the whole period is generated the first time the signal is
+    needed, from a seed drawn when the step function is made. The signal is
+    generated again each time the step function is made, for example when
+    a simulator is reset. For very long periods, ``chunk`` can be set
+    to generate the signal in pieces of that duration instead, so that
+    memory use does not grow with the period. The chunks are overlapping
+    band-limited segments, blended with a power-complementary window, so
+    the signal stays continuous and keeps its RMS, though some power leaks
+    slightly past the cut-off frequency.
+
     Parameters
     ----------
     period : float
         A white noise signal with this period will be generated.
-        Samples will repeat after this duration.
+        Samples will repeat after this duration. When using chunks,
+        the period is rounded up to a whole number of chunks.
     high : float, optional
         The cut-off frequency of the low-pass filter, in Hz.
         If not specified, no filtering will be done.
     rms : float, optional
         The root mean square power of the filtered signal. Default: 0.5.
+    chunk : float, optional
+        The duration of the segments that the signal is generated in.
+        If not specified, the whole period is generated at once.
     """
-    def __init__(self, period, high=None, rms=0.5):
+
+    chunk = NumberParam(low=0, low_open=True, optional=True)
+
+    def __init__(self, period, high=None, rms=0.5, chunk=None):
         super(WhiteSignal, self).__init__()
         self.period = period
         self.high = high
         self.rms = rms
+        self.chunk = chunk
 
     def make_step(self, size_in, size_out, dt, rng):
+        block_step = self.make_block_step(size_in, size_out, dt, rng)
+
+        def step(t):
+            return block_step(t, 1)[0]
+
+        return step
+
+    def make_block_step(self, size_in, size_out, dt, rng):
         assert size_in == 0
-        d = size_out
+        seed, kind = rng.randint(npext.maxint), rng_kind(rng)
+        if self.chunk is None:
+            return self._make_full_step(seed, kind, size_out, dt)
+        return self._make_chunked_step(seed, kind, size_out, dt)
 
-        n_coefficients = int(np.ceil(self.period / dt / 2.))
+    def _coefficients(self, n_coefficients, d, rng):
         shape = (n_coefficients + 1, d)
         sigma = self.rms * np.sqrt(0.5)
         coefficients = 1j * rng.normal(0., sigma, size=shape)
         coefficients += rng.normal(0., sigma, size=shape)
+        return coefficients
+
+    def _generate(self, coefficients, dt):
+        n_coefficients = coefficients.shape[0] - 1
         coefficients[0] = 0.
         coefficients[-1].imag = 0.
         if self.high is not None:
@@ -220,13 +306,74 @@ class WhiteSignal(Process):
             if power_correction > 0.:
                 coefficients /= power_correction
         coefficients *= np.sqrt(2 * n_coefficients)
-        signal = np.fft.irfft(coefficients, axis=0)
+        return np.fft.irfft(coefficients, axis=0)
 
-        def step(t):
-            i = int(round(t / dt))
-            return signal[i % signal.shape[0]]
-
-        return step
+    def _make_full_step(self, seed, kind, d, dt):
+        n_coefficients = int(np.ceil(self.period / dt / 2.))
+        signal = []  # generated on the first step
+
+        def block_step(t, n):
+            if len(signal) == 0:
+                rng = make_rng(seed, kind=kind)
+                signal.append(self._generate(
+                    self._coefficients(n_coefficients, d, rng), dt))
+            i = int(round(t / dt)) + np.arange(n)
+            return signal[0][i % signal[0].shape[0]]
+
+        return block_step
+
+    def _make_chunked_step(self, seed, kind, d, dt):
+        n_chunk = max(int(np.round(self.chunk / dt)), 1)
+        n_period = 2 * int(np.ceil(self.period / dt / 2.))
+        n_segments = max(int(np.ceil(n_period / float(n_chunk))), 1)
+
+        # Segment k is periodic with length 2 * n_chunk, and fades in over
+        # chunk k - 1 and out over chunk k. The window satisfies
+        # rise**2 + fall**2 == 1, so the power of the sum is unchanged.
+        j = np.arange(n_chunk)
+        rise = np.sin(0.5 * np.pi * np.sin(0.5 * np.pi * j / n_chunk)**2)
+        fall = np.sqrt(1. - rise**2)
+        segments = collections.OrderedDict()
+
+        def segment(k):
+            k = k % n_segments
+            if k not in segments:
+                rng = make_rng(seed, stream=k, kind=kind)
+                segments[k] = self._generate(
+                    self._coefficients(n_chunk, d, rng), dt)
+                while len(segments) > 3:
+                    segments.popitem(last=False)
+            return segments[k]
+
+        def block_step(t, n):
+            i = (int(round(t / dt)) + np.arange(n)) % (n_segments * n_chunk)
+            chunks, ji = i // n_chunk, i % n_chunk
+            out = np.zeros((n, d))
+            for k in np.unique(chunks):
+                m = chunks == k
+                jm = ji[m]
+                out[m] = (fall[jm, None] * segment(k)[n_chunk + jm]
+                          + rise[jm, None] * segment(k + 1)[jm])
+            return out
+
+        return block_step
+
+
+def sample_steps(dist, n, d, rng):
+    """Draws ``d``-dimensional samples from ``dist`` for ``n`` timesteps.
+
+    The samples are the same as drawing one timestep at a time. Gaussian
+    and Uniform samples are drawn element by element, so these are drawn
+    all at once. Other distributions are sampled one timestep at a time.
+    """
+    if type(dist) in (Gaussian, Uniform):
+        return np.asarray(dist.sample(n=n, d=d, rng=rng),
+                          dtype=np.float64).reshape(n, d)
+
+    x = np.zeros((n, d))
+    for i in range(n):
+        x[i] = dist.sample(n=1, d=d, rng=rng)[0]
+    return x
 
 
 class ProcessParam(Parameter):
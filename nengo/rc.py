@@ -33,6 +33,10 @@ logger = logging.getLogger(__name__)
 # The default core Nengo RC settings. Access with
 #   nengo.RC_DEFAULTS[section_name][option_name]
 RC_DEFAULTS = {
+    'builder': {
+        'threads': 1,
+        'rng': 'mt19937',
+    },
     'decoder_cache': {
         'enabled': True,
         'readonly': False,
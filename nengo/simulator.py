@@ -14,10 +14,12 @@ import numpy as np
 import nengo.utils.numpy as npext
 from nengo.builder import Model
 from nengo.builder.signal import SignalDict
+from nengo.builder.synapses import merge_synapses
 from nengo.cache import get_default_decoder_cache
 from nengo.utils.compat import range
 from nengo.utils.graphs import toposort
 from nengo.utils.progress import ProgressTracker
+from nengo.utils.rng import make_rng
 from nengo.utils.simulator import operator_depencency_graph
 
 logger = logging.getLogger(__name__)
@@ -109,13 +111,16 @@ class Simulator(object):
 
         self.model.decoder_cache.shrink()
 
+        # Simulate synapses with the same filter together
+        operators = merge_synapses(self.model.operators, self.model.dt)
+
         # -- map from Signal.base -> ndarray
         self.signals = SignalDict(__time__=np.asarray(0.0, dtype=np.float64))
-        for op in self.model.operators:
+        for op in operators:
             op.init_signals(self.signals)
 
         # Order the steps (they are made in `Simulator.reset`)
-        self.dg = operator_depencency_graph(self.model.operators)
+        self.dg = operator_depencency_graph(operators)
         self._step_order = [op for op in toposort(self.dg)
                             if hasattr(op, 'make_step')]
 
@@ -258,7 +263,7 @@ class Simulator(object):
                 self.signals.reset(key)
 
         # rebuild steps (resets ops with their own state, like Processes)
-        self.rng = np.random.RandomState(self.seed)
+        self.rng = make_rng(self.seed)
         self._steps = [op.make_step(self.signals, self.dt, self.rng)
                        for op in self._step_order]
 
@@ -201,6 +201,13 @@ class Solver(with_metaclass(DocstringInheritor)):
     Decoder or weight solver.
     """
 
+    # True if solving for weights is equivalent to solving for decoders and
+    # multiplying by the encoders, which allows the weights to be factored
+    compositional = True
+    factored = False
+    # True if the weights should be stored as a sparse matrix
+    sparse = False
+
     def __call__(self, A, Y, rng=None, E=None):
         """Call the solver.
 
@@ -271,15 +278,20 @@ class Solver(with_metaclass(DocstringInheritor)):
 class Lstsq(Solver):
     """Unregularized least-squares"""
 
-    def __init__(self, weights=False, rcond=0.01):
+    def __init__(self, weights=False, rcond=0.01, factored=False):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
         rcond : float, optional
             Cut-off ratio for small singular values (see `numpy.linalg.lstsq`).
+        factored : boolean, optional
+            If true (and ``weights`` is true), the weights are kept factored
+            into decoders and post-population encoders during simulation,
+            rather than forming the full weight matrix.
         """
         self.rcond = rcond
         self.weights = weights
+        self.factored = factored
 
     def __call__(self, A, Y, rng=None, E=None):
         Y = self.mul_encoders(Y, E)
@@ -293,7 +305,8 @@ class Lstsq(Solver):
 class _LstsqNoiseSolver(Solver):
     """Base for least-squares solvers with noise"""
 
-    def __init__(self, weights=False, noise=0.1, solver=cholesky, **kwargs):
+    def __init__(self, weights=False, noise=0.1, solver=cholesky,
+                 factored=False, **kwargs):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
@@ -301,12 +314,17 @@ class _LstsqNoiseSolver(Solver):
             Amount of noise, as a fraction of the neuron activity.
         solver : callable, optional
             Subsolver to use for solving the least-squares problem.
+        factored : boolean, optional
+            If true (and ``weights`` is true), the weights are kept factored
+            into decoders and post-population encoders during simulation,
+            rather than forming the full weight matrix.
         kwargs
             Additional arguments passed to `solver`.
         """
         self.weights = weights
         self.noise = noise
         self.solver = solver
+        self.factored = factored
         self.kwargs = kwargs
 
 
@@ -334,7 +352,8 @@ class LstsqMultNoise(_LstsqNoiseSolver):
 class _LstsqL2Solver(Solver):
     """Base for L2-regularized least-squares solvers"""
 
-    def __init__(self, weights=False, reg=0.1, solver=cholesky, **kwargs):
+    def __init__(self, weights=False, reg=0.1, solver=cholesky,
+                 factored=False, **kwargs):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
@@ -342,12 +361,17 @@ class _LstsqL2Solver(Solver):
             Amount of regularization, as a fraction of the neuron activity.
         solver : callable, optional
             Subsolver to use for solving the least-squares problem.
+        factored : boolean, optional
+            If true (and ``weights`` is true), the weights are kept factored
+            into decoders and post-population encoders during simulation,
+            rather than forming the full weight matrix.
         kwargs
             Additional arguments passed to `solver`.
         """
         self.weights = weights
         self.reg = reg
         self.solver = solver
+        self.factored = factored
         self.kwargs = kwargs
 
 
@@ -382,7 +406,9 @@ class LstsqL1(Solver):
 
     This method is well suited for creating sparse decoders or weight matrices.
     """
-    def __init__(self, weights=False, l1=1e-4, l2=1e-6):
+    compositional = False
+
+    def __init__(self, weights=False, l1=1e-4, l2=1e-6, sparse=False):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
@@ -390,12 +416,16 @@ class LstsqL1(Solver):
             Amount of L1 regularization.
         l2 : float, optional
             Amount of L2 regularization.
+        sparse : boolean, optional
+            If true (and ``weights`` is true), the weights are stored as a
+            sparse matrix, and only their nonzero values are simulated.
         """
         import sklearn.linear_model  # noqa F401, import to check existence
         assert sklearn.linear_model
         self.weights = weights
         self.l1 = l1
         self.l2 = l2
+        self.sparse = sparse
 
     def __call__(self, A, Y, rng=None, E=None):
         import sklearn.linear_model
@@ -428,8 +458,11 @@ class LstsqDrop(Solver):
     L2 regularization, drops those nearest to zero, and retrains remaining.
     """
 
+    compositional = False
+
     def __init__(self, weights=False, drop=0.25,
-                 solver1=LstsqL2nz(reg=0.1), solver2=LstsqL2nz(reg=0.01)):
+                 solver1=LstsqL2nz(reg=0.1), solver2=LstsqL2nz(reg=0.01),
+                 sparse=False):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
@@ -439,11 +472,15 @@ class LstsqDrop(Solver):
             Solver for finding the initial decoders.
         solver2 : Solver, optional
             Used for re-solving for the decoders after dropout.
+        sparse : boolean, optional
+            If true (and ``weights`` is true), the weights are stored as a
+            sparse matrix, and only their nonzero values are simulated.
         """
         self.weights = weights
         self.drop = drop
         self.solver1 = solver1
         self.solver2 = solver2
+        self.sparse = sparse
 
     def __call__(self, A, Y, rng=None, E=None):
         Y, m, n, d, matrix_in = _format_system(A, Y)
@@ -474,14 +511,20 @@ class Nnls(Solver):
 
     Similar to `lstsq`, except the output values are non-negative.
     """
-    def __init__(self, weights=False):
+    compositional = False
+
+    def __init__(self, weights=False, sparse=False):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
+        sparse : boolean, optional
+            If true (and ``weights`` is true), the weights are stored as a
+            sparse matrix, and only their nonzero values are simulated.
         """
         import scipy.optimize  # import here too to throw error early
         assert scipy.optimize
         self.weights = weights
+        self.sparse = sparse
 
     def __call__(self, A, Y, rng=None, E=None):
         import scipy.optimize
@@ -503,14 +546,17 @@ class NnlsL2(Nnls):
 
     Similar to `lstsq_L2`, except the output values are non-negative.
     """
-    def __init__(self, weights=False, reg=0.1):
+    def __init__(self, weights=False, reg=0.1, sparse=False):
         """
         weights : boolean, optional
             If false solve for decoders (default), otherwise solve for weights.
         reg : float, optional
             Amount of regularization, as a fraction of the neuron activity.
+        sparse : boolean, optional
+            If true (and ``weights`` is true), the weights are stored as a
+            sparse matrix, and only their nonzero values are simulated.
         """
-        super(NnlsL2, self).__init__(weights)
+        super(NnlsL2, self).__init__(weights, sparse=sparse)
         self.reg = reg
 
     def _solve(self, A, Y, rng, E, sigma):
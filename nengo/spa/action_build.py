@@ -2,8 +2,39 @@
 import nengo
 import numpy as np
 
+from nengo.networks.circularconvolution import circconv
 
-def convolution(module, target_name, effect, n_neurons_cconv, synapse):
+
+def direct_convolution(dimensions, invert_a=False, invert_b=False,
+                       gated=False, label=None):
+    """Compute a circular convolution with a Node instead of neurons.
+
+    Returns a network with ``A``, ``B`` and ``output`` attributes, like
+    `nengo.networks.CircularConvolution`. If ``gated`` is True, the network
+    also has a scalar ``gate`` input that the result is multiplied by.
+    """
+    D = dimensions
+
+    def product(t, x):
+        y = circconv(x[:D], x[D:2 * D], invert_a=invert_a, invert_b=invert_b)
+        return y * x[2 * D] if gated else y
+
+    net = nengo.Network(label=label)
+    with net:
+        net.A = nengo.Node(size_in=D, label='A')
+        net.B = nengo.Node(size_in=D, label='B')
+        net.output = nengo.Node(product, size_in=2 * D + int(gated),
+                                size_out=D, label='output')
+        nengo.Connection(net.A, net.output[:D], synapse=None)
+        nengo.Connection(net.B, net.output[D:2 * D], synapse=None)
+        if gated:
+            net.gate = nengo.Node(size_in=1, label='gate')
+            nengo.Connection(net.gate, net.output[2 * D:], synapse=None)
+    return net
+
+
+def convolution(module, target_name, effect, n_neurons_cconv, synapse,
+                direct=False, gated=False):
     """Implement an action_objects.Convolution.
 
     Parameters
@@ -18,6 +49,11 @@ def convolution(module, target_name, effect, n_neurons_cconv, synapse):
         Number of neurons in each product population
     synapse : float (or nengo.Synapse)
         The synapse to use for connections into and out of the convolution
+    direct : bool
+        Whether to compute the convolution directly with a Node (see
+        `direct_convolution`) instead of with neurons
+    gated : bool
+        Whether the direct convolution has a ``gate`` input
 
     Returns the created nengo.networks.CircularConvolution.
     """
@@ -29,11 +65,15 @@ def convolution(module, target_name, effect, n_neurons_cconv, synapse):
     s2_output, s2_vocab = module.spa.get_module_output(source2.name)
 
     with module:
-        cconv = nengo.networks.CircularConvolution(
-            n_neurons_cconv, s1_vocab.dimensions,
-            invert_a=False,
-            invert_b=False,
-            net=nengo.Network(label='cconv_%s' % str(effect)))
+        if direct:
+            cconv = direct_convolution(s1_vocab.dimensions, gated=gated,
+                                       label='cconv_%s' % str(effect))
+        else:
+            cconv = nengo.networks.CircularConvolution(
+                n_neurons_cconv, s1_vocab.dimensions,
+                invert_a=False,
+                invert_b=False,
+                net=nengo.Network(label='cconv_%s' % str(effect)))
 
     with module.spa:
         # compute the requested transform
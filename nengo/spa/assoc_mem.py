@@ -52,6 +52,10 @@ class AssociativeMemory(Module):
     n_neurons_per_ensemble: int, optional
         Number of neurons per ensemble in the associative memory. There is
         one ensemble created per vector being compared.
+    share_params: boolean, optional
+        Flag to indicate if ensembles with the same threshold should share
+        their neuron parameters and decoders, which makes building large
+        associative memories much faster.
 
     """
 
@@ -61,7 +65,7 @@ class AssociativeMemory(Module):
                  inhibitable=False, inhibit_scale=1.5, wta_output=False,
                  wta_inhibit_scale=3.0, wta_synapse=0.005,
                  threshold_output=False, label=None, seed=None,
-                 add_to_container=None, **ens_args):
+                 add_to_container=None, share_params=False, **ens_args):
         super(AssociativeMemory, self).__init__(label, seed, add_to_container)
 
         if input_keys is None:
@@ -101,6 +105,7 @@ class AssociativeMemory(Module):
                 threshold_output=threshold_output,
                 label=label, seed=seed,
                 add_to_container=add_to_container,
+                share_params=share_params,
                 **ens_args)
 
             for ens, inkey, outkey in zip(
@@ -15,14 +15,26 @@ class BasalGanglia(Module):
         The actions to choose between
     input_synapse : float
         The synaptic filter on all input connections
+    direct : bool
+        Whether to select the action with the highest utility directly with
+        a Node instead of with neurons. The output is 0 for the selected
+        action (or actions, if there is a tie) and -1 for all others.
     """
-    def __init__(self, actions, input_synapse=0.002,
+    def __init__(self, actions, input_synapse=0.002, direct=False,
                  label=None, seed=None, add_to_container=None):
         self.actions = actions
         self.input_synapse = input_synapse
         self._bias = None
         Module.__init__(self, label, seed, add_to_container)
-        nengo.networks.BasalGanglia(dimensions=self.actions.count, net=self)
+        if direct:
+            with self:
+                self.input = nengo.Node(
+                    lambda t, x: np.where(x < x.max(), -1., 0.),
+                    size_in=self.actions.count, label='selection')
+            self.output = self.input
+        else:
+            nengo.networks.BasalGanglia(dimensions=self.actions.count,
+                                        net=self)
 
     @property
     def bias(self):
@@ -1,4 +1,5 @@
 import nengo
+from nengo.spa.action_build import direct_convolution
 from nengo.spa.module import Module
 
 
@@ -20,10 +21,13 @@ class Bind(Module):
         correlation instead of circular convolution.
     input_magnitude : float
         The expected magnitude (vector norm) of the two input values.
+    direct : bool
+        Whether to compute the convolution directly with a Node instead of
+        with neurons
     """
     def __init__(self, dimensions, vocab=None, n_neurons=200, invert_a=False,
-                 invert_b=False, input_magnitude=1.0, label=None, seed=None,
-                 add_to_container=None):
+                 invert_b=False, input_magnitude=1.0, direct=False, label=None,
+                 seed=None, add_to_container=None):
         super(Bind, self).__init__(label, seed, add_to_container)
         if vocab is None:
             # use the default vocab for this number of dimensions
@@ -34,9 +38,12 @@ class Bind(Module):
                              (vocab.dimensions, dimensions))
 
         with self:
-            self.cc = nengo.networks.CircularConvolution(
-                n_neurons, dimensions, invert_a, invert_b,
-                input_magnitude=input_magnitude)
+            if direct:
+                self.cc = direct_convolution(dimensions, invert_a, invert_b)
+            else:
+                self.cc = nengo.networks.CircularConvolution(
+                    n_neurons, dimensions, invert_a, invert_b,
+                    input_magnitude=input_magnitude)
             self.A = self.cc.A
             self.B = self.cc.B
             self.output = self.cc.output
@@ -48,6 +48,11 @@ class Buffer(Module):
             raise ValueError('Number of dimensions(%d) must be divisible by '
                              'subdimensions(%d)' % (dimensions, subdimensions))
 
+        # Direct mode ensembles do not need to be split up
+        self.direct = direct
+        if direct:
+            subdimensions = dimensions
+
         with self:
             self.state = nengo.networks.EnsembleArray(
                 neurons_per_dimension * subdimensions,
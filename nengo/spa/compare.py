@@ -18,9 +18,12 @@ class Compare(Module):
     input_magnitude : float
         Effective input magnitude for the multiplication.
         The actual input magnitude will be this value times sqrt(2)
+    direct : bool
+        Whether to compute the dot product directly with a Node instead of
+        with neurons
     """
     def __init__(self, dimensions, vocab=None, neurons_per_multiply=200,
-                 input_magnitude=1.0, label=None, seed=None,
+                 input_magnitude=1.0, direct=False, label=None, seed=None,
                  add_to_container=None):
         super(Compare, self).__init__(label, seed, add_to_container)
         if vocab is None:
@@ -28,19 +31,26 @@ class Compare(Module):
             vocab = dimensions
 
         with self:
-            self.product = nengo.networks.Product(
-                neurons_per_multiply, dimensions,
-                input_magnitude=input_magnitude)
-
             self.inputA = nengo.Node(size_in=dimensions, label='inputA')
             self.inputB = nengo.Node(size_in=dimensions, label='inputB')
-            self.output = nengo.Node(size_in=1, label='output')
+
+            if direct:
+                self.output = nengo.Node(
+                    lambda t, x: [np.dot(x[:dimensions], x[dimensions:])],
+                    size_in=2 * dimensions, size_out=1, label='output')
+                nengo.Connection(self.inputA, self.output[:dimensions],
+                                 synapse=None)
+                nengo.Connection(self.inputB, self.output[dimensions:],
+                                 synapse=None)
+            else:
+                self.product = nengo.networks.Product(
+                    neurons_per_multiply, dimensions,
+                    input_magnitude=input_magnitude)
+                self.output = nengo.Node(size_in=1, label='output')
+                nengo.Connection(self.inputA, self.product.A, synapse=None)
+                nengo.Connection(self.inputB, self.product.B, synapse=None)
+                nengo.Connection(self.product.output, self.output,
+                                 transform=np.ones((1, dimensions)))
 
         self.inputs = dict(A=(self.inputA, vocab), B=(self.inputB, vocab))
         self.outputs = dict(default=(self.output, None))
-
-        with self:
-            nengo.Connection(self.inputA, self.product.A, synapse=None)
-            nengo.Connection(self.inputB, self.product.B, synapse=None)
-            nengo.Connection(self.product.output, self.output,
-                             transform=np.ones((1, dimensions)))
@@ -18,13 +18,17 @@ class Cortical(Module):
         The synaptic filter to use for the connections
     neurons_cconv : int
         Number of neurons per circular convolution dimension
+    direct : bool
+        Whether to compute circular convolutions directly with Nodes
+        instead of with neurons
     """
     def __init__(self, actions, synapse=0.01, neurons_cconv=200,
-                 label=None, seed=None, add_to_container=None):
+                 direct=False, label=None, seed=None, add_to_container=None):
         super(Cortical, self).__init__(label, seed, add_to_container)
         self.actions = actions
         self.synapse = synapse
         self.neurons_cconv = neurons_cconv
+        self.direct = direct
         self._bias = None
 
     def on_add(self, spa):
@@ -119,4 +123,5 @@ class Cortical(Module):
             The details of the convolution to implement
         """
         nengo.spa.action_build.convolution(self, target_name, effect,
-                                           self.neurons_cconv, self.synapse)
+                                           self.neurons_cconv, self.synapse,
+                                           direct=self.direct)
@@ -1,6 +1,7 @@
 import nengo
 from nengo.spa.module import Module
 from nengo.utils.compat import iteritems
+from nengo.utils.functions import piecewise
 
 
 def make_parse_func(func, vocab):
@@ -28,6 +29,14 @@ class Input(Module):
 
         Input(vision=input1, task='X')
 
+    If an input only changes at known times, it can instead be given as a
+    dictionary mapping start times to strings, as in
+    `nengo.utils.functions.piecewise`. The strings are parsed once and the
+    resulting schedule is looked up by time, without calling Python code on
+    every timestep::
+
+        Input(vision={0: 'A', 0.1: '0'}, task='X')
+
     """
 
     def __init__(self, label=None, seed=None, add_to_container=None, **kwargs):
@@ -41,13 +50,19 @@ class Input(Module):
 
         for name, value in iteritems(self.kwargs):
             target, vocab = spa.get_module_input(name)
-            if callable(value):
+            vectorized = False
+            if isinstance(value, dict):
+                val = piecewise(dict((t, vocab.parse(text).v)
+                                     for t, text in iteritems(value)))
+                vectorized = True
+            elif callable(value):
                 val = make_parse_func(value, vocab)
             else:
                 val = vocab.parse(value).v
 
             with self:
-                node = nengo.Node(val, label='input_%s' % name)
+                node = nengo.Node(val, label='input_%s' % name,
+                                  vectorized=vectorized)
             self.input_nodes[name] = node
 
             with spa:
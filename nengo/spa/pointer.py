@@ -1,6 +1,6 @@
 import numpy as np
 
-from nengo.utils.compat import is_integer, is_number, range
+from nengo.utils.compat import is_integer, is_number
 
 
 class SemanticPointer(object):
@@ -8,8 +8,15 @@ class SemanticPointer(object):
 
     Operators are overloaded so that + and - are addition, * is circular
     convolution, and ~ is the inversion operator.
+
+    The Fourier spectrum of the vector is cached for circular convolutions.
+    The cache is cleared whenever `v` is assigned to (including augmented
+    assignments like ``p.v *= 2``); if elements of `v` are changed in place
+    (e.g., ``p.v[0] = 1``), assign `v` afterwards (``p.v = p.v``).
     """
 
+    _spectrum = None
+
     def __init__(self, data, rng=None):
         if is_integer(data):
             if data < 1:
@@ -25,6 +32,22 @@ class SemanticPointer(object):
             if len(self.v.shape) != 1:
                 raise Exception("data must be a vector")
 
+    @property
+    def v(self):
+        return self._v
+
+    @v.setter
+    def v(self, v):
+        self._v = v
+        self._spectrum = None
+
+    @property
+    def spectrum(self):
+        """The real FFT of the vector (see `numpy.fft.rfft`)."""
+        if self._spectrum is None:
+            self._spectrum = np.fft.rfft(self._v)
+        return self._spectrum
+
     def length(self):
         """Return the L2 norm of the vector."""
         return np.linalg.norm(self.v)
@@ -49,12 +72,10 @@ class SemanticPointer(object):
 
     def make_unitary(self):
         """Make the vector unitary."""
-        fft_val = np.fft.fft(self.v)
-        fft_imag = fft_val.imag
-        fft_real = fft_val.real
-        fft_norms = np.sqrt(fft_imag ** 2 + fft_real ** 2)
-        fft_unit = fft_val / fft_norms
-        self.v = np.array((np.fft.ifft(fft_unit)).real)
+        fft_val = self.spectrum
+        fft_unit = fft_val / np.abs(fft_val)
+        self.v = np.fft.irfft(fft_unit, n=len(self.v))
+        self._spectrum = fft_unit
 
     def __add__(self, other):
         return SemanticPointer(data=self.v + other.v)
@@ -87,8 +108,10 @@ class SemanticPointer(object):
 
     def convolve(self, other):
         """Return the circular convolution of two SemanticPointers."""
-        x = np.fft.ifft(np.fft.fft(self.v) * np.fft.fft(other.v)).real
-        return SemanticPointer(data=x)
+        spectrum = self.spectrum * other.spectrum
+        p = SemanticPointer(data=np.fft.irfft(spectrum, n=len(self.v)))
+        p._spectrum = spectrum
+        return p
 
     def __rmul__(self, other):
         """Multiplication of two SemanticPointers is circular convolution.
@@ -108,8 +131,9 @@ class SemanticPointer(object):
         If mutliplied by a scaler, we do normal multiplication.
         """
         if isinstance(other, SemanticPointer):
-            self.v = np.fft.ifft(np.fft.fft(self.v) *
-                                 np.fft.fft(other.v)).real
+            spectrum = self.spectrum * other.spectrum
+            self.v = np.fft.irfft(spectrum, n=len(self.v))
+            self._spectrum = spectrum
         elif is_number(other):
             self.v *= other
         else:
@@ -151,7 +175,10 @@ class SemanticPointer(object):
 
         For the vector [1,2,3,4,5], the inverse is [1,5,4,3,2].
         """
-        return SemanticPointer(data=self.v[-np.arange(len(self))])
+        p = SemanticPointer(data=self.v[-np.arange(len(self))])
+        if self._spectrum is not None:
+            p._spectrum = np.conj(self._spectrum)
+        return p
 
     def __len__(self):
         """Return the number of dimensions in the vector."""
@@ -171,7 +198,4 @@ class SemanticPointer(object):
         This should be such that A*B == dot(A.get_convolution_matrix, B.v)
         """
         D = len(self.v)
-        T = []
-        for i in range(D):
-            T.append([self.v[(i - j) % D] for j in range(D)])
-        return np.array(T)
+        return self.v[np.subtract.outer(np.arange(D), np.arange(D)) % D]
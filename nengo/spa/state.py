@@ -27,11 +27,14 @@ class State(Module):
         The synapse on the feedback connection
     vocab : Vocabulary, optional
         The vocabulary to use to interpret this vector
+    direct : bool
+        Whether to represent the vector directly with a Node instead of
+        with neurons
     """
 
     def __init__(self, dimensions, subdimensions=16, neurons_per_dimension=50,
-                 feedback=0.0, feedback_synapse=0.1, vocab=None, label=None,
-                 seed=None, add_to_container=None):
+                 feedback=0.0, feedback_synapse=0.1, vocab=None, direct=False,
+                 label=None, seed=None, add_to_container=None):
         super(State, self).__init__(label, seed, add_to_container)
 
         if vocab is None:
@@ -50,14 +53,18 @@ class State(Module):
                              "dimensions (%d)" % (dimensions, subdimensions))
 
         with self:
-            self.state_ensembles = EnsembleArray(
-                neurons_per_dimension * subdimensions,
-                dimensions // subdimensions,
-                ens_dimensions=subdimensions,
-                radius=np.sqrt(float(subdimensions) / dimensions),
-                label='state')
-            self.input = self.state_ensembles.input
-            self.output = self.state_ensembles.output
+            if direct:
+                self.input = nengo.Node(size_in=dimensions, label='state')
+                self.output = self.input
+            else:
+                self.state_ensembles = EnsembleArray(
+                    neurons_per_dimension * subdimensions,
+                    dimensions // subdimensions,
+                    ens_dimensions=subdimensions,
+                    radius=np.sqrt(float(subdimensions) / dimensions),
+                    label='state')
+                self.input = self.state_ensembles.input
+                self.output = self.state_ensembles.output
 
         self.inputs = dict(default=(self.input, vocab))
         self.outputs = dict(default=(self.output, vocab))
@@ -241,3 +241,32 @@ def test_am_spa_interaction(Simulator, seed, rng):
 
     # Check to see if model builds properly. No functionality test needed
     Simulator(m)
+
+
+def test_am_share_params(Simulator, seed, rng):
+    """Ensembles with the same threshold share parameters and decoders."""
+    D = 64
+    vocab = Vocabulary(D, rng=rng)
+    vocab.parse('A+B+C+D')
+
+    with nengo.Network('model', seed=seed) as m:
+        am = AssociativeMemory(vocab, threshold=[0.3, 0.3, 0.5, 0.5],
+                               share_params=True)
+        in_node = nengo.Node(output=vocab.parse("C").v, label='input')
+        nengo.Connection(in_node, am.input)
+        out_p = nengo.Probe(am.output, synapse=0.03)
+
+    sim = Simulator(m)
+    sim.run(0.2)
+    t = sim.trange()
+
+    ens = am.am.am_ensembles
+    conns = [[c for c in am.am.connections if c.pre_obj is e][0]
+             for e in ens]
+    for i, j in [(0, 1), (2, 3)]:
+        assert np.all(sim.data[ens[i]].gain == sim.data[ens[j]].gain)
+        assert np.all(sim.data[conns[i]].weights ==
+                      sim.data[conns[j]].weights)
+    assert np.any(sim.data[ens[0]].gain != sim.data[ens[2]].gain)
+
+    assert similarity(sim.data[out_p][t > 0.15], vocab.parse("C").v) > 0.8
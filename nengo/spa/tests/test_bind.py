@@ -50,3 +50,21 @@ def test_run(Simulator, seed):
 
     error = rmse(vocab.parse("A*A").v, sim.data[p][100])
     assert error < 0.1
+
+
+def test_direct(Simulator, seed):
+    with spa.SPA(seed=seed) as model:
+        model.bind = spa.Bind(dimensions=16, invert_b=True, direct=True)
+        model.input = spa.Input(bind_A='A', bind_B='B')
+
+    bind, vocab = model.get_module_output('bind')
+
+    with model:
+        p = nengo.Probe(bind, 'output', synapse=None)
+
+    assert len(model.all_ensembles) == 0
+
+    sim = Simulator(model)
+    sim.run(0.01)
+
+    assert np.allclose(sim.data[p][-1], vocab.parse("A*~B").v)
@@ -185,3 +185,30 @@ def test_convolution(Simulator, plt, seed):
     # Ideal answer: ~A*~B = [0,0,1,0,0]
     assert np.allclose(np.mean(sim.data[pAinvBinv][-10:], axis=0),
                        np.array([0, 0, 1, 0, 0]), atol=0.15)
+
+
+def test_direct_convolution(Simulator, seed):
+    D = 5
+    with spa.SPA(seed=seed) as model:
+        model.inA = spa.State(dimensions=D, direct=True)
+        model.inB = spa.State(dimensions=D, direct=True)
+        model.outAB = spa.State(dimensions=D, direct=True)
+        model.outAinvB = spa.State(dimensions=D, direct=True)
+
+        model.cortical = spa.Cortical(spa.Actions(
+            'outAB = inA * inB',
+            'outAinvB = ~inA * inB',
+            ), direct=True)
+        nengo.Connection(nengo.Node([0, 1, 0, 0, 0]), model.inA.input)
+        nengo.Connection(nengo.Node([0, 0, 1, 0, 0]), model.inB.input)
+
+        pAB = nengo.Probe(model.outAB.output, synapse=0.03)
+        pAinvB = nengo.Probe(model.outAinvB.output, synapse=0.03)
+
+    assert len(model.all_ensembles) == 0
+
+    sim = Simulator(model)
+    sim.run(0.2)
+
+    assert np.allclose(sim.data[pAB][-1], [0, 0, 0, 1, 0], atol=0.01)
+    assert np.allclose(sim.data[pAinvB][-1], [0, 1, 0, 0, 0], atol=0.01)
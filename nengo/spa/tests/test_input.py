@@ -1,5 +1,6 @@
 import numpy as np
 
+import nengo
 from nengo import spa
 
 
@@ -43,6 +44,23 @@ def test_time_varying():
                        np.zeros(16))
 
 
+def test_schedule(Simulator):
+    with spa.SPA() as model:
+        model.buffer = spa.State(dimensions=16)
+        model.input = spa.Input(buffer={0: 'A', 0.1: 'B*C', 0.2: '0'})
+        p = nengo.Probe(model.input.input_nodes['buffer'], synapse=None)
+
+    _, vocab = model.get_module_input('buffer')
+    sim = Simulator(model)
+    sim.run(0.3)
+
+    t = sim.trange()
+    assert np.allclose(sim.data[p][t < 0.1], vocab.parse('A').v)
+    assert np.allclose(sim.data[p][(t > 0.1) & (t < 0.2)],
+                       vocab.parse('B*C').v)
+    assert np.allclose(sim.data[p][t > 0.2], 0)
+
+
 def test_predefined_vocabs():
     D = 64
 
@@ -110,6 +110,27 @@ def test_convolution(rng):
     assert (a * b * ~b).compare(a) > 0.65
 
 
+@pytest.mark.parametrize('d', [63, 64])
+def test_spectrum_cache(d, rng):
+    a = SemanticPointer(d, rng=rng)
+    b = SemanticPointer(d, rng=rng)
+    assert np.allclose(a.spectrum, np.fft.fft(a.v)[:d // 2 + 1])
+    assert np.allclose((a * b).v,
+                       np.fft.ifft(np.fft.fft(a.v) * np.fft.fft(b.v)).real)
+
+    # the cache is cleared when the vector changes
+    for change in [lambda p: p.normalize(), lambda p: p.randomize(rng=rng),
+                   lambda p: setattr(p, 'v', p.v * 2)]:
+        change(a)
+        assert np.allclose(a.spectrum, np.fft.rfft(a.v))
+
+    a *= b
+    assert np.allclose(a.spectrum, np.fft.rfft(a.v))
+    assert np.allclose((~a).spectrum, np.fft.rfft((~a).v))
+    a.make_unitary()
+    assert np.allclose(a.spectrum, np.fft.rfft(a.v))
+
+
 def test_multiply():
     a = SemanticPointer(50)
 
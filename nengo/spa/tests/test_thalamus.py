@@ -175,6 +175,108 @@ def test_nondefault_routing(Simulator, seed, plt):
     assert valueC > 0.6
 
 
+def test_shared_routing(Simulator, seed, plt):
+    D = 3
+    model = spa.SPA(seed=seed)
+    with model:
+        model.ctrl = spa.Buffer(16, label='ctrl')
+
+        def input_func(t):
+            if t < 0.2:
+                return 'A'
+            elif t < 0.4:
+                return 'B'
+            else:
+                return 'C'
+        model.input = spa.Input(ctrl=input_func)
+
+        model.buff1 = spa.Buffer(D, label='buff1')
+        model.buff2 = spa.Buffer(D, label='buff2')
+        model.buff3 = spa.Buffer(D, label='buff3')
+
+        node1 = nengo.Node([0, 1, 0])
+        node2 = nengo.Node([0, 0, 1])
+
+        nengo.Connection(node1, model.buff1.state.input)
+        nengo.Connection(node2, model.buff2.state.input)
+
+        actions = spa.Actions('dot(ctrl, A) --> buff3=buff1',
+                              'dot(ctrl, B) --> buff3=buff2',
+                              'dot(ctrl, C) --> buff3=buff1',
+                              )
+        model.bg = spa.BasalGanglia(actions)
+        model.thal = spa.Thalamus(model.bg)
+
+        buff3_probe = nengo.Probe(model.buff3.state.output, synapse=0.03)
+
+    # actions 0 and 2 share a channel, with a gate for both of them
+    assert set(model.thal.channels) == set([
+        ((0, 2), 'buff3', 'buff1'), (1, 'buff3', 'buff2')])
+    assert set(model.thal.gates) == set([(0, 2), 1])
+
+    sim = Simulator(model)
+    sim.run(0.6)
+
+    data = sim.data[buff3_probe]
+
+    plt.plot(sim.trange(), data)
+
+    valueA = np.mean(data[150:200], axis=0)  # should be [0, 1, 0]
+    valueB = np.mean(data[350:400], axis=0)  # should be [0, 0, 1]
+    valueC = np.mean(data[550:600], axis=0)  # should be [0, 1, 0]
+
+    assert np.allclose(valueA, [0, 1, 0], atol=0.2)
+    assert np.allclose(valueB, [0, 0, 1], atol=0.2)
+    assert np.allclose(valueC, [0, 1, 0], atol=0.2)
+
+
+def test_direct(Simulator, seed):
+    D = 3
+    with spa.SPA(seed=seed) as model:
+        model.ctrl = spa.State(16, direct=True)
+
+        def input_func(t):
+            if t < 0.2:
+                return 'A'
+            elif t < 0.4:
+                return 'B'
+            else:
+                return 'C'
+        model.input = spa.Input(ctrl=input_func)
+
+        model.buff1 = spa.State(D, direct=True)
+        model.buff2 = spa.State(D, direct=True)
+        model.buff3 = spa.State(D, direct=True)
+        model.cmp = spa.Compare(D, direct=True)
+
+        nengo.Connection(nengo.Node([0, 1, 0]), model.buff1.input)
+        nengo.Connection(nengo.Node([0, 0, 1]), model.buff2.input)
+
+        actions = spa.Actions(
+            'dot(ctrl, A) --> buff3=buff1, cmp_A=buff1, cmp_B=buff1',
+            'dot(ctrl, B) --> buff3=buff2, cmp_A=buff1, cmp_B=buff2',
+            'dot(ctrl, C) --> buff3=buff1*buff2, cmp_A=buff2, cmp_B=buff2')
+        model.bg = spa.BasalGanglia(actions, direct=True)
+        model.thal = spa.Thalamus(model.bg, direct=True)
+
+        buff3_probe = nengo.Probe(model.buff3.output, synapse=0.03)
+        compare_probe = nengo.Probe(model.cmp.output, synapse=0.03)
+
+    assert len(model.all_ensembles) == 0
+
+    sim = Simulator(model)
+    sim.run(0.6)
+
+    data = sim.data[buff3_probe]
+    assert np.allclose(data[199], [0, 1, 0], atol=0.05)
+    assert np.allclose(data[399], [0, 0, 1], atol=0.05)
+    assert np.allclose(data[599], [1, 0, 0], atol=0.05)
+
+    similarity = sim.data[compare_probe]
+    assert np.allclose(similarity[[199, 399, 599]], [[1], [0], [1]],
+                       atol=0.05)
+
+
 def test_errors():
     # motor does not exist
     with pytest.raises(NameError):
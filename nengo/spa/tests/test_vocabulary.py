@@ -3,7 +3,8 @@ import re
 import numpy as np
 import pytest
 
-from nengo.spa import Vocabulary
+import nengo.utils.numpy as npext
+from nengo.spa import SemanticPointer, Vocabulary, similarity
 from nengo.utils.testing import warns
 
 
@@ -14,6 +15,73 @@ def test_add(rng):
     v.add('C', [7, 8, 9])
     assert np.allclose(v.vectors, [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
 
+    # the given SemanticPointer is stored, and vectors can be assigned
+    p = SemanticPointer([1, 0, 0])
+    v.add('D', p)
+    assert v['D'] is p
+    v.vectors = 2 * v.vectors
+    assert np.allclose(v.vectors[-1], [2, 0, 0])
+    v.add('E', [0, 0, 1])
+    assert np.allclose(v.vectors[:, 0], [2, 8, 14, 2, 0])
+
+
+def test_add_many(rng):
+    v = Vocabulary(16, include_pairs=True, max_similarity=1., rng=rng)
+    v['A']
+    vectors = rng.randn(3, 16)
+    v.add_many(['B', 'C', 'D'], vectors)
+    assert v.keys == ['A', 'B', 'C', 'D']
+    assert np.allclose(v.vectors[1:], vectors)
+    assert np.allclose(v['C'].v, vectors[1])
+    assert v.key_pairs == ['A*B', 'A*C', 'B*C', 'A*D', 'B*D', 'C*D']
+    assert np.allclose(v.vector_pairs[4], (v['B'] * v['D']).v)
+
+    for i in range(20):
+        v['E%d' % i]  # grows the storage past its initial capacity
+    assert v.vectors.shape == (24, 16)
+    assert len(v.key_pairs) == v.vector_pairs.shape[0] == 24 * 23 // 2
+    assert np.allclose(v.vector_pairs[-1], (v['E18'] * v['E19']).v)
+
+    with pytest.raises(KeyError):
+        v.add_many(['F', 'F'], rng.randn(2, 16))
+    with pytest.raises(KeyError):
+        v.add_many(['F', 'A'], rng.randn(2, 16))
+    with pytest.raises(ValueError):
+        v.add_many(['F', 'G'], rng.randn(2, 15))
+    assert 'F' not in v.keys
+
+
+@pytest.mark.parametrize('method', ['greedy', 'orthogonal'])
+def test_populate(method, rng):
+    v = Vocabulary(128, unitary=['U'], max_similarity=0.3, rng=rng)
+    v['A']
+    keys = ['B%d' % i for i in range(40)] + ['U']
+    v.populate(keys, method=method)
+    assert v.keys == ['A'] + keys
+    assert np.allclose(np.linalg.norm(v.vectors, axis=1), 1)
+
+    sims = np.dot(v.vectors[:-1], v.vectors[:-1].T) - np.eye(41)
+    if method == 'greedy':
+        assert np.all(sims < v.max_similarity)
+    else:
+        assert np.allclose(sims[1:], 0)
+    fft = np.fft.fft(v['U'].v)
+    assert np.allclose(np.abs(fft), 1)
+
+    with pytest.raises(IndexError):
+        Vocabulary(4).populate(list('ABCDE'), method='orthogonal')
+    with pytest.raises(ValueError):
+        v.populate(['C'], method='nearest')
+
+
+def test_populate_nonrandom():
+    v = Vocabulary(4, randomize=False)
+    v['A']
+    v.populate(['B', 'C'])
+    assert np.allclose(v.vectors, np.eye(4)[:3])
+    with pytest.raises(IndexError):
+        v.populate(['D', 'E'])
+
 
 def test_include_pairs(rng):
     v = Vocabulary(10, rng=rng)
@@ -56,6 +124,62 @@ def test_parse(rng):
         v.parse('"hello"')
 
 
+def test_parse_cache(rng):
+    v = Vocabulary(64, rng=rng)
+    AB = v.parse('A * B')
+    assert v.keys == ['A', 'B']
+
+    # cached values are copies, so changing the result is safe
+    AB2 = v.parse('A * B')
+    assert AB2 is not AB and np.allclose(AB2.v, AB.v)
+    AB2.normalize()
+    AB2.v[:] = 0
+    assert np.allclose(v.parse('A * B').v, AB.v)
+
+    # adding pointers clears the cache
+    v.parse('A + C')
+    assert v.keys == ['A', 'B', 'C']
+    assert np.allclose(v.parse('A * B').v, (v['A'] * v['B']).v)
+    assert v.parse('A') is v['A']
+
+
+def test_parse_cache_size(rng):
+    v = Vocabulary(16, rng=rng)
+    v.parse_cache_size = 10
+    v.parse('A + B')
+
+    # e.g., a time-varying spa.Input does not grow the cache without bound
+    for t in np.arange(100) * 0.001:
+        v.parse('%g*A + B' % t)
+    assert len(v._parse_cache) == 10
+
+    # the most recently used expressions are kept
+    AB = v.parse('0.095*A + B')
+    assert np.allclose(AB.v, (0.095 * v['A'] + v['B']).v)
+    v.parse('0.1*A + B')
+    assert '0.095*A + B' in v._parse_cache
+    assert '0.09*A + B' not in v._parse_cache
+
+
+def test_bind(rng):
+    v = Vocabulary(64, rng=rng)
+    ab = v.bind(['A', 'B'], ['C', 'D'])
+    assert v.keys == ['A', 'B', 'C', 'D']
+    assert np.allclose(ab[0], (v['A'] * v['C']).v)
+    assert np.allclose(ab[1], (v['B'] * v['D']).v)
+
+    # single pointers are bound with each pointer, and arrays are accepted
+    x = v.bind(['A * B'], v.vectors)
+    assert x.shape == (4, 64)
+    assert np.allclose(x[1], v.parse('A * B * B').v)
+
+    v.bind(['A', 'B'], 'C', keys=['A_C', 'B_C'])
+    assert np.allclose(v['B_C'].v, (v['B'] * v['C']).v)
+
+    with pytest.raises(ValueError):
+        v.bind(['A'], np.ones((2, 32)))
+
+
 def test_invalid_dimensions():
     with pytest.raises(TypeError):
         Vocabulary(1.5)
@@ -82,6 +206,9 @@ def test_text(rng):
     assert re.match(';'.join([ptr] * 4), v.text(x, minimum_count=4))
     assert re.match(';'.join([ptr.replace('F', 'C')] * 3),
                     v.text(x, minimum_count=4, terms=['A', 'B', 'C']))
+    assert re.match(ptr + '$', v.text(x, minimum_count=4, maximum_count=1))
+    assert re.match(';'.join([ptr] * 2) + '$',
+                    v.text(x, minimum_count=4, maximum_count=2, threshold=0))
 
     assert re.match(ptr, v.text(y, threshold=0.6))
     assert v.text(y, minimum_count=None, threshold=0.6) == ''
@@ -93,6 +220,63 @@ def test_text(rng):
     assert v.text(v['D'].v) == '1.00D'
 
 
+def test_text_many(rng):
+    v = Vocabulary(64, include_pairs=True, rng=rng)
+    x = np.array([v.parse(text).v
+                  for text in ['A+B+C', '-D-E-F', 'A*B', '0.5*A+C*D', '0']])
+    kwargs = [{}, dict(terms=['A', 'C', 'C*D', 'Z']), dict(threshold=None),
+              dict(minimum_count=3, maximum_count=3, normalize=True)]
+    for kw in kwargs:
+        texts = v.text_many(x, block_size=2, **kw)
+        assert texts == [v.text(xi, **kw) for xi in x]
+    terms = v.text(x[3], terms=['A', 'C', 'C*D']).split(';')
+    assert terms[0].endswith('C*D') and terms[1].endswith('A')
+
+
+def test_text_approximate(rng):
+    v = Vocabulary(64, max_similarity=1., rng=rng)
+    v.populate(['K%d' % i for i in range(2000)])
+    v.build_index(rng=rng)
+
+    x = v.vectors[:100] + 0.02 * rng.randn(100, 64)
+    exact = v.text_many(x, maximum_count=1)
+    approximate = v.text_many(x, maximum_count=1, approximate=True)
+    assert [t[4:] for t in exact] == ['K%d' % i for i in range(100)]
+    assert sum(a == e for a, e in zip(approximate, exact)) >= 90
+
+    v.add('Z', v.vectors[5])  # the index is rebuilt for new keys
+    assert v.text(v['Z'], approximate=True, terms=['Z']) == '1.00Z'
+
+
+def test_similarity_blocks(rng, tmpdir):
+    v = Vocabulary(32, rng=rng)
+    v.populate(['K%d' % i for i in range(20)], method='orthogonal')
+    data = np.memmap(str(tmpdir.join('data.dat')), dtype=np.float64,
+                     mode='w+', shape=(101, 32))
+    data[:] = rng.randn(101, 32)
+    out = np.memmap(str(tmpdir.join('out.dat')), dtype=np.float64,
+                    mode='w+', shape=(101, 20))
+
+    assert v.similarity(data, block_size=10, out=out) is out
+    assert np.allclose(out, np.dot(data, v.vectors.T))
+    assert np.allclose(v.similarity(data, normalize=True, block_size=7),
+                       similarity(data, v, normalize=True))
+
+    keys, sims = v.top_k(data, k=3, block_size=10)
+    assert keys.shape == sims.shape == (101, 3)
+    expected = np.argsort(-np.dot(data, v.vectors.T), axis=1)[:, :3]
+    assert np.all(keys == np.array(v.keys, dtype=object)[expected])
+    assert np.allclose(sims, np.sort(out, axis=1)[:, :-4:-1])
+
+    for block_size in (0, -1):
+        with pytest.raises(ValueError):
+            similarity(data, v, block_size=block_size)
+        with pytest.raises(ValueError):
+            v.top_k(data, block_size=block_size)
+        with pytest.raises(ValueError):
+            v.text_many(data, block_size=block_size)
+
+
 def test_capital(rng):
     v = Vocabulary(16, rng=rng)
     with pytest.raises(KeyError):
@@ -140,3 +324,26 @@ def test_create_pointer_warning(rng):
         v.parse('C')
         v.parse('D')
         v.parse('E')
+
+
+def test_create_pointer_seeded():
+    """Seeded vocabularies match drawing candidate pointers one at a time"""
+    rng = np.random.RandomState(0)
+    v = Vocabulary(16, rng=rng)
+    v.parse('A+B+C')
+    assert np.allclose(v.vectors[:, 0], [0.41768427, 0.30936281, -0.19600075])
+    assert np.allclose(v['C'].v[:4],
+                       [-0.19600075, -0.43731001, -0.07681025, 0.03451792])
+
+    # only the random numbers of the candidates tried are used up
+    ref = np.random.RandomState(0)
+    vectors = [ref.randn(16)]
+    for _ in range(2):
+        c = ref.randn(16)
+        while np.max(np.dot(vectors, c)) >= 0.1 * np.linalg.norm(c):
+            c = ref.randn(16)
+        vectors.append(c)
+    vectors = np.array(vectors)
+    assert np.allclose(v.vectors, vectors / npext.norm(
+        vectors, axis=1, keepdims=True))
+    assert rng.rand() == ref.rand()
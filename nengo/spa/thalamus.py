@@ -4,7 +4,7 @@ import nengo
 from nengo.dists import Uniform
 from nengo.spa.action_objects import Symbol, Source, Convolution
 from nengo.spa.module import Module
-from nengo.utils.compat import iteritems
+from nengo.utils.compat import is_iterable, iteritems
 
 
 class Thalamus(Module):
@@ -40,6 +40,11 @@ class Thalamus(Module):
         Minimum value for gating neurons
     synapse_to-gate : float
         Synaptic filter for controlling a gate
+    direct : bool
+        Whether to select actions and route information directly with Nodes
+        instead of with neurons. The action with the highest input is
+        selected if its input is above ``threshold_action - 1``, and the
+        effects of an action are multiplied by its selection (0 or 1).
     """
     def __init__(self, bg, neurons_action=50, threshold_action=0.2,
                  mutual_inhibit=1, route_inhibit=3,
@@ -48,7 +53,7 @@ class Thalamus(Module):
                  synapse_channel=0.01,
                  neurons_cconv=200,
                  neurons_gate=40, threshold_gate=0.3, synapse_to_gate=0.002,
-                 label=None, seed=None, add_to_container=None):
+                 direct=False, label=None, seed=None, add_to_container=None):
 
         self.bg = bg
         self.neurons_action = neurons_action
@@ -65,16 +70,28 @@ class Thalamus(Module):
         self.threshold_gate = threshold_gate
         self.synapse_to_gate = synapse_to_gate
         self.synapse_bg = synapse_bg
+        self.direct = direct
 
         self.gates = {}     # gating ensembles per action (created as needed)
+        self.inhibits = {}  # filtered gate outputs per action
         self.channels = {}  # channels to pass transformed data between modules
 
         Module.__init__(self, label, seed, add_to_container)
-        nengo.networks.Thalamus(self.bg.actions.count,
-                                n_neurons_per_ensemble=self.neurons_action,
-                                mutual_inhib=self.mutual_inhibit,
-                                threshold=self.threshold_action,
-                                net=self)
+        if direct:
+            def select(t, x):
+                return np.where((x >= x.max()) & (x > threshold_action - 1),
+                                1., 0.)
+
+            with self:
+                self.actions = nengo.Node(
+                    select, size_in=self.bg.actions.count, label='actions')
+            self.input = self.output = self.actions
+        else:
+            nengo.networks.Thalamus(self.bg.actions.count,
+                                    n_neurons_per_ensemble=self.neurons_action,
+                                    mutual_inhib=self.mutual_inhibit,
+                                    threshold=self.threshold_action,
+                                    net=self)
 
     def on_add(self, spa):
         Module.on_add(self, spa)
@@ -82,9 +99,13 @@ class Thalamus(Module):
 
         with spa:
             # connect basal ganglia to thalamus
-            nengo.Connection(self.bg.output, self.actions.input,
+            nengo.Connection(self.bg.output, self.input,
                              synapse=self.synapse_bg)
 
+        # actions that route the same source to the same target share a
+        # single channel
+        routes = self._find_routes()
+
         # implement the various effects
         for i, action in enumerate(self.bg.actions.actions):
             for name, effects in iteritems(action.effect.effect):
@@ -94,9 +115,12 @@ class Thalamus(Module):
                     if isinstance(effect, Symbol):
                         self.add_direct_effect(i, name, effect.symbol)
                     elif isinstance(effect, Source):
-                        self.add_route_effect(i, name, effect.name,
-                                              effect.transform.symbol,
-                                              effect.inverted)
+                        index = self._route_index(
+                            routes[self._route_key(name, effect)], i)
+                        if index is not None:
+                            self.add_route_effect(index, name, effect.name,
+                                                  effect.transform.symbol,
+                                                  effect.inverted)
                     elif isinstance(effect, Convolution):
                         self.add_conv_effect(i, name, effect)
                     else:
@@ -104,6 +128,39 @@ class Thalamus(Module):
                             "Subexpression '%s' from action '%s' is not "
                             "supported by the Thalamus." % (effect, action))
 
+    def _find_routes(self):
+        """Return the actions using each route, keyed by `_route_key`."""
+        routes = {}
+        for i, action in enumerate(self.bg.actions.actions):
+            for name, effects in iteritems(action.effect.effect):
+                for effect in effects.expression.items:
+                    if isinstance(effect, Source):
+                        routes.setdefault(
+                            self._route_key(name, effect), []).append(i)
+        return routes
+
+    @staticmethod
+    def _route_key(target_name, effect):
+        return (target_name, effect.name, effect.transform.symbol,
+                effect.inverted)
+
+    @staticmethod
+    def _route_index(indices, i):
+        """Return the actions sharing a route with action ``i``.
+
+        ``indices`` lists the actions using the route that have not been
+        implemented yet, and is updated. Returns None if action ``i`` has
+        already been given the route by an earlier action. A route that is
+        repeated within one action gets a channel for each repetition.
+        """
+        if i not in indices:
+            return None
+        indices.remove(i)
+        shared = sorted(j for j in set(indices) if j > i)
+        for j in shared:
+            indices.remove(j)
+        return [i] + shared if len(shared) > 0 else i
+
     def add_direct_effect(self, index, target_name, value):
         """Cause an action to drive a particular module input to value.
 
@@ -119,10 +176,11 @@ class Thalamus(Module):
         """
         sink, vocab = self.spa.get_module_input(target_name)
         transform = np.array([vocab.parse(value).v]).T
+        action = (self.actions[index] if self.direct else
+                  self.actions.ensembles[index])
 
         with self.spa:
-            nengo.Connection(self.actions.ensembles[index],
-                             sink, transform=transform,
+            nengo.Connection(action, sink, transform=transform,
                              synapse=self.synapse_direct)
 
     def get_gate(self, index):
@@ -133,29 +191,71 @@ class Thalamus(Module):
         active when the action is not selected.  This makes the gate useful
         for inhibiting ensembles that should only be active when this
         action is active.
+
+        If ``index`` is a list of actions, the gate is inactive when any
+        of those actions is selected.
         """
+        index = self._gate_key(index)
         if index not in self.gates:
+            indices = index if isinstance(index, tuple) else (index,)
             with self:
                 intercepts = Uniform(self.threshold_gate, 1)
-                gate = nengo.Ensemble(self.neurons_gate,
-                                      dimensions=1,
-                                      intercepts=intercepts,
-                                      label='gate[%d]' % index,
-                                      encoders=[[1]] * self.neurons_gate)
-                nengo.Connection(self.actions.ensembles[index], gate,
-                                 synapse=self.synapse_to_gate, transform=-1)
+                gate = nengo.Ensemble(
+                    self.neurons_gate,
+                    dimensions=1,
+                    intercepts=intercepts,
+                    label='gate[%s]' % ','.join(str(i) for i in indices),
+                    encoders=[[1]] * self.neurons_gate)
+                for i in indices:
+                    nengo.Connection(self.actions.ensembles[i], gate,
+                                     synapse=self.synapse_to_gate,
+                                     transform=-1)
                 nengo.Connection(self.bias, gate, synapse=None)
                 self.gates[index] = gate
         return self.gates[index]
 
+    def get_inhibit(self, index):
+        """Return the filtered output of the gate for an action.
+
+        The gate output is decoded and filtered once, so that inhibiting
+        many ensembles from it only needs a cheap connection from this
+        node to the neurons of each ensemble (see `inhibit`).
+        """
+        index = self._gate_key(index)
+        if index not in self.inhibits:
+            gate = self.get_gate(index)
+            with self:
+                inhibit = nengo.Node(size_in=1, label='%s_out' % gate.label)
+                nengo.Connection(gate, inhibit, synapse=self.synapse_inhibit)
+                self.inhibits[index] = inhibit
+        return self.inhibits[index]
+
+    def inhibit(self, index, ensembles):
+        """Inhibit the neurons of ``ensembles`` unless the action is chosen.
+        """
+        inhibit = self.get_inhibit(index)
+        with self:
+            for e in ensembles:
+                nengo.Connection(
+                    inhibit, e.neurons, synapse=None,
+                    transform=-np.ones((e.n_neurons, 1)) * self.route_inhibit)
+
+    @staticmethod
+    def _gate_key(index):
+        if is_iterable(index):
+            index = tuple(sorted(index))
+            return index[0] if len(index) == 1 else index
+        return index
+
     def add_route_effect(self,
                          index, target_name, source_name, transform, inverted):
         """Set an action to send source to target with the given transform
 
         Parameters
         ----------
-        index : int
-            The action number that will cause this effect
+        index : int or list of int
+            The action number that will cause this effect. If a list is
+            given, all of the actions share a single channel.
         target_name : string
             The name of the module input to affect
         source_name : string
@@ -169,63 +269,85 @@ class Thalamus(Module):
         inverted : bool
             Whether to perform inverse convolution on the source.
         """
-        with self:
-            gate = self.get_gate(index)
+        target, target_vocab = self.spa.get_module_input(target_name)
+        source, source_vocab = self.spa.get_module_output(source_name)
 
-            target, target_vocab = self.spa.get_module_input(target_name)
-            source, source_vocab = self.spa.get_module_output(source_name)
-
-            target_module = self.spa.get_module(target_name)
-            source_module = self.spa.get_module(source_name)
-
-            # build a communication channel between the source and target
-            dim = target_vocab.dimensions
-
-            # Determine size of subdimension. If target module is spa.Buffer,
-            # use target module's subdimension. Otherwise use default
-            # (self.subdim_channel).
-            # TODO: Use the ensemble properties of target module instead?
-            #       - How to get these properties?
-            subdim = self.subdim_channel
-            if isinstance(target_module, nengo.spa.Buffer):
-                subdim = target_module.state.dimensions_per_ensemble
-            elif isinstance(source_module, nengo.spa.Buffer):
-                subdim = source_module.state.dimensions_per_ensemble
-            elif dim < subdim:
-                subdim = dim
-            elif dim % subdim != 0:
-                subdim = 1
+        # compute the requested transform
+        t = source_vocab.parse(transform).get_convolution_matrix()
+        if inverted:
+            D = source_vocab.dimensions
+            t = np.dot(t, np.eye(D)[-np.arange(D)])
+        # handle conversion between different Vocabularies
+        if target_vocab is not source_vocab:
+            t = np.dot(source_vocab.transform_to(target_vocab), t)
 
-            channel = nengo.networks.EnsembleArray(
-                self.neurons_channel_dim * subdim,
-                dim // subdim,
-                ens_dimensions=subdim,
-                radius=np.sqrt(float(subdim) / dim),
-                label='channel_%d_%s' % (index, target_name))
+        # build a communication channel between the source and target
+        dim = target_vocab.dimensions
 
-            # inhibit the channel when the action is not chosen
-            inhibit = ([[-self.route_inhibit]] *
-                       (self.neurons_channel_dim * subdim))
-            for e in channel.ensembles:
-                nengo.Connection(gate, e.neurons, transform=inhibit,
-                                 synapse=self.synapse_inhibit)
+        index = self._gate_key(index)
+        indices = index if isinstance(index, tuple) else (index,)
+        label = 'channel_%s_%s' % ('_'.join(str(i) for i in indices),
+                                   target_name)
 
-        with self.spa:
-            # compute the requested transform
-            t = source_vocab.parse(transform).get_convolution_matrix()
-            if inverted:
-                D = source_vocab.dimensions
-                t = np.dot(t, np.eye(D)[-np.arange(D)])
-            # handle conversion between different Vocabularies
-            if target_vocab is not source_vocab:
-                t = np.dot(source_vocab.transform_to(target_vocab), t)
+        if self.direct:
+            # multiply the channel by the action selection
+            with self:
+                channel = nengo.Node(
+                    lambda t, x: x[0] * x[1:], size_in=dim + 1, label=label)
+                for i in indices:
+                    nengo.Connection(self.actions[i], channel[0],
+                                     synapse=self.synapse_to_gate)
+            channel_input = channel[1:]
+            channel_output = channel
+        else:
+            channel = self.make_channel(index, target_name, source_name, dim,
+                                        label)
+            channel_input = channel.input
+            channel_output = channel.output
+        self.channels[(index, target_name, source_name)] = channel
 
+        with self.spa:
             # connect source to target
-            nengo.Connection(source, channel.input, transform=t,
+            nengo.Connection(source, channel_input, transform=t,
                              synapse=self.synapse_channel)
-            nengo.Connection(channel.output, target,
+            nengo.Connection(channel_output, target,
                              synapse=self.synapse_channel)
 
+    def make_channel(self, index, target_name, source_name, dim, label):
+        """Create a neural channel that is inhibited by an action's gate."""
+        target_module = self.spa.get_module(target_name)
+        source_module = self.spa.get_module(source_name)
+
+        # Determine size of subdimension. If target module is spa.Buffer,
+        # use target module's subdimension. Otherwise use default
+        # (self.subdim_channel).
+        # TODO: Use the ensemble properties of target module instead?
+        #       - How to get these properties?
+        subdim = self.subdim_channel
+        if (isinstance(target_module, nengo.spa.Buffer) and
+                not target_module.direct):
+            subdim = target_module.state.dimensions_per_ensemble
+        elif (isinstance(source_module, nengo.spa.Buffer) and
+                not source_module.direct):
+            subdim = source_module.state.dimensions_per_ensemble
+        elif dim < subdim:
+            subdim = dim
+        elif dim % subdim != 0:
+            subdim = 1
+
+        self.get_gate(index)
+        with self:
+            channel = nengo.networks.EnsembleArray(
+                self.neurons_channel_dim * subdim,
+                dim // subdim,
+                ens_dimensions=subdim,
+                radius=np.sqrt(float(subdim) / dim),
+                label=label)
+
+        # inhibit the channel when the action is not chosen
+        self.inhibit(index, channel.ensembles)
+        return channel
+
     def add_conv_effect(self, index, target_name, effect):
         """Set an action to combine two sources and send to target.
 
@@ -240,13 +362,15 @@ class Thalamus(Module):
         """
         cconv = nengo.spa.action_build.convolution(self, target_name, effect,
                                                    self.neurons_cconv,
-                                                   self.synapse_channel)
+                                                   self.synapse_channel,
+                                                   direct=self.direct,
+                                                   gated=self.direct)
 
-        gate = self.get_gate(index)
+        if self.direct:
+            with self:
+                nengo.Connection(self.actions[index], cconv.gate,
+                                 synapse=self.synapse_to_gate)
+            return
 
-        with self:
-            # inhibit the convolution when the action is not chosen
-            for e in cconv.product.all_ensembles:
-                inhibit = -np.ones((e.n_neurons, 1)) * self.route_inhibit
-                nengo.Connection(gate, e.neurons, transform=inhibit,
-                                 synapse=self.synapse_inhibit)
+        # inhibit the convolution when the action is not chosen
+        self.inhibit(index, cconv.product.all_ensembles)
@@ -22,7 +22,7 @@ def enable_spa_params(model):
             'vocab', VocabularyParam(None, optional=True))
 
 
-def similarity(data, vocab, normalize=False):
+def similarity(data, vocab, normalize=False, block_size=None, out=None):
     """Return the similarity between some data and the vocabulary.
 
     Computes the dot products between all data vectors and each
@@ -38,6 +38,12 @@ def similarity(data, vocab, normalize=False):
         the similarity values
     normalize : boolean (optional)
         Whether to normalize all vectors, to compute the cosine similarity.
+    block_size : int (optional)
+        If given, compute the similarities for this many rows of ``data``
+        at a time, so that only one block of ``data`` (e.g., from a
+        `numpy.memmap`) is in memory at once.
+    out : ndarray (optional)
+        Array (possibly a `numpy.memmap`) in which to store the result.
     """
     from nengo.spa.vocab import Vocabulary
 
@@ -50,15 +56,28 @@ def similarity(data, vocab, normalize=False):
                          % (vocab.__class__.__name__))
 
     data = np.array(data, copy=False, ndmin=2)
-    dots = np.dot(data, vectors.T)
+    if out is None:
+        out = np.zeros((data.shape[0], vectors.shape[0]))
+    elif out.shape != (data.shape[0], vectors.shape[0]):
+        raise ValueError("'out' must have shape %s (got %s)" % (
+            (data.shape[0], vectors.shape[0]), out.shape))
 
     if normalize:
         # Zero-norm vectors should return zero, so avoid divide-by-zero error
         eps = np.nextafter(0, 1)  # smallest float above zero
-        dnorm = np.maximum(npext.norm(data, axis=1, keepdims=True), eps)
         vnorm = np.maximum(npext.norm(vectors, axis=1, keepdims=True), eps)
+        vectors = vectors / vnorm
 
-        dots /= dnorm
-        dots /= vnorm.T
+    if block_size is None:
+        block_size = max(data.shape[0], 1)
+    elif block_size < 1:
+        raise ValueError("block_size must be at least 1 (got %s)" % block_size)
+    for i in range(0, data.shape[0], block_size):
+        block = np.asarray(data[i:i + block_size], dtype=np.float64)
+        dots = np.dot(block, vectors.T)
+        if normalize:
+            dots /= np.maximum(
+                npext.norm(block, axis=1, keepdims=True), eps)
+        out[i:i + block_size] = dots
 
-    return dots
+    return out
@@ -1,10 +1,26 @@
+import collections
 import warnings
 
 import numpy as np
 
 import nengo
 from nengo.spa import pointer
-from nengo.utils.compat import is_iterable, is_number, is_integer, range
+from nengo.spa.utils import similarity
+from nengo.utils.compat import (
+    is_iterable, is_integer, is_number, is_string, range)
+
+
+def _reserve(array, n):
+    """Return ``array``, or a larger copy if it has fewer than ``n`` rows.
+
+    The number of rows at least doubles when growing, so that appending rows
+    one at a time takes amortized constant time.
+    """
+    if n <= array.shape[0]:
+        return array
+    grown = np.zeros((max(n, 2 * array.shape[0]), array.shape[1]))
+    grown[:array.shape[0]] = array
+    return grown
 
 
 class Vocabulary(object):
@@ -61,6 +77,9 @@ class Vocabulary(object):
 
     """
 
+    candidate_block = 10  # candidate pointers scored at a time
+    parse_cache_size = 1000  # most recently parsed expressions kept
+
     def __init__(self, dimensions, randomize=True, unitary=False,
                  max_similarity=0.1, include_pairs=False, rng=None):
 
@@ -75,13 +94,24 @@ class Vocabulary(object):
         self.pointers = {}
         self.keys = []
         self.key_pairs = None
-        self.vectors = np.zeros((0, dimensions), dtype=float)
-        self.vector_pairs = None
+        self._vectors = np.zeros((0, dimensions), dtype=float)
+        self._vector_pairs = None
         self._include_pairs = None
         self.include_pairs = include_pairs
         self._identity = None
+        self._parse_cache = collections.OrderedDict()
+        self._key_indices = {}
+        self._pair_indices = {}
+        self._index = None
         self.rng = rng
 
+    def _candidates(self, n):
+        """Draw ``n`` random unit vectors."""
+        rng = np.random if self.rng is None else self.rng
+        v = rng.randn(n, self.dimensions)
+        v /= np.sqrt(np.sum(v ** 2, axis=1, keepdims=True))
+        return v
+
     def create_pointer(self, attempts=100, unitary=False):
         """Create a new semantic pointer.
 
@@ -95,15 +125,26 @@ class Vocabulary(object):
             if self.vectors.shape[0] == 0:
                 p = pointer.SemanticPointer(self.dimensions, rng=self.rng)
             else:
+                # Score candidates in blocks, with one matrix product each
+                rng = np.random if self.rng is None else self.rng
                 p_sim = np.inf
-                for _ in range(attempts):
-                    pp = pointer.SemanticPointer(self.dimensions, rng=self.rng)
-                    pp_sim = max(np.dot(self.vectors, pp.v))
-                    if pp_sim < p_sim:
-                        p = pp
-                        p_sim = pp_sim
-                        if p_sim < self.max_similarity:
-                            break
+                for i in range(0, attempts, self.candidate_block):
+                    state = rng.get_state()
+                    candidates = self._candidates(
+                        min(self.candidate_block, attempts - i))
+                    sims = np.max(
+                        np.dot(candidates, self.vectors.T), axis=1)
+                    below = np.flatnonzero(sims < self.max_similarity)
+                    j = below[0] if len(below) > 0 else np.argmin(sims)
+                    if sims[j] < p_sim:
+                        p = pointer.SemanticPointer(candidates[j])
+                        p_sim = sims[j]
+                    if len(below) > 0:
+                        # only use up the random numbers of the candidates
+                        # tried, as if they had been drawn one at a time
+                        rng.set_state(state)
+                        self._candidates(j + 1)
+                        break
                 else:
                     warnings.warn(
                         'Could not create a semantic pointer with '
@@ -123,6 +164,92 @@ class Vocabulary(object):
             p = pointer.SemanticPointer(np.eye(self.dimensions)[index])
         return p
 
+    def populate(self, keys, method='greedy', attempts=100):
+        """Create and add new semantic pointers for all of ``keys`` at once.
+
+        Parameters
+        ----------
+        keys : list of strings
+            The names of the new pointers.
+        method : 'greedy' or 'orthogonal', optional
+            With 'greedy', blocks of random candidates are scored against
+            all existing pointers and each other with matrix products, and
+            accepted in order if their similarity to all existing and
+            accepted pointers is below max_similarity, as in
+            `create_pointer`. With 'orthogonal', the new pointers are
+            orthogonal to each other and to all existing pointers, which
+            requires that there be no more pointers than dimensions.
+        attempts : int, optional
+            With 'greedy', the minimum number of candidates drawn at a time.
+            If none of them satisfy max_similarity, the best is used.
+        """
+        n, d = len(keys), self.dimensions
+        start = len(self.keys)
+        if not self.randomize or method == 'orthogonal':
+            if start + n > d:
+                raise IndexError('Tried to make more semantic pointers than'
+                                 ' dimensions with %s' % (
+                                     "orthogonal pointers" if self.randomize
+                                     else "non-randomized Vocabulary"))
+        if not self.randomize:
+            vectors = np.eye(d)[start:start + n]
+        elif method == 'orthogonal':
+            rng = np.random if self.rng is None else self.rng
+            q, _ = np.linalg.qr(
+                np.hstack([self.vectors.T, rng.randn(d, n)]))
+            vectors = q[:, start:].T
+        elif method == 'greedy':
+            vectors = self._greedy_pointers(n, attempts=attempts)
+        else:
+            raise ValueError("Unrecognized method '%s'" % method)
+
+        if self.randomize:
+            unitary = np.array([key in self.unitary if is_iterable(
+                self.unitary) else bool(self.unitary) for key in keys],
+                dtype=bool)
+            if np.any(unitary):
+                fft = np.fft.rfft(vectors[unitary], axis=1)
+                vectors[unitary] = np.fft.irfft(
+                    fft / np.abs(fft), n=d, axis=1)
+
+        self.add_many(keys, vectors)
+
+    def _greedy_pointers(self, n, attempts=100, max_pool=1000):
+        existing = self.vectors
+        accepted = []
+        n_pool = max(attempts, min(2 * n, max_pool))
+        n_warn = 0
+        while len(accepted) < n:
+            pool = self._candidates(n_pool)
+            sims = (np.max(np.dot(pool, existing.T), axis=1)
+                    if existing.shape[0] > 0 else np.zeros(len(pool)) - 1)
+            pool_sims = np.dot(pool, pool.T)
+
+            chosen = []
+            below = np.flatnonzero(sims < self.max_similarity)
+            while len(below) > 0 and len(accepted) + len(chosen) < n:
+                c = below[0]
+                chosen.append(c)
+                sims = np.maximum(sims, pool_sims[c])
+                below = below[1:][sims[below[1:]] < self.max_similarity]
+            if len(chosen) == 0:
+                # no candidate satisfies max_similarity; use the best one
+                chosen.append(np.argmin(sims))
+                n_warn += 1
+
+            # large pools only pay off while many candidates are accepted
+            n_pool = max(attempts, min(2 * len(chosen), max_pool))
+            accepted.extend(pool[chosen])
+            existing = np.vstack([existing, pool[chosen]])
+
+        if n_warn > 0:
+            warnings.warn(
+                'Could not create %d semantic pointers with '
+                'max_similarity=%1.2f (D=%d, M=%d)'
+                % (n_warn, self.max_similarity, self.dimensions,
+                   len(self.pointers) + n))
+        return np.array(accepted).reshape(n, self.dimensions)
+
     def __getitem__(self, key):
         """Return the semantic pointer with the requested name.
 
@@ -142,29 +269,95 @@ class Vocabulary(object):
             self.add(key, value)
         return value
 
+    @property
+    def vectors(self):
+        return self._vectors[:len(self.keys)]
+
+    @vectors.setter
+    def vectors(self, vectors):
+        self._vectors = np.array(vectors, dtype=float, ndmin=2)
+        self._index = None
+
+    @property
+    def vector_pairs(self):
+        if self.key_pairs is None:
+            return None
+        return self._vector_pairs[:len(self.key_pairs)]
+
+    @vector_pairs.setter
+    def vector_pairs(self, vector_pairs):
+        self._vector_pairs = (None if vector_pairs is None else
+                              np.array(vector_pairs, dtype=float, ndmin=2))
+
     def add(self, key, p):
         """Add a new semantic pointer to the vocabulary.
 
         The pointer value can be a SemanticPointer or a vector.
         """
-        if not key[0].isupper():
-            raise KeyError('Semantic pointers must begin with a capital')
         if not isinstance(p, pointer.SemanticPointer):
             p = pointer.SemanticPointer(p)
+        self.add_many([key], p.v[np.newaxis, :])
+        self.pointers[key] = p
 
-        if key in self.pointers:
-            raise KeyError("The semantic pointer '%s' already exists" % key)
+    def add_many(self, keys, vectors):
+        """Add several new semantic pointers to the vocabulary at once.
 
-        self.pointers[key] = p
-        self.keys.append(key)
-        self.vectors = np.vstack([self.vectors, p.v])
+        This is much faster than calling `add` for each pointer when adding
+        many pointers, especially if ``include_pairs`` is True.
+
+        Parameters
+        ----------
+        keys : list of strings
+            The names of the new pointers.
+        vectors : array_like (len(keys), dimensions)
+            The values of the new pointers.
+        """
+        vectors = np.array(vectors, dtype=float, ndmin=2)
+        if vectors.shape != (len(keys), self.dimensions):
+            raise ValueError("vectors must have shape (%d, %d) (got %s)"
+                             % (len(keys), self.dimensions, vectors.shape))
+        new_keys = set()
+        for key in keys:
+            if not key[0].isupper():
+                raise KeyError('Semantic pointers must begin with a capital')
+            if key in self.pointers or key in new_keys:
+                raise KeyError(
+                    "The semantic pointer '%s' already exists" % key)
+            new_keys.add(key)
+
+        n = len(self.keys)
+        self._vectors = _reserve(self._vectors, n + len(keys))
+        self._vectors[n:n + len(keys)] = vectors
+        for key, v in zip(keys, vectors):
+            self.pointers[key] = pointer.SemanticPointer(v)
+            self._key_indices[key] = len(self.keys)
+            self.keys.append(key)
+        self._parse_cache.clear()
+        self._index = None
+
+        if self.include_pairs:
+            self._add_pairs(n)
+
+    def _add_pairs(self, start):
+        """Add the pairs of each key from index ``start`` with earlier keys.
 
-        # Generate vector pairs
-        if self.include_pairs and len(self.keys) > 1:
-            for k in self.keys[:-1]:
-                self.key_pairs.append('%s*%s' % (k, key))
-                v = (self.pointers[k] * p).v
-                self.vector_pairs = np.vstack([self.vector_pairs, v])
+        All of the circular convolutions are computed with a single FFT.
+        """
+        ij = [(i, j) for j in range(max(start, 1), len(self.keys))
+              for i in range(j)]
+        if len(ij) == 0:
+            return
+        i, j = np.array(ij).T
+        fft = np.fft.rfft(self.vectors, axis=1)
+        pairs = np.fft.irfft(fft[i] * fft[j], n=self.dimensions, axis=1)
+
+        n = len(self.key_pairs)
+        self._vector_pairs = _reserve(self._vector_pairs, n + len(ij))
+        self._vector_pairs[n:n + len(ij)] = pairs
+        for ii, jj in ij:
+            self._pair_indices['%s*%s' % (
+                self.keys[ii], self.keys[jj])] = len(self.key_pairs)
+            self.key_pairs.append('%s*%s' % (self.keys[ii], self.keys[jj]))
 
     @property
     def include_pairs(self):
@@ -182,16 +375,12 @@ class Vocabulary(object):
         self._include_pairs = value
         if self._include_pairs:
             self.key_pairs = []
-            self.vector_pairs = np.zeros((0, self.dimensions), dtype=float)
-            for i in range(1, len(self.keys)):
-                for k in self.keys[:i]:
-                    key = self.keys[i]
-                    self.key_pairs.append('%s*%s' % (k, key))
-                    v = (self.pointers[k] * self.pointers[key]).v
-                    self.vector_pairs = np.vstack((self.vector_pairs, v))
+            self._pair_indices = {}
+            self._vector_pairs = np.zeros((0, self.dimensions), dtype=float)
+            self._add_pairs(0)
         else:
             self.key_pairs = None
-            self.vector_pairs = None
+            self._vector_pairs = None
 
     def parse(self, text):
         """Evaluate a text string and return the corresponding SemanticPointer.
@@ -204,8 +393,22 @@ class Vocabulary(object):
 
         If the expression returns a scalar (int or float), a scaled version
         of the identity SemanticPointer will be returned.
+
+        The values of recently parsed expressions are cached, so parsing
+        the same text again does not call eval() unless pointers have since
+        been added.
         """
 
+        if text in self.pointers:
+            return self.pointers[text]
+
+        # Parsed expressions are cached until a new pointer is added, since
+        # they may refer to pointers that have not been created yet.
+        v = self._parse_cache.pop(text, None)
+        if v is not None:
+            self._parse_cache[text] = v  # mark as most recently used
+            return pointer.SemanticPointer(v)
+
         # The following line does everything.  Note that self is being
         # passed in as the locals dictionary, and thanks to the __getitem__
         # implementation, this will automatically create new semantic
@@ -220,8 +423,49 @@ class Vocabulary(object):
         if not isinstance(value, pointer.SemanticPointer):
             raise TypeError('The result of "%s" was not a SemanticPointer' %
                             text)
+        self._parse_cache[text] = value.v.copy()
+        if len(self._parse_cache) > self.parse_cache_size:
+            self._parse_cache.popitem(last=False)
         return value
 
+    def bind(self, a, b, keys=None):
+        """Bind (circularly convolve) many pairs of semantic pointers at once.
+
+        This is much faster than binding each pair with ``*`` when making
+        many bindings, for example to generate a structured vocabulary.
+
+        Parameters
+        ----------
+        a, b : string, list of strings, or array_like (n, dimensions)
+            The pointers to bind, given either as expressions to `parse` or
+            as an array of vectors. If one of them contains a single
+            pointer, it is bound with each of the pointers in the other.
+        keys : list of strings, optional
+            If given, the results are added to the vocabulary with these
+            names (see `add_many`).
+
+        Returns
+        -------
+        array (n, dimensions)
+            The bound vectors, where ``result[i]`` is ``a[i] * b[i]``.
+        """
+        v = np.fft.irfft(self._spectra(a) * self._spectra(b),
+                         n=self.dimensions, axis=1)
+        if keys is not None:
+            self.add_many(keys, v)
+        return v
+
+    def _spectra(self, x):
+        if is_string(x):
+            x = [x]
+        if is_iterable(x) and all(is_string(k) for k in x):
+            return np.array([self.parse(k).spectrum for k in x], ndmin=2)
+        x = np.array(x, dtype=float, ndmin=2)
+        if x.ndim != 2 or x.shape[1] != self.dimensions:
+            raise ValueError("vectors must have shape (n, %d) (got %s)"
+                             % (self.dimensions, x.shape))
+        return np.fft.rfft(x, axis=1)
+
     @property
     def identity(self):
         """Return the identity vector."""
@@ -231,8 +475,9 @@ class Vocabulary(object):
             self._identity = pointer.SemanticPointer(v)
         return self._identity
 
-    def text(self, v, minimum_count=1, maximum_count=None,  # noqa: C901
-             threshold=0.1, join=';', terms=None, normalize=False):
+    def text(self, v, minimum_count=1, maximum_count=None,
+             threshold=0.1, join=';', terms=None, normalize=False,
+             approximate=False):
         """Return a human-readable text version of the provided vector.
 
         This is meant to give a quick text version of a vector for display
@@ -250,7 +495,8 @@ class Vocabulary(object):
         minimum_count : int, optional
             Always return at least this many terms in the text
         maximum_count : int, optional
-            Never return more than this many terms in the text
+            Never return more than this many terms in the text, even if
+            ``minimum_count`` is larger
         threshold : float, optional
             How small a similarity for a term to be ignored
         join : string, optional
@@ -259,43 +505,129 @@ class Vocabulary(object):
             Only consider terms in this list
         normalize : bool, optional
             Whether to normalize the vector before computing similarity
-
+        approximate : bool, optional
+            Whether to only compare against the pointers that an approximate
+            nearest-neighbour index (see `build_index`) finds to be similar.
+            This is much faster for large vocabularies, but may miss terms.
         """
         if isinstance(v, pointer.SemanticPointer):
             v = v.v
-        else:
-            v = np.array(v, dtype='float')
+        return self.text_many(
+            np.asarray(v, dtype=float)[np.newaxis, :], minimum_count,
+            maximum_count, threshold, join, terms, normalize, approximate)[0]
 
+    def text_many(self, vs, minimum_count=1, maximum_count=None,
+                  threshold=0.1, join=';', terms=None, normalize=False,
+                  approximate=False, block_size=256):
+        """Return text versions of each row of ``vs``.
+
+        Like `text`, but for a whole (T x D) array of vectors (e.g., probe
+        data), computing similarities for ``block_size`` rows at a time.
+        """
+        if block_size < 1:
+            raise ValueError(
+                "block_size must be at least 1 (got %s)" % block_size)
+        vs = np.asarray(vs, dtype=float)
         if normalize:
-            nrm = np.linalg.norm(v)
-            if nrm > 0:
-                v /= nrm
+            norms = np.sqrt(np.sum(vs ** 2, axis=1, keepdims=True))
+            vs = vs / np.where(norms > 0, norms, 1)
+
+        texts = []
+        for i in range(0, len(vs), block_size):
+            block = vs[i:i + block_size]
+            if approximate:
+                for v in block:
+                    ids = self._ids(terms, self._approximate_ids(v))
+                    texts.extend(self._texts(
+                        ids, self._similarities(ids, v[np.newaxis]),
+                        minimum_count, maximum_count, threshold, join))
+            else:
+                ids = self._ids(terms)
+                texts.extend(self._texts(
+                    ids, self._similarities(ids, block),
+                    minimum_count, maximum_count, threshold, join))
+        return texts
 
-        m = np.dot(self.vectors, v)
-        matches = [(mm, self.keys[i]) for i, mm in enumerate(m)]
-        if self.include_pairs:
-            m2 = np.dot(self.vector_pairs, v)
-            matches2 = [(mm2, self.key_pairs[i]) for i, mm2 in enumerate(m2)]
-            matches.extend(matches2)
+    def _ids(self, terms, key_ids=None):
+        """Indices of the keys, followed by len(keys) + indices of the pairs.
+
+        Returns None for all keys and pairs.
+        """
+        if terms is None and key_ids is None:
+            return None
+        n = len(self.keys)
+        if key_ids is None:
+            key_ids = np.arange(n)
         if terms is not None:
-            # TODO: handle the terms parameter more efficiently, so we don't
-            # compute a whole bunch of dot products and then throw them out
-            matches = [mm for mm in matches if mm[1] in terms]
-        matches.sort()
-        matches.reverse()
-
-        r = []
-        for m in matches:
-            if minimum_count is not None and len(r) < minimum_count:
-                r.append(m)
-            elif maximum_count is not None and len(r) == maximum_count:
-                break
-            elif threshold is None or m[0] > threshold:
-                r.append(m)
-            else:
-                break
+            terms = set(terms)
+            key_ids = [i for i in key_ids if self.keys[i] in terms]
+            pair_ids = [self._pair_indices[t] for t in terms
+                        if self.include_pairs and t in self._pair_indices]
+        else:
+            pair_ids = np.arange(len(self.key_pairs)) if (
+                self.include_pairs) else []
+        return np.concatenate([np.asarray(key_ids, dtype=int),
+                               n + np.asarray(pair_ids, dtype=int)])
+
+    def _similarities(self, ids, vs):
+        if ids is None:
+            rows = [self.vectors]
+            if self.include_pairs:
+                rows.append(self.vector_pairs)
+        else:
+            n = len(self.keys)
+            rows = [self.vectors[ids[ids < n]]]
+            if self.include_pairs:
+                rows.append(self.vector_pairs[ids[ids >= n] - n])
+        return np.hstack([np.dot(vs, r.T) for r in rows])
+
+    def _texts(self, ids, sims, minimum_count, maximum_count, threshold,
+               join):
+        n, m = len(self.keys), sims.shape[1]
+        counts = np.zeros(len(sims), dtype=int) + (
+            m if threshold is None else np.sum(sims > threshold, axis=1))
+        counts = np.maximum(counts, minimum_count or 0)
+        if maximum_count is not None:
+            counts = np.minimum(counts, maximum_count)
+        counts = np.minimum(counts, m)
+
+        texts = []
+        for count, row in zip(counts, sims):
+            if count == 0:
+                texts.append('')
+                continue
+            # only the top `count` (and any ties) need to be sorted
+            kth = -np.partition(-row, count - 1)[count - 1]
+            matches = []
+            for j in np.flatnonzero(row >= kth):
+                i = j if ids is None else ids[j]
+                key = self.keys[i] if i < n else self.key_pairs[i - n]
+                matches.append((row[j], key))
+            matches.sort(reverse=True)
+            texts.append(join.join(
+                '%0.2f%s' % (sim, key) for sim, key in matches[:count]))
+        return texts
+
+    def build_index(self, n_bits=8, n_tables=16, rng=None):
+        """Build the approximate nearest-neighbour index used by `text`.
+
+        The index uses random-hyperplane locality-sensitive hashing: each
+        of ``n_tables`` tables hashes pointers by the signs of their dot
+        products with ``n_bits`` random vectors, and a query is compared
+        against all pointers sharing a bucket with it in any table.  More
+        tables find more similar pointers; more bits make buckets smaller.
+        The index only covers keys, not pairs, and is rebuilt
+        automatically with the same parameters when keys are added.
+        """
+        if rng is None:
+            rng = np.random if self.rng is None else self.rng
+        self._index = _HyperplaneIndex(self.vectors, n_bits, n_tables, rng)
 
-        return join.join(['%0.2f%s' % (sim, key) for (sim, key) in r])
+    def _approximate_ids(self, v):
+        if self._index is None or self._index.size != len(self.keys):
+            self.build_index(**({} if self._index is None else dict(
+                n_bits=self._index.n_bits, n_tables=self._index.n_tables)))
+        return self._index.query(v)
 
     def dot(self, v):
         """Returns the dot product with all terms in the Vocabulary.
@@ -306,6 +638,51 @@ class Vocabulary(object):
             v = v.v
         return np.dot(self.vectors, v)
 
+    def similarity(self, data, normalize=False, block_size=4096, out=None):
+        """Returns the similarity of each row of data with each term.
+
+        ``data`` is a (T x D) array (e.g., probe data, possibly a
+        `numpy.memmap`), which is processed ``block_size`` rows at a time.
+        Returns a (T x M) array, or stores it in ``out`` if given.
+        See `nengo.spa.similarity`.
+        """
+        return similarity(
+            data, self, normalize=normalize, block_size=block_size, out=out)
+
+    def top_k(self, data, k=1, normalize=False, block_size=4096):
+        """Returns the k most similar terms for each row of data.
+
+        ``data`` is a (T x D) array processed ``block_size`` rows at a time,
+        so the (T x M) similarities are never all in memory at once.
+
+        Returns
+        -------
+        keys : ndarray (T, k)
+            The names of the most similar terms, from most to least similar.
+        similarities : ndarray (T, k)
+            The corresponding similarities.
+        """
+        if block_size < 1:
+            raise ValueError(
+                "block_size must be at least 1 (got %s)" % block_size)
+        data = np.array(data, copy=False, ndmin=2)
+        k = min(k, len(self.keys))
+        indices = np.zeros((data.shape[0], k), dtype=int)
+        sims = np.zeros((data.shape[0], k))
+        rows = np.arange(min(block_size, data.shape[0]))[:, np.newaxis]
+        for i in range(0, data.shape[0], block_size):
+            block = self.similarity(
+                data[i:i + block_size], normalize=normalize, block_size=None)
+            r = rows[:len(block)]
+            top = (np.argpartition(-block, k - 1, axis=1)[:, :k]
+                   if 0 < k < block.shape[1] else
+                   np.tile(np.arange(k), (len(block), 1)))
+            top = top[r, np.argsort(-block[r, top], axis=1)]
+            indices[i:i + block_size] = top
+            sims[i:i + block_size] = block[r, top]
+        keys = np.array(self.keys, dtype=object)[indices]
+        return keys, sims
+
     def dot_pairs(self, v):
         """Returns the dot product with all pairs of terms in the Vocabulary.
 
@@ -321,7 +698,7 @@ class Vocabulary(object):
         """Create a linear transform from one Vocabulary to another.
 
         This is simply the sum of the outer products of the corresponding
-        terms in each Vocabulary.
+        terms in each Vocabulary, computed as a single matrix product.
 
         Parameters
         ----------
@@ -340,12 +717,12 @@ class Vocabulary(object):
                 if k not in keys:
                     keys.append(k)
 
-        t = np.zeros((other.dimensions, self.dimensions), dtype=float)
-        for k in keys:
-            a = self[k].v
-            b = other[k].v
-            t += np.outer(b, a)
-        return t
+        a = np.zeros((len(keys), self.dimensions))
+        b = np.zeros((len(keys), other.dimensions))
+        for i, k in enumerate(keys):
+            a[i] = self[k].v
+            b[i] = other[k].v
+        return np.dot(b.T, a)
 
     def prob_cleanup(self, similarity, vocab_size, steps=10000):
         """Estimate the chance of successful cleanup.
@@ -415,6 +792,34 @@ class Vocabulary(object):
         return result
 
 
+class _HyperplaneIndex(object):
+    """Random-hyperplane locality-sensitive hashing of unit vectors."""
+
+    def __init__(self, vectors, n_bits, n_tables, rng):
+        self.size = len(vectors)
+        self.n_bits = n_bits
+        self.n_tables = n_tables
+        self.planes = rng.randn(vectors.shape[1], n_tables * n_bits)
+        self.weights = 2 ** np.arange(n_bits)
+
+        hashes = self.hash(vectors)
+        self.order = np.argsort(hashes, axis=0, kind='mergesort')
+        self.hashes = np.sort(hashes, axis=0)
+
+    def hash(self, vectors):
+        bits = np.dot(vectors, self.planes) > 0
+        bits = bits.reshape(len(vectors), self.n_tables, self.n_bits)
+        return np.dot(bits, self.weights)
+
+    def query(self, v):
+        """Return the indices of all vectors sharing a bucket with ``v``."""
+        h = self.hash(v[np.newaxis, :])[0]
+        ids = [self.order[np.searchsorted(self.hashes[:, i], h[i]):
+                          np.searchsorted(self.hashes[:, i], h[i], 'right'), i]
+               for i in range(self.n_tables)]
+        return np.unique(np.concatenate(ids))
+
+
 class VocabularyParam(nengo.params.Parameter):
     """Can be a Vocabulary."""
 
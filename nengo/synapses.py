@@ -4,7 +4,7 @@ import numpy as np
 
 from nengo.params import Parameter, Unconfigurable
 from nengo.utils.compat import is_number
-from nengo.utils.filter_design import cont2discrete
+from nengo.utils.filter_design import cont2discrete, tf2ss
 
 
 class Synapse(object):
@@ -105,27 +105,40 @@ class LinearFilter(Synapse):
     class General(Step):
         """An LTI step function for any given transfer function.
 
-        Implements a discrete-time LTI system using the difference equation
-        [1]_ for the given transfer function (num, den).
+        Implements a discrete-time LTI system in state-space form [1]_, using
+        the controller canonical realization of the transfer function
+        (num, den). The state for all elements of the output is stored in a
+        single (order, output.size) array, which is advanced with one
+        matrix product per step.
 
         References
         ----------
-        .. [1] http://en.wikipedia.org/wiki/Digital_filter#Difference_equation
+        .. [1] http://en.wikipedia.org/wiki/State-space_representation
         """
         def __init__(self, num, den, output):
             super(LinearFilter.General, self).__init__(num, den, output)
-            self.x = collections.deque(maxlen=len(num))
-            self.y = collections.deque(maxlen=len(den))
 
-        def __call__(self, signal):
-            self.output[...] = 0
+            # num and den (with leading 1) as polynomials of the same order
+            n = max(len(num), len(den) + 1)
+            b = np.zeros(n)
+            b[:len(num)] = num
+            a = np.zeros(n)
+            a[0] = 1.
+            a[1:len(den)+1] = den
+
+            A, B, C, D = tf2ss(b, a)
+            self.A = A
+            self.B = B.ravel()
+            self.C = C.ravel()
+            self.D = D.item()
+            self.x = np.zeros((len(self.A), output.size))
 
-            self.x.appendleft(np.array(signal))
-            for k, xk in enumerate(self.x):
-                self.output += self.num[k] * xk
-            for k, yk in enumerate(self.y):
-                self.output -= self.den[k] * yk
-            self.y.appendleft(np.array(self.output))
+        def __call__(self, signal):
+            u = np.ravel(signal)
+            y = np.dot(self.C, self.x)
+            y += self.D * u
+            self.x[...] = np.dot(self.A, self.x) + np.outer(self.B, u)
+            self.output[...] = y.reshape(self.output.shape)
 
 
 class Lowpass(LinearFilter):
@@ -196,10 +209,16 @@ class Triangle(Synapse):
     def __repr__(self):
         return "%s(%s)" % (self.__class__.__name__, self.t)
 
-    def make_step(self, dt, output):
+    def taps(self, dt, dtype=np.float64):
+        """The coefficients of the FIR filter for timestep ``dt``."""
         n_taps = int(np.round(self.t / float(dt))) + 1
-        num = np.arange(n_taps, 0, -1, dtype=output.dtype)
+        num = np.arange(n_taps, 0, -1, dtype=dtype)
         num /= num.sum()
+        return num
+
+    def make_step(self, dt, output):
+        num = self.taps(dt, dtype=output.dtype)
+        n_taps = len(num)
 
         # Minimal multiply implementation finds the difference between
         # coefficients and subtracts a scaled signal at each time step.
@@ -215,9 +234,94 @@ class Triangle(Synapse):
         return step_triangle
 
 
+def lti_filter(num, den, x, block_size=64):
+    """Filter ``x`` along its first axis with the digital filter (num, den).
+
+    The filter starts from a zero state, and is equivalent to
+    ``scipy.signal.lfilter(num, den, x, axis=0)``, which is used if SciPy is
+    available. Otherwise, the signal is filtered in blocks of ``block_size``
+    samples, using the state-space form of the filter to compute each block
+    with a few matrix products.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    try:
+        import scipy.signal
+        return scipy.signal.lfilter(num, den, x, axis=0)
+    except ImportError:
+        pass
+
+    # num and den as polynomials of the same order
+    n = max(len(num), len(den))
+    b = np.zeros(n)
+    b[:len(num)] = num
+    a = np.zeros(n)
+    a[:len(den)] = den
+    b, a = b / a[0], a / a[0]
+
+    x2 = x.reshape(len(x), -1)
+    if n == 1:
+        return (b[0] * x2).reshape(x.shape)
+
+    A, B, C, D = tf2ss(b, a)
+    B, C, D = B.ravel(), C.ravel(), D.item()
+    order = len(A)
+    L = max(min(block_size, len(x)), 1)
+
+    # powers[k] = A**k, for the response of the state over one block
+    powers = [np.eye(order)]
+    for k in range(L):
+        powers.append(np.dot(powers[-1], A))
+    obs = np.array([np.dot(C, powers[k]) for k in range(L)])  # C A**k
+    ctrl = np.array([np.dot(powers[L-1-j], B) for j in range(L)]).T
+    h = np.zeros(L)  # impulse response
+    h[0] = D
+    h[1:] = np.dot(obs[:-1], B)
+    T = np.zeros((L, L))
+    for k in range(L):
+        T[k:, k] = h[:L-k]
+
+    y = np.empty_like(x2)
+    state = np.zeros((order, x2.shape[1]))
+    for i in range(0, len(x2), L):
+        u = x2[i:i+L]
+        m = len(u)
+        y[i:i+m] = np.dot(T[:m, :m], u) + np.dot(obs[:m], state)
+        if m == L:
+            state = np.dot(powers[L], state) + np.dot(ctrl, u)
+
+    return y.reshape(x.shape)
+
+
+def _digital_filter(synapse, dt, output):
+    """Returns the (num, den) applied by steps of ``synapse``, if it is LTI.
+
+    Returns None for synapses that must be simulated step by step.
+    """
+    if isinstance(synapse, LinearFilter):
+        step = synapse.make_step(dt, output)
+        return np.asarray(step.num), np.r_[1., step.den]
+    elif isinstance(synapse, Triangle):
+        return synapse.taps(dt), np.array([1.])
+    return None
+
+
+def _initial_response(synapse, dt, output, n):
+    """The contribution of the initial ``output`` to the next ``n`` steps."""
+    if isinstance(synapse, Triangle):
+        return np.ones(n)[:, None] * output.ravel()
+    step = synapse.make_step(dt, output)
+    if isinstance(step, LinearFilter.Simple):
+        decay = (-step.a) ** np.arange(1, n + 1)
+        return decay[:, None] * output.ravel()
+    return np.zeros((n, output.size))  # other steps do not use the output
+
+
 def filt(signal, synapse, dt, axis=0, x0=None, copy=True):
     """Filter ``signal`` with ``synapse``.
 
+    Linear filters and ``Triangle`` synapses are applied to the whole signal
+    at once (see `lti_filter`); other synapses are simulated step by step.
+
     Parameters
     ----------
     signal : array_like
@@ -249,6 +353,15 @@ def filt(signal, synapse, dt, axis=0, x0=None, copy=True):
         # signal_out is our buffer for the current filter state
         signal_out = np.zeros_like(filt_view[0])
 
+    coefs = _digital_filter(synapse, dt, signal_out)
+    if coefs is not None:
+        y = lti_filter(coefs[0], coefs[1], filt_view)
+        if x0 is not None:
+            y += _initial_response(
+                synapse, dt, signal_out, len(y)).reshape(y.shape)
+        filt_view[...] = y
+        return filtered
+
     step = synapse.make_step(dt, signal_out)
 
     for i, signal_in in enumerate(filt_view):
@@ -285,6 +398,18 @@ def filtfilt(signal, synapse, dt, axis=0, copy=True):
     filtered = np.array(signal, copy=copy)
     filt_view = np.rollaxis(filtered, axis=axis)
     signal_out = np.zeros_like(filt_view[0])
+
+    coefs = _digital_filter(synapse, dt, signal_out)
+    if coefs is not None:
+        # The reverse pass continues from the state of the forward pass,
+        # so it is the tail of filtering the forward input followed by
+        # the reversed forward output.
+        num, den = coefs
+        y = lti_filter(num, den, filt_view)
+        y = lti_filter(num, den, np.concatenate([filt_view, y[::-1]]))
+        filt_view[...] = y[len(filt_view):][::-1]
+        return filtered
+
     step = synapse.make_step(dt, signal_out)
 
     for i, signal_in in enumerate(filt_view):
@@ -6,7 +6,9 @@ import pytest
 import nengo
 from nengo.builder import Model
 from nengo.builder.ensemble import BuiltEnsemble
-from nengo.builder.operator import DotInc, PreserveValue
+from nengo.builder.operator import (
+    DotInc, PreserveValue, SparseDotInc, SpikeDotInc)
+from nengo.builder.neurons import SpikeIndices
 from nengo.builder.signal import Signal, SignalDict
 from nengo.utils.compat import itervalues
 
@@ -234,3 +236,88 @@ def test_commonsig_readonly(RefSimulator):
             sim.signals[sig] = np.array([-1])
         with pytest.raises((ValueError, RuntimeError)):
             sim.signals[sig][...] = np.array([-1])
+
+
+@pytest.mark.parametrize('n_active', [0, 3, 50])
+def test_spikedotinc(n_active, rng):
+    """SpikeDotInc matches DotInc for sparse and dense spike vectors"""
+    n, d = 50, 3
+    x = np.zeros(n)
+    idx = np.sort(rng.permutation(n)[:n_active])
+    x[idx] = 1000.
+
+    A = Signal(rng.normal(size=(d, n)))
+    X = Signal(x)
+    Y = Signal(np.zeros(d))
+    n_spikes = Signal(n_active, dtype=np.intp)
+    spike_indices = Signal(np.zeros(n), dtype=np.intp)
+
+    signals = SignalDict()
+    for sig in (A, X, Y, n_spikes, spike_indices):
+        signals.init(sig)
+    signals[spike_indices][:n_active] = idx
+
+    op = SpikeDotInc(A, X, Y, n_spikes, spike_indices)
+    op.make_step(signals, dt=0.001, rng=rng)()
+    assert np.allclose(signals[Y], np.dot(A.value, x))
+
+
+def test_spikedotinc_built(RefSimulator, seed):
+    """Connections from spiking neurons only accumulate active columns"""
+    with nengo.Network(seed=seed) as net:
+        stim = nengo.Node(0.5)
+        a = nengo.Ensemble(50, 1)
+        b = nengo.Ensemble(40, 1, neuron_type=nengo.LIFRate())
+        nengo.Connection(stim, a)
+        c_ab = nengo.Connection(a, b)
+        c_ba = nengo.Connection(b, a)
+        c_aa = nengo.Connection(a.neurons, a.neurons,
+                                transform=np.zeros((50, 50)))
+        c = nengo.Ensemble(30, 1)
+        nengo.Connection(stim, c)
+        p = nengo.Probe(a.neurons, 'spikes')
+        p_ab = nengo.Probe(c_ab, 'output')
+
+    sim = RefSimulator(net)
+    optypes = dict((op.tag, type(op)) for op in sim.model.operators)
+    assert optypes["%s.weights_spikedotinc" % c_ab] is SpikeDotInc
+    assert optypes["%s.weights_spikedotinc" % c_aa] is SpikeDotInc
+    assert optypes["%s.weights_elementwiseinc" % c_ba] is DotInc
+
+    # spikes are only indexed for populations read by a SpikeDotInc
+    assert [op.spikes for op in sim.model.operators
+            if isinstance(op, SpikeIndices)] == [sim.model.sig[a]['out']]
+    assert sim.model.sig[a.neurons]['spike_indices'].dtype == np.intp
+    assert 'spike_indices' not in sim.model.sig[c.neurons]
+
+    sim.run(0.1)
+    spikes = sim.data[p]
+    assert np.any(spikes > 0)
+    weighted = np.dot(spikes, sim.data[c_ab].weights.T)
+    expected = nengo.synapses.filt(weighted, c_ab.synapse, sim.dt)
+    assert np.allclose(sim.data[p_ab][1:], expected[:-1])
+
+
+def test_sparsedotinc(rng):
+    """SparseDotInc matches DotInc, and sees changes to the nonzero values"""
+    scipy_sparse = pytest.importorskip('scipy.sparse')
+    matrix = scipy_sparse.random(20, 30, density=0.1, format='csr',
+                                 random_state=rng)
+    x = rng.normal(size=30)
+
+    A = Signal(matrix.data)
+    X = Signal(x)
+    Y = Signal(np.zeros(20))
+    signals = SignalDict()
+    for sig in (A, X, Y):
+        signals.init(sig)
+
+    op = SparseDotInc(A, X, Y, matrix.indices, matrix.indptr)
+    step = op.make_step(signals, dt=0.001, rng=rng)
+    step()
+    assert np.allclose(signals[Y], matrix.dot(x))
+
+    signals[A][...] *= 2
+    signals[Y][...] = 0
+    step()
+    assert np.allclose(signals[Y], 2 * matrix.dot(x))
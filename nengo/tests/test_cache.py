@@ -9,7 +9,9 @@ from numpy.testing import assert_equal
 import pytest
 
 import nengo
-from nengo.cache import DecoderCache, Fingerprint, get_fragment_size
+from nengo.cache import (
+    DecoderCache, Fingerprint, MemoryDecoderCache, NoDecoderCache,
+    get_fragment_size)
 from nengo.utils.compat import int_types
 
 
@@ -214,6 +216,29 @@ def test_decoder_cache_with_E_argument_to_solver(tmpdir):
     assert solver_info1 == solver_info2
 
 
+def test_memory_decoder_cache():
+    solver_mock = SolverMock()
+
+    cache = MemoryDecoderCache(NoDecoderCache())
+    decoders1, solver_info1 = cache.wrap_solver(solver_mock)(
+        **get_solver_test_args())
+    decoders2, solver_info2 = cache.wrap_solver(solver_mock)(
+        **get_solver_test_args())
+    assert SolverMock.n_calls[solver_mock] == 1  # reused from memory?
+    assert_equal(decoders1, decoders2)
+    assert decoders1 is not decoders2
+    assert solver_info1 == solver_info2
+
+    solver_args = get_solver_test_args()
+    solver_args['rng'].rand()
+    cache.wrap_solver(solver_mock)(**solver_args)
+    assert SolverMock.n_calls[solver_mock] == 2
+
+    cache.invalidate()
+    cache.wrap_solver(solver_mock)(**get_solver_test_args())
+    assert SolverMock.n_calls[solver_mock] == 3
+
+
 class DummyA(object):
     def __init__(self, attr=0):
         self.attr = attr
@@ -6,6 +6,7 @@ import nengo.utils.numpy as npext
 from nengo.connection import ConnectionSolverParam
 from nengo.dists import UniformHypersphere
 from nengo.solvers import LstsqL2
+from nengo.utils.connection import eval_point_decoding
 from nengo.utils.functions import piecewise
 from nengo.utils.testing import allclose
 
@@ -225,6 +226,134 @@ def test_neurons_to_neurons(Simulator, nl_nodirect, plt, seed):
     assert np.allclose(sim.data[b_p][-10:], 0, atol=.1, rtol=.01)
 
 
+def test_sparse_transform(Simulator, seed, rng):
+    """Sparse transforms give the same result as the equivalent dense ones"""
+    scipy_sparse = pytest.importorskip('scipy.sparse')
+    N1, N2 = 30, 50
+    transform = scipy_sparse.random(N2, N1, density=0.2, random_state=rng)
+    transform.data[...] = -0.01
+
+    def run(transform):
+        with nengo.Network(seed=seed) as m:
+            a = nengo.Ensemble(N1, dimensions=1)
+            b = nengo.Ensemble(N2, dimensions=1)
+            nengo.Connection(nengo.Node(output=1), a)
+            conn = nengo.Connection(a.neurons, b.neurons, transform=transform)
+            b_p = nengo.Probe(b.neurons, 'input')
+
+        sim = Simulator(m)
+        sim.run(0.1)
+        return sim, conn, sim.data[b_p]
+
+    sim, conn, sparse_output = run(transform)
+    assert npext.is_sparse(conn.transform)
+    assert npext.is_sparse(sim.data[conn].weights)
+    assert sim.data[conn].weights.nnz == transform.nnz
+
+    _, _, dense_output = run(transform.toarray())
+    assert np.allclose(sparse_output, dense_output)
+
+
+def test_sparse_weight_solver(Simulator, seed):
+    """Weight solvers with ``sparse=True`` give sparse weights"""
+    pytest.importorskip('scipy.sparse')
+    with nengo.Network(seed=seed) as m:
+        a = nengo.Ensemble(50, dimensions=1)
+        b = nengo.Ensemble(50, dimensions=1)
+        sparse_conn = nengo.Connection(a, b, solver=nengo.solvers.LstsqDrop(
+            weights=True, drop=0.95, sparse=True))
+        dense_conn = nengo.Connection(
+            a, b, solver=nengo.solvers.LstsqDrop(weights=True, drop=0.95))
+        sparse_p = nengo.Probe(sparse_conn, 'weights')
+        dense_p = nengo.Probe(dense_conn, 'weights')
+
+    sim = Simulator(m)
+    sim.run_steps(5)
+    weights = sim.data[sparse_conn].weights
+    assert npext.is_sparse(weights)
+    assert weights.nnz <= 0.1 * 50 * 50
+    assert sim.data[sparse_p].shape == (5, weights.nnz)
+
+    # mostly zero weights stay dense unless sparse weights are requested
+    dense_weights = sim.data[dense_conn].weights
+    assert not npext.is_sparse(dense_weights)
+    assert np.count_nonzero(dense_weights) <= 0.1 * 50 * 50
+    assert sim.data[dense_p].shape == (5, 50, 50)
+    assert np.allclose(dense_weights, weights.toarray())
+
+
+def test_factored_weights(Simulator, seed):
+    """Factored weight connections match the full weight matrix"""
+    def func(x):
+        return [x[0] * x[1], x[0]]
+
+    transform = [[0.5, -1], [1, 0.5], [-0.5, 1]]
+    with nengo.Network(seed=seed) as m:
+        u = nengo.Node(output=lambda t: [np.sin(6 * t), np.cos(6 * t)])
+        a = nengo.Ensemble(50, dimensions=2)
+        b = nengo.Ensemble(60, dimensions=3, seed=seed)
+        c = nengo.Ensemble(60, dimensions=3, seed=seed)
+        nengo.Connection(u, a)
+        full = nengo.Connection(
+            a, b, function=func, transform=transform, synapse=0.005,
+            solver=nengo.solvers.LstsqL2(weights=True))
+        factored = nengo.Connection(
+            a, c, function=func, transform=transform, synapse=0.005,
+            solver=nengo.solvers.LstsqL2(weights=True, factored=True))
+        bp = nengo.Probe(b.neurons, 'input')
+        cp = nengo.Probe(c.neurons, 'input')
+        wp = nengo.Probe(factored, 'weights')
+
+    sim = Simulator(m)
+    assert sim.data[factored].weights is None
+    encoders, decoders = sim.data[factored].factors
+    assert encoders.shape == (60, 3) and decoders.shape == (3, 50)
+
+    sim.run(0.1)
+    assert np.allclose(sim.data[wp][-1], sim.data[full].weights)
+    assert np.allclose(sim.data[bp], sim.data[cp])
+
+
+def test_vectorized_function(Simulator, seed):
+    """Vectorized functions are called once for all evaluation points"""
+    from nengo.rc import rc
+
+    calls = {'square': 0, 'product': 0}
+
+    def square(x):
+        calls['square'] += 1
+        return x ** 2
+
+    def product(x):
+        calls['product'] += 1
+        return x[0] * x[1]
+
+    with nengo.Network(seed=seed) as m:
+        a = nengo.Ensemble(50, dimensions=2)
+        b = nengo.Ensemble(50, dimensions=2)
+        conns = [nengo.Connection(a, b, function=square, vectorized=v)
+                 for v in (True, None, False)]
+        c = nengo.Connection(a, b[0], function=product)
+
+    threads = rc.get('builder', 'threads')
+    try:
+        rc.set('builder', 'threads', '4')
+        sim = Simulator(m)
+    finally:
+        rc.set('builder', 'threads', threads)
+
+    n_points = len(sim.data[conns[0]].eval_points)
+    # 1 validation each, 1 vectorized, 1 + 3 for the trial, 1 per point
+    assert calls['square'] == 3 + 1 + 4 + n_points
+    assert calls['product'] == 2 + len(sim.data[c].eval_points)
+    for conn in conns[1:]:
+        assert np.allclose(sim.data[conn].weights, sim.data[conns[0]].weights)
+
+    _, targets, decoded = eval_point_decoding(c, sim)
+    assert np.allclose(targets[:, 0], np.prod(sim.data[c].eval_points, 1))
+    assert npext.rms(decoded - targets) < 0.1
+
+
 def test_function_and_transform(Simulator, plt, seed):
     """Test using both a function and a transform"""
 
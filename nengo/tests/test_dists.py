@@ -79,6 +79,79 @@ def test_hypersphere_surface(dimensions, rng):
     assert np.allclose(np.mean(samples, axis=0), 0, atol=0.25 / dimensions)
 
 
+@pytest.mark.parametrize("dimensions", [1, 3, 20])
+def test_quasirandom(dimensions, rng):
+    n = 500
+    samples = dists.QuasirandomSequence().sample(n, dimensions, rng=rng)
+    assert samples.shape == (n, dimensions)
+    assert np.all(samples >= 0) and np.all(samples < 1)
+
+    # much more even than pseudo-random points, which have sterr ~ 0.013
+    assert np.allclose(np.mean(samples, axis=0), 0.5, atol=0.005)
+    hist, _ = np.histogram(samples, bins=10, range=(0, 1))
+    assert np.allclose(hist, 0.1 * n * dimensions, atol=0.01 * n * dimensions)
+
+    assert dists.QuasirandomSequence().sample(n, rng=rng).shape == (n,)
+
+
+@pytest.mark.parametrize("dimensions", [1, 2, 5])
+@pytest.mark.parametrize("surface", [False, True])
+def test_scattered_hypersphere(dimensions, surface, rng):
+    n = 150 * dimensions
+    dist = dists.ScatteredHypersphere(surface=surface)
+    with pytest.raises(ValueError):
+        dist.sample(1, 0)
+
+    samples = dist.sample(n, dimensions, rng=rng)
+    assert samples.shape == (n, dimensions)
+    norms = npext.norm(samples, axis=1)
+    if surface:
+        assert np.allclose(norms, 1)
+    else:
+        assert np.all(norms <= 1)
+        # magnitudes are distributed like those of UniformHypersphere
+        hist, _ = np.histogram(norms ** dimensions, bins=5, range=(0, 1))
+        assert np.allclose(hist, n / 5., atol=0.05 * n)
+    assert np.allclose(np.mean(samples, axis=0), 0, atol=0.05 / dimensions)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+@pytest.mark.parametrize("dimensions", [2, 8])
+def test_eval_points_benchmark(Simulator, dimensions, analytics, plt, seed):
+    """Decoding error as a function of the number of evaluation points"""
+    import nengo
+    from nengo.utils.connection import eval_point_decoding
+
+    n_points = np.array([25, 50, 100, 200, 400, 800, 1600])
+    test_points = dists.UniformHypersphere().sample(
+        2000, dimensions, rng=np.random.RandomState(seed))
+
+    def function(x):
+        return x[0] * x[1]
+
+    for dist in (dists.UniformHypersphere(), dists.ScatteredHypersphere()):
+        errors = []
+        for n in n_points:
+            with nengo.Network(seed=seed) as model:
+                a = nengo.Ensemble(50 * dimensions, dimensions,
+                                   n_eval_points=n, eval_points=dist)
+                b = nengo.Node(size_in=1)
+                conn = nengo.Connection(a, b, function=function)
+            sim = Simulator(model)
+            _, targets, decoded = eval_point_decoding(conn, sim, test_points)
+            errors.append(npext.rmse(targets, decoded))
+
+        name = type(dist).__name__
+        analytics.add_data(name, errors, "Test RMSE. Shape: n_points")
+        plt.loglog(n_points, errors, label=name)
+
+    analytics.add_data('n_points', n_points, "Number of eval_points")
+    plt.xlabel("Number of eval_points")
+    plt.ylabel("Test RMSE")
+    plt.legend(loc='best')
+
+
 @pytest.mark.parametrize("weights", [None, [5, 1, 2, 9], [3, 2, 1, 0]])
 def test_choice(weights, rng):
     n = 1000
@@ -202,6 +202,43 @@ def learning_net(learning_rule, net, rng):
     return net, activity_p, weights_p
 
 
+@pytest.mark.parametrize('learning_rule', [nengo.PES, nengo.BCM, nengo.Oja])
+def test_sparse_weights(Simulator, learning_rule, seed, rng):
+    """Learning on sparse weights only changes the nonzero weights."""
+    scipy_sparse = pytest.importorskip('scipy.sparse')
+    n = 10
+    initial_weights = rng.uniform(high=1e-3, size=(n, n))
+
+    def run(transform):
+        with nengo.Network(seed=seed) as net:
+            u = nengo.Node(output=1.0)
+            pre = nengo.Ensemble(n, dimensions=1)
+            post = nengo.Ensemble(n, dimensions=1)
+            nengo.Connection(u, pre)
+            conn = nengo.Connection(pre.neurons, post.neurons,
+                                    transform=transform,
+                                    learning_rule_type=learning_rule())
+            if learning_rule is nengo.PES:
+                nengo.Connection(u, conn.learning_rule)
+            weights_p = nengo.Probe(conn, 'weights', sample_every=.01)
+
+        sim = Simulator(net)
+        sim.run(0.1)
+        return sim.data[weights_p]
+
+    # with all weights nonzero, sparse and dense learning are the same
+    dense = run(initial_weights)
+    sparse = run(scipy_sparse.csr_matrix(initial_weights))
+    assert np.allclose(sparse, dense.reshape(sparse.shape))
+    assert not np.allclose(sparse[0], sparse[-1])
+
+    # otherwise, only the nonzero weights are learned
+    initial_weights[:, ::2] = 0
+    sparse = run(scipy_sparse.csr_matrix(initial_weights))
+    assert sparse.shape[1] == n * n // 2
+    assert not np.allclose(sparse[0], sparse[-1])
+
+
 @pytest.mark.parametrize('learning_rule', [nengo.PES, nengo.BCM, nengo.Oja])
 def test_dt_dependence(Simulator, plt, learning_rule, seed, rng):
     """Learning rules should work the same regardless of dt."""
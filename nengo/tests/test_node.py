@@ -295,6 +295,29 @@ def test_set_output(Simulator):
     Simulator(model)  # Ensure it all builds
 
 
+def test_vectorized(Simulator):
+    def output(t):
+        return np.column_stack([np.sin(t), t ** 2])
+
+    with nengo.Network() as model:
+        u = nengo.Node(output, vectorized=True)
+        v = nengo.Node(lambda t: output(np.array([t]))[0])
+        w = nengo.Node(np.sin, vectorized=True)
+        up, vp, wp = nengo.Probe(u), nengo.Probe(v), nengo.Probe(w)
+
+    assert u.size_out == 2
+    assert w.size_out == 1
+
+    sim = Simulator(model)
+    sim.run(0.25)
+    assert np.allclose(sim.data[up], sim.data[vp])
+    assert np.allclose(sim.data[wp], np.sin(sim.trange())[:, None])
+
+    with model:
+        with pytest.raises(ValueError):
+            nengo.Node(lambda t, x: x, size_in=1, vectorized=True)
+
+
 def test_delay(Simulator, plt):
     with nengo.Network() as model:
         a = nengo.Node(output=np.sin)
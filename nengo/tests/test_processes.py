@@ -5,8 +5,8 @@ import pytest
 
 import nengo
 import nengo.utils.numpy as npext
-from nengo.dists import Distribution, Gaussian
-from nengo.processes import BrownNoise, WhiteNoise, WhiteSignal
+from nengo.dists import Distribution, Gaussian, UniformHypersphere
+from nengo.processes import BrownNoise, FilteredNoise, WhiteNoise, WhiteSignal
 
 
 class DistributionMock(Distribution):
@@ -205,6 +205,73 @@ def test_whitesignal_continuity(Simulator, seed, plt):
     assert abs(np.diff(x, n=2, axis=0)).max() <= safety_factor**2 * a * f**2
 
 
+def test_whitesignal_chunked(Simulator, seed, plt):
+    """Chunked generation keeps the RMS, cut-off, and continuity."""
+    t = 1.
+    high = 10
+    rms = 0.5
+    d = 500
+    process = WhiteSignal(t, high=high, rms=rms, chunk=0.25)
+    with nengo.Network() as model:
+        u = nengo.Node(process, size_out=d)
+        up = nengo.Probe(u)
+
+    sim = Simulator(model, seed=seed)
+    sim.run(2 * t)
+    dt = sim.dt
+    x = sim.data[up]
+    n = len(x) // 2
+    freq, val_psd = psd(x[:n], dt=dt)
+
+    plt.subplot(2, 1, 1)
+    plt.plot(sim.trange(), x[:, :2])
+    plt.subplot(2, 1, 2)
+    plt.plot(freq, val_psd, drawstyle='steps')
+    plt.xlim(right=high * 2.0)
+
+    assert np.allclose(x[:n], x[n:])  # periodic
+    assert np.allclose(np.std(x, axis=1), rms, rtol=0.15)
+    assert np.all(val_psd[npext.rfftfreq(n, dt) > 2 * high] < rms * 0.5)
+
+    safety_factor = 2.
+    a, f = np.sqrt(2) * rms, (2 * np.pi * high) * dt
+    assert abs(np.diff(x[:, :5], axis=0)).max() <= safety_factor * a * f
+
+
+def test_whitesignal_reset(Simulator, seed):
+    """Resetting the simulator gives the same signal again."""
+    with nengo.Network() as model:
+        u = nengo.Node(WhiteSignal(0.5, high=10), size_out=2)
+        up = nengo.Probe(u)
+
+    sim = Simulator(model, seed=seed)
+    sim.run(0.2)
+    x = np.array(sim.data[up])
+
+    sim.reset()
+    sim.run(0.2)
+    assert np.all(sim.data[up] == x)
+
+
+def test_whitesignal_chunked_memory(rng):
+    """Chunked signals with very long periods only generate what is used."""
+    # generating this whole period at once would need several gigabytes
+    process = WhiteSignal(1e6, high=10, chunk=0.5)
+    block_step = process.make_block_step(0, 2, 0.001, rng)
+    x = block_step(5e5, 1000)
+    assert x.shape == (1000, 2)
+    assert np.all(np.isfinite(x)) and np.any(x != 0)
+    assert np.all(block_step(5e5 + 0.5, 500) == x[500:])
+
+
+def test_whitesignal_lazy(rng):
+    """Making the step function does not generate the signal."""
+    # generating this whole period at once would need several gigabytes
+    process = WhiteSignal(1e6, high=10)
+    process.make_step(0, 2, 0.001, rng)
+    process.make_block_step(0, 2, 0.001, rng)
+
+
 def test_sampling_shape():
     process = WhiteSignal(0.1)
     assert process.run_steps(1).shape == (1, 1)
@@ -230,3 +297,62 @@ def test_reset(Simulator, seed):
 
     assert x.shape == y.shape
     assert (x == y).all()
+
+
+@pytest.mark.parametrize('process', [
+    WhiteNoise(), FilteredNoise(synapse=nengo.Alpha(0.01)), BrownNoise(),
+    WhiteSignal(0.5, high=10),
+    WhiteNoise(dist=UniformHypersphere(), scale=False),
+    FilteredNoise(dist=UniformHypersphere(surface=True))])
+def test_block_steps(Simulator, process, seed, monkeypatch):
+    """Generating outputs in blocks gives the same result as single steps"""
+    from nengo.builder.processes import SimProcess
+
+    d, n_steps, dt = 3, 250, 0.001
+    x = process.run_steps(n_steps, d=d, rng=np.random.RandomState(seed))
+    step = process.make_step(0, d, dt, np.random.RandomState(seed))
+    y = np.array([step(i * dt) for i in range(n_steps)])
+    assert np.allclose(x, y)
+
+    with nengo.Network() as model:
+        u = nengo.Node(process, size_out=d)
+        up = nengo.Probe(u)
+
+    sim = Simulator(model, seed=seed)
+    sim.run_steps(n_steps)
+    x = np.array(sim.data[up])
+
+    monkeypatch.setattr(SimProcess, 'block_size', 7)
+    sim = Simulator(model, seed=seed)
+    sim.run_steps(n_steps)
+    assert np.allclose(x, sim.data[up])
+
+
+def test_block_steps_draws(seed):
+    """Blocks of non-Gaussian noise use the same draws as single steps"""
+    dist = UniformHypersphere()
+    x = WhiteNoise(dist=dist, scale=False).run_steps(
+        20, d=3, rng=np.random.RandomState(seed))
+
+    rng = np.random.RandomState(seed)
+    sim_rng = np.random.RandomState(rng.randint(npext.maxint))
+    y = np.array([dist.sample(n=1, d=3, rng=sim_rng)[0] for _ in range(20)])
+    assert np.allclose(x, y)
+
+
+def test_make_step_override(Simulator):
+    """Subclasses overriding only `make_step` are not run in blocks"""
+    class ConstantNoise(WhiteNoise):
+        def make_step(self, size_in, size_out, dt, rng):
+            return lambda t: np.ones(size_out)
+
+    process = ConstantNoise()
+    assert np.all(process.run_steps(5, d=2) == 1)
+
+    with nengo.Network() as model:
+        u = nengo.Node(process, size_out=2)
+        up = nengo.Probe(u)
+
+    sim = Simulator(model)
+    sim.run_steps(5)
+    assert np.all(sim.data[up] == 1)
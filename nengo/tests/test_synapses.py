@@ -1,3 +1,5 @@
+import sys
+
 import numpy as np
 import pytest
 
@@ -95,6 +97,31 @@ def test_linearfilter(Simulator, plt, seed):
     assert allclose(t, y, yhat, delay=dt, plt=plt)
 
 
+def test_merged_synapses(Simulator, plt, seed):
+    from nengo.builder.synapses import SimSynapses
+
+    dt = 1e-3
+    tau = 0.01
+    with nengo.Network(seed=seed) as model:
+        refs, filtered = [], []
+        for i in range(3):
+            u = nengo.Node(output=WhiteSignal(0.5, 5))
+            refs.append(nengo.Probe(u))
+            filtered.append(nengo.Probe(u, synapse=Lowpass(tau)))
+
+    sim = Simulator(model, dt=dt)
+    sim.run(0.5)
+
+    if Simulator is nengo.Simulator:
+        merged = [op for op in sim.dg if isinstance(op, SimSynapses)]
+        assert len(merged) == 1 and len(merged[0].outputs) == 3
+
+    t = sim.trange()
+    for ref, probe in zip(refs, filtered):
+        y = filt(sim.data[ref], tau, dt=dt)
+        assert allclose(t, y, sim.data[probe], delay=dt, plt=plt)
+
+
 def test_step_errors():
     output = np.zeros(3)
     with pytest.raises(ValueError):
@@ -105,6 +132,24 @@ def test_step_errors():
         LinearFilter.Simple([1], [1, 2], output)
 
 
+def test_general_step(rng):
+    """The state-space step matches the difference equation"""
+    signal = pytest.importorskip('scipy.signal')
+
+    num = np.array([0.2, 0.1, 0.05])
+    den = np.array([1., -0.5, 0.1, -0.02])
+    x = rng.normal(size=(100, 2, 3))
+
+    output = np.zeros((2, 3))
+    step = LinearFilter.General(num, den[1:], output)
+    y = np.zeros_like(x)
+    for i, xi in enumerate(x):
+        step(xi)
+        y[i] = output
+
+    assert np.allclose(y, signal.lfilter(num, den, x, axis=0))
+
+
 def test_filt(plt, rng):
     dt = 1e-3
     tend = 3.
@@ -166,6 +211,43 @@ def test_lti_lowpass(rng, plt):
     assert np.allclose(x, y)
 
 
+@pytest.mark.parametrize('scipy', [True, False])
+@pytest.mark.parametrize('synapse', [
+    Lowpass(0.01), Alpha(0.02), Triangle(0.03),
+    LinearFilter([0.2, 0.1, 0.05], [1., -0.5, 0.1, -0.02], analog=False)])
+def test_filt_matches_step(synapse, scipy, rng, monkeypatch):
+    """Vectorized filtering gives the same result as stepping the synapse"""
+    if not scipy:
+        monkeypatch.setitem(sys.modules, 'scipy.signal', None)
+
+    dt = 1e-3
+    u = rng.normal(size=(500, 3))
+    x0 = rng.normal(size=3)
+
+    def run_step(step, output, u):
+        y = np.zeros_like(u)
+        for i, ui in enumerate(u):
+            step(ui)
+            y[i] = output
+        return y
+
+    def step_filt(u, x0):
+        output = np.array(x0)
+        return run_step(synapse.make_step(dt, output), output, u)
+
+    def step_filtfilt(u):
+        output = np.zeros(u.shape[1])
+        step = synapse.make_step(dt, output)
+        y = run_step(step, output, u)
+        return run_step(step, output, y[::-1])[::-1]
+
+    assert np.allclose(filt(u, synapse, dt=dt), step_filt(u, np.zeros(3)))
+    assert np.allclose(filt(u, synapse, dt=dt, x0=x0), step_filt(u, x0))
+    assert np.allclose(filt(u.T, synapse, dt=dt, axis=1),
+                       step_filt(u, np.zeros(3)).T)
+    assert np.allclose(filtfilt(u, synapse, dt=dt), step_filtfilt(u))
+
+
 def test_synapseparam():
     """SynapseParam must be a Synapse, and converts numbers to LowPass."""
     class Test(object):
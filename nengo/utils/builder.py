@@ -8,6 +8,7 @@ import collections
 import numpy as np
 
 import nengo
+from nengo.utils.numpy import is_sparse
 
 
 def full_transform(conn, slice_pre=True, slice_post=True, allow_scalars=True):
@@ -27,6 +28,8 @@ def full_transform(conn, slice_pre=True, slice_post=True, allow_scalars=True):
         If false, these scalars will be turned into scaled identity matrices.
     """
     transform = conn.transform
+    if is_sparse(transform):
+        transform = transform.toarray()
     pre_slice = (conn.pre_slice if slice_pre and conn.function is None else
                  slice(None))
     post_slice = conn.post_slice if slice_post else slice(None)
@@ -125,7 +128,8 @@ def generate_graphviz(objs, connections):
 
     def label(transform):
         # determine the label for a connection based on its transform
-        transform = np.asarray(transform)
+        if not is_sparse(transform):
+            transform = np.asarray(transform)
         if len(transform.shape) == 0:
             return ''
         return '%dx%d' % transform.shape
@@ -23,8 +23,9 @@ def target_function(eval_points, targets):
     -------
     dict:
        A dictionary with two keys: ``function`` and ``eval_points``.
-       function is the mapping between the evaluation points and the
-       targets. ``eval_points`` are the evaluation points that will
+       function is a `TargetFunction` mapping the evaluation points to the
+       targets; the builder passes the targets straight to the solver.
+       ``eval_points`` are the evaluation points that will
        be passed to the connection
 
     Examples
@@ -46,19 +47,37 @@ def target_function(eval_points, targets):
                          "is not equal to number of targets "
                          "%s" % (len(eval_points), len(targets)))
 
-    func_dict = {}
-    for eval_point, target in zip(eval_points, targets):
-        func_dict[tuple(eval_point)] = target
-
-    def function(x):
-        x = tuple(x)
-        return func_dict[x]
-
-    return {'function': function,
+    return {'function': TargetFunction(eval_points, targets),
             'eval_points': eval_points,
             'scale_eval_points': False}
 
 
+class TargetFunction(object):
+    """Maps each of a fixed set of evaluation points to its target.
+
+    When decoders are computed for exactly ``eval_points``, the builder
+    uses ``targets`` directly instead of calling the function per point.
+    The lookup table used when it is called is only built on the first call.
+    """
+
+    __name__ = 'target_function'
+
+    def __init__(self, eval_points, targets):
+        self.eval_points = eval_points
+        self.targets = targets
+        self._lookup = None
+
+    def __call__(self, x):
+        if self._lookup is None:
+            if np.array_equal(x, self.eval_points[0]):
+                # Connection finds the output size with the first point
+                return self.targets[0]
+            self._lookup = dict(
+                (tuple(eval_point), target)
+                for eval_point, target in zip(self.eval_points, self.targets))
+        return self._lookup[tuple(x)]
+
+
 def eval_point_decoding(conn, sim, eval_points=None):
     """Get the targets and actual decoded values for a set of eval points.
 
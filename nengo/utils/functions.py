@@ -2,7 +2,7 @@ from __future__ import absolute_import
 
 import numpy as np
 
-from nengo.utils.compat import is_number, OrderedDict, iteritems
+from nengo.utils.compat import is_number
 
 
 def piecewise(data):
@@ -42,7 +42,9 @@ def piecewise(data):
     -------
     function:
         A function that takes a variable t and returns the corresponding
-        value from the dictionary.
+        value from the dictionary. If t is an array of N times, the function
+        returns an (N, D) array with the value at each time, so it can be
+        used as the output of a ``vectorized`` Node.
 
     Examples
     --------
@@ -70,8 +72,32 @@ def piecewise(data):
 
     """
 
-    # first, sort the data (to simplify finding the right element
-    # when calling the function)
+    output_length = _piecewise_length(data)
+    times, values, is_callable, constants = _piecewise_arrays(
+        data, output_length)
+    segment = _piecewise_segment(times)
+
+    # build the function to return
+    def piecewise_function(t):
+        if np.ndim(t) > 0:
+            # evaluate an array of times at once
+            t = np.asarray(t)
+            idx = np.searchsorted(times, t, side='right') - 1
+            out = constants[idx]
+            for k in np.nonzero(is_callable[idx])[0]:
+                out[k] = np.asarray(values[idx[k]](t[k])).ravel()
+            return out
+
+        i = segment(t)
+        # if it's a function, call it
+        if is_callable[i]:
+            return np.asarray(values[i](t))
+        return values[i]
+    return piecewise_function
+
+
+def _piecewise_length(data):
+    """Validates piecewise ``data`` and returns the output dimensionality."""
     output_length = None  # the dimensionality of the returned values
     for time in data:
         if not is_number(time):
@@ -91,22 +117,36 @@ def piecewise(data):
                              'time %4g has %d items instead of %d' %
                              (time, length, output_length))
         output_length = length
+    return output_length
 
-    # make a default output of 0 when t before what was passed
-    data[np.finfo(float).min] = np.zeros(output_length)
-    ordered_data = OrderedDict(sorted(iteritems(data)))
 
-    # build the function to return
-    def piecewise_function(t, data=ordered_data):
-        # get the t we'll use for output
-        for time in (time for time in data if time <= t):
-            out_t = time
+def _piecewise_arrays(data, output_length):
+    """Returns the sorted breakpoints of piecewise ``data``, and their values.
 
-        # if it's a function, call it
-        if callable(data[out_t]):
-            return np.asarray(data[out_t](t))
-        return data[out_t]
-    return piecewise_function
+    A default output of 0 is added before the first breakpoint.
+    ``constants`` holds the values of constant segments as rows, with
+    zeros for segments given by functions.
+    """
+    times = sorted(data)
+    values = [np.zeros(output_length)] + [data[time] for time in times]
+    times = np.array([np.finfo(float).min] + times, dtype=float)
+    is_callable = np.array([callable(v) for v in values])
+    constants = np.array([np.zeros(output_length) if callable(v) else
+                          np.asarray(v, dtype=float).ravel() for v in values])
+    return times, values, is_callable, constants
+
+
+def _piecewise_segment(times):
+    """Returns a function finding the segment of ``times`` containing t."""
+    last = [0]  # index of the last segment used
+
+    def segment(t):
+        i = last[0]
+        # fast path for monotonically increasing t
+        if not (times[i] <= t and (i + 1 == len(times) or t < times[i + 1])):
+            i = last[0] = np.searchsorted(times, t, side='right') - 1
+        return i
+    return segment
 
 
 class HilbertCurve(object):
@@ -39,6 +39,18 @@ def array(x, dims=None, min_dims=0, readonly=False, **kwargs):
     return y
 
 
+def is_sparse(x):
+    """Whether ``x`` is a SciPy sparse matrix.
+
+    Returns False if SciPy is not installed, since ``x`` cannot be sparse.
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        return False
+    return scipy.sparse.issparse(x)
+
+
 def expm(A, n_factors=None, normalize=False):
     """Simple matrix exponential to replace Scipy's matrix exponential
 
@@ -0,0 +1,209 @@
+"""
+Random number generators used by the builder and by processes.
+"""
+from __future__ import absolute_import
+
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from nengo.rc import rc
+from nengo.utils.numpy import maxint
+
+_MASK = np.uint64(0xffffffff)
+_M = (np.uint64(0xD2511F53), np.uint64(0xCD9E8D57))
+_W = (0x9E3779B9, 0xBB67AE85)
+
+
+def philox4x32(counter, key, rounds=10):
+    """The Philox4x32 block function.
+
+    Parameters
+    ----------
+    counter : (4, n) array_like of uint32
+        The four 32-bit words of ``n`` counters, least significant first.
+    key : (2,) array_like of uint32
+        The two 32-bit words of the key.
+
+    Returns
+    -------
+    (n, 4) array of uint32
+        Four random 32-bit words for each counter.
+    """
+    c0, c1, c2, c3 = [np.asarray(c, dtype=np.uint64) for c in counter]
+    k0, k1 = int(key[0]), int(key[1])
+    for r in range(rounds):
+        if r > 0:
+            k0 = (k0 + _W[0]) & 0xffffffff
+            k1 = (k1 + _W[1]) & 0xffffffff
+        p0 = c0 * _M[0]
+        p1 = c2 * _M[1]
+        c0, c1, c2, c3 = (
+            (p1 >> np.uint64(32)) ^ c1 ^ np.uint64(k0), p1 & _MASK,
+            (p0 >> np.uint64(32)) ^ c3 ^ np.uint64(k1), p0 & _MASK)
+    return np.array([c0, c1, c2, c3], dtype=np.uint32).T
+
+
+class Philox(object):
+    """Counter-based random number generator using Philox4x32-10.
+
+    Each block of four 32-bit outputs is a pure function of the key, the
+    stream, and the block index, so creating a generator costs nothing and
+    any part of the stream can be generated independently (and in
+    parallel). Different streams with the same seed are independent, which
+    makes it easy to key random numbers by object seed and step.
+
+    Implements the subset of the `numpy.random.RandomState` interface used
+    by distributions and processes. Each value is drawn from a fixed number
+    of 32-bit words, so drawing ``n`` values and then ``m`` values gives the
+    same result as drawing ``n + m`` values at once.
+
+    Parameters
+    ----------
+    seed : int, optional
+        A non-negative integer below 2**64 used as the key.
+        If None, a seed is drawn from `numpy.random`.
+    stream : int, optional
+        A non-negative integer below 2**64 identifying the stream.
+    """
+
+    parallel_blocks = 65536  # only use threads for larger requests
+
+    def __init__(self, seed=None, stream=0):
+        if seed is None:
+            seed = np.random.randint(maxint)
+        if not 0 <= seed < 2**64 or not 0 <= stream < 2**64:
+            raise ValueError("seed and stream must be in [0, 2**64)")
+        self.seed = int(seed)
+        self.stream = int(stream)
+        self.position = 0  # number of 32-bit words used
+
+    @property
+    def key(self):
+        return (self.seed & 0xffffffff, self.seed >> 32)
+
+    def _blocks(self, start, stop):
+        blocks = np.arange(start, stop, dtype=np.uint64)
+        counter = (blocks & _MASK, blocks >> np.uint64(32),
+                   np.uint64(self.stream & 0xffffffff),
+                   np.uint64(self.stream >> 32))
+        counter = np.broadcast_arrays(*counter)
+        return philox4x32(counter, self.key).ravel()
+
+    def random_raw(self, n):
+        """Return the next ``n`` 32-bit words of the stream."""
+        start, stop = self.position, self.position + n
+        b0, b1 = start // 4, -(-stop // 4)
+
+        n_threads = (rc.getint('builder', 'threads')
+                     if b1 - b0 > self.parallel_blocks else 1)
+        if n_threads > 1:
+            edges = np.linspace(b0, b1, n_threads + 1).astype(np.int64)
+            pool = ThreadPool(n_threads)
+            try:
+                words = np.concatenate(pool.map(
+                    lambda i: self._blocks(edges[i], edges[i + 1]),
+                    range(n_threads)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            words = self._blocks(b0, b1)
+
+        self.position = stop
+        return words[start - 4 * b0:stop - 4 * b0]
+
+    def _shaped(self, x, size):
+        return x[0] if size is None else x.reshape(size)
+
+    def _uniform53(self, n):
+        # 53-bit doubles from two words, as in RandomState.random_sample
+        w = self.random_raw(2 * n).reshape(n, 2)
+        a = (w[:, 0] >> np.uint32(5)).astype(np.float64)
+        b = (w[:, 1] >> np.uint32(6)).astype(np.float64)
+        return (a * 67108864. + b) / 9007199254740992.
+
+    def random_sample(self, size=None):
+        n = 1 if size is None else int(np.prod(size))
+        return self._shaped(self._uniform53(n), size)
+
+    def rand(self, *args):
+        return self.random_sample(size=args if len(args) > 0 else None)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + (high - low) * self.random_sample(size=size)
+
+    def standard_normal(self, size=None):
+        # Box-Muller with a single output per pair, so that each value
+        # always uses four words
+        n = 1 if size is None else int(np.prod(size))
+        u = self._uniform53(2 * n).reshape(n, 2)
+        x = np.sqrt(-2 * np.log1p(-u[:, 0])) * np.cos(2 * np.pi * u[:, 1])
+        return self._shaped(x, size)
+
+    def randn(self, *args):
+        return self.standard_normal(size=args if len(args) > 0 else None)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return loc + scale * self.standard_normal(size=size)
+
+    def randint(self, low, high=None, size=None):
+        if high is None:
+            low, high = 0, low
+        if high <= low:
+            raise ValueError("low >= high")
+        x = low + np.floor(
+            (high - low) * self.random_sample(size=size)).astype(np.int64)
+        return int(x) if size is None else x
+
+    def beta(self, a, b, size=None):
+        # no counter-based implementation; draw from a seeded RandomState
+        rng = np.random.RandomState(self.randint(maxint))
+        return rng.beta(a, b, size=size)
+
+    def get_state(self):
+        """Return the state in the same format as `RandomState.get_state`."""
+        state = np.array(self.key + (self.stream & 0xffffffff,
+                                     self.stream >> 32), dtype=np.uint32)
+        return ('Philox4x32', state, self.position, 0, 0.0)
+
+    def set_state(self, state):
+        """Set the state from the result of `get_state`."""
+        words = [int(w) for w in state[1]]
+        self.seed = words[0] | (words[1] << 32)
+        self.stream = words[2] | (words[3] << 32)
+        self.position = int(state[2])
+
+
+def make_rng(seed=None, stream=None, kind=None):
+    """Create a random number generator for ``seed``.
+
+    Parameters
+    ----------
+    seed : int, optional
+        The seed of the generator.
+    stream : int, optional
+        Selects one of many independent generators with the same seed.
+    kind : {'mt19937', 'philox'}, optional
+        The type of generator. Defaults to the ``rng`` setting in the
+        ``[builder]`` RC section.
+    """
+    if kind is None:
+        kind = rc.get('builder', 'rng')
+    kind = kind.lower()
+    if kind == 'philox':
+        return Philox(seed, stream=0 if stream is None else stream)
+    elif kind == 'mt19937':
+        return np.random.RandomState(seed if stream is None else
+                                     [seed, stream])
+    raise ValueError("Unrecognized random number generator '%s'" % kind)
+
+
+def rng_kind(rng):
+    """Return the ``kind`` of generator to pass to `make_rng`."""
+    return 'philox' if isinstance(rng, Philox) else 'mt19937'
+
+
+def spawn_rng(rng):
+    """Create a new generator of the same kind, seeded from ``rng``."""
+    return make_rng(rng.randint(maxint), kind=rng_kind(rng))
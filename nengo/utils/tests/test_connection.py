@@ -46,6 +46,27 @@ def test_target_function(Simulator, nl_nodirect, plt, dimensions, radius,
     assert np.allclose(sim.data[probe1], sim.data[probe2], atol=0.2 * radius)
 
 
+def test_target_function_targets(Simulator, seed, rng):
+    """The builder uses the given targets without calling the function"""
+    eval_points = UniformHypersphere().sample(500, 2, rng=rng)
+    targets = eval_points[:, :1] * eval_points[:, 1:]
+
+    with nengo.Network(seed=seed) as model:
+        a = nengo.Ensemble(100, 2)
+        b = nengo.Node(size_in=1)
+        c = nengo.Connection(a, b, **target_function(eval_points, targets))
+
+    sim = Simulator(model)
+    assert c.function._lookup is None  # never called per point
+    assert np.allclose(sim.data[c].eval_points, eval_points)
+    _, c_targets, decoded = eval_point_decoding(c, sim)
+    assert c_targets is c.function.targets
+    assert rms(decoded - targets) < 0.05
+
+    # other points are still looked up one at a time
+    assert np.allclose(c.function(eval_points[3]), targets[3])
+
+
 def test_eval_point_decoding(Simulator, nl_nodirect, plt, seed):
     with nengo.Network(seed=seed) as model:
         model.config[nengo.Ensemble].neuron_type = nl_nodirect()
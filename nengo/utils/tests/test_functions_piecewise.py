@@ -71,3 +71,25 @@ def test_function_list():
     assert np.allclose(f(0.5), func2(0.5))
     assert np.allclose(f(0.75), func2(0.75))
     assert np.allclose(f(1.0), func2(1.0))
+
+
+def test_many_breakpoints(rng):
+    times = np.sort(rng.uniform(0, 10, size=1000))
+    values = rng.uniform(-1, 1, size=1000)
+    f = piecewise(dict(zip(times, values)))
+
+    def expected(t):
+        before = times <= t
+        return values[before][-1] if before.any() else 0
+
+    # increasing, then random times
+    for t in np.hstack([np.linspace(-1, 11, 500), rng.uniform(-1, 11, 500)]):
+        assert np.allclose(f(t), [expected(t)])
+
+
+def test_array_times():
+    f = piecewise({0.5: [1, 0], 1.0: lambda t: [t, t ** 2], 1.5: [0, 1]})
+    t = np.array([0.75, -1, 1.25, 0.5, 2, 1.0, 0])
+    y = f(t)
+    assert y.shape == (len(t), 2)
+    assert np.allclose(y, [f(ti) for ti in t])
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+
+import numpy as np
+import pytest
+
+import nengo
+from nengo.dists import Choice, Gaussian, UniformHypersphere
+from nengo.rc import rc
+from nengo.utils.rng import Philox, make_rng, philox4x32
+
+
+def test_philox4x32():
+    """Known-answer tests from the Random123 library"""
+    def check(counter, key, expected):
+        counter = np.array(counter, dtype=np.uint64).reshape(4, 1)
+        assert np.all(philox4x32(counter, key)[0] == expected)
+
+    check([0, 0, 0, 0], [0, 0],
+          [0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8])
+    check([0xffffffff] * 4, [0xffffffff] * 2,
+          [0x408f276d, 0x41c83b0e, 0xa20bc7c6, 0x6d5451fd])
+    check([0x243f6a88, 0x85a308d3, 0x13198a2e, 0x03707344],
+          [0xa4093822, 0x299f31d0],
+          [0xd16cfe09, 0x94fdcceb, 0x5001e420, 0x24126ea1])
+
+
+def test_philox_stream():
+    rng = Philox(3)
+    x = np.concatenate([rng.randn(3), rng.randn(2, 2).ravel(), [rng.randn()]])
+    assert np.array_equal(x, Philox(3).randn(8))
+
+    # streams and seeds are independent
+    assert not np.allclose(Philox(3, stream=1).randn(8), x)
+    assert not np.allclose(Philox(4).randn(8), x)
+
+    # any position can be generated without generating the ones before it
+    rng = Philox(3)
+    rng.position = 4 * 5
+    assert np.array_equal(rng.randn(3), x[5:])
+
+    # the state can be saved and restored, as with RandomState
+    state = rng.get_state()
+    y = rng.randn(4)
+    other = Philox(5, stream=2)
+    other.set_state(state)
+    assert np.array_equal(other.randn(4), y)
+
+
+def test_philox_threads():
+    rng = Philox(5)
+    x = rng.random_raw(4 * Philox.parallel_blocks + 6)
+
+    threads = rc.get('builder', 'threads')
+    try:
+        rc.set('builder', 'threads', '3')
+        rng = Philox(5)
+        assert np.array_equal(rng.random_raw(3), x[:3])
+        assert np.array_equal(rng.random_raw(len(x) - 3), x[3:])
+    finally:
+        rc.set('builder', 'threads', threads)
+
+
+@pytest.mark.parametrize('dist', [Gaussian(mean=1, std=2),
+                                  UniformHypersphere(surface=True),
+                                  Choice([[1, 2], [3, 4]])])
+def test_philox_dists(dist):
+    n, d = 10000, 2
+    a = dist.sample(n, d, rng=np.random.RandomState(1))
+    b = dist.sample(n, d, rng=Philox(1))
+    assert a.shape == b.shape
+    assert np.allclose(a.mean(axis=0), b.mean(axis=0), atol=0.1)
+    assert np.allclose(a.std(axis=0), b.std(axis=0), atol=0.1)
+
+
+def test_make_rng(Simulator, seed):
+    assert isinstance(make_rng(1, kind='mt19937'), np.random.RandomState)
+    assert isinstance(make_rng(1, kind='philox'), Philox)
+    with pytest.raises(ValueError):
+        make_rng(1, kind='xorshift')
+
+    with nengo.Network(seed=seed) as model:
+        u = nengo.Node(nengo.processes.WhiteNoise())
+        a = nengo.Ensemble(20, 1)
+        nengo.Connection(u, a)
+        p = nengo.Probe(a, synapse=0.01)
+
+    kind = rc.get('builder', 'rng')
+    try:
+        rc.set('builder', 'rng', 'philox')
+        sim1 = Simulator(model, seed=seed)
+        sim2 = Simulator(model, seed=seed)
+    finally:
+        rc.set('builder', 'rng', kind)
+    assert isinstance(sim1.rng, Philox)
+
+    sim1.run(0.05)
+    sim2.run(0.05)
+    assert np.array_equal(sim1.data[p], sim2.data[p])